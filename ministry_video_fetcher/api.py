@@ -327,21 +327,7 @@ def update_video(video_id: str, video_data: VideoUpdate):
     if not update_dict:
         return {"success": True, "message": "No changes provided", "video_id": video_id}
 
-    # Perform the update directly in database
-    conn = db._get_connection()
-    cursor = conn.cursor()
-
-    set_clause = ", ".join([f"{k} = ?" for k in update_dict.keys()])
-    cursor.execute(
-        f"UPDATE videos SET {set_clause} WHERE video_id = ?",
-        list(update_dict.values()) + [video_id]
-    )
-
-    conn.commit()
-    affected = cursor.rowcount
-    conn.close()
-
-    if affected > 0:
+    if db.update_video_fields(video_id, update_dict):
         return {
             "success": True,
             "message": "Video updated successfully",
@@ -360,15 +346,7 @@ def delete_video(video_id: str):
     if not existing:
         raise HTTPException(status_code=404, detail=f"Video with ID {video_id} not found")
 
-    # Delete from database
-    conn = db._get_connection()
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM videos WHERE video_id = ?", (video_id,))
-    conn.commit()
-    affected = cursor.rowcount
-    conn.close()
-
-    if affected > 0:
+    if db.delete_video(video_id):
         return {"success": True, "message": "Video deleted successfully", "video_id": video_id}
     else:
         raise HTTPException(status_code=400, detail="Failed to delete video")
@@ -402,7 +380,7 @@ def get_video_by_id(video_id: str):
 @app.get("/api/videos/by-year")
 def get_videos_by_year():
     """Get videos grouped by year."""
-    df = db.get_all_sermons()
+    df = db.get_all_sermons(columns=("video_id", "upload_date", "duration"))
 
     if df.empty:
         return {"years": []}
@@ -431,7 +409,7 @@ def get_videos_by_year():
 @app.get("/api/videos/by-month")
 def get_videos_by_month(year: int = None):
     """Get videos grouped by month."""
-    df = db.get_all_sermons()
+    df = db.get_all_sermons(columns=("video_id", "upload_date", "duration"))
 
     if df.empty:
         return {"months": []}
@@ -1209,14 +1187,14 @@ def get_face_recognition_status():
     try:
         recognizer = get_recognizer()
 
-        # Check if using DeepFace or OpenCV fallback
+        # Check if using DeepFace/InsightFace or OpenCV fallback
         try:
             from face_recognition import DEEPFACE_AVAILABLE
-            using_fallback = not DEEPFACE_AVAILABLE
+            using_fallback = not DEEPFACE_AVAILABLE and not recognizer.uses_insightface
         except ImportError:
             using_fallback = True
 
-        model_name = recognizer.config.get("model_name")
+        model_name = recognizer.model_used
         if using_fallback:
             model_name = "OpenCV Haar Cascade (Detection Only)"
 
@@ -7,26 +7,43 @@ title, description, duration analysis, and face recognition.
 Supports preacher-specific classification with dynamic identity markers.
 """
 
+import hashlib
+import mmap
 import os
+import pickle
 import re
-from typing import Tuple, Optional, Dict, List
+import sys
+from bisect import bisect_right
+from typing import Tuple, Optional, Dict, List, Set, NamedTuple
 
 from models import VideoMetadata, ContentType, Language, Preacher
 from config import (
-    PREACHING_KEYWORDS_EN,
-    PREACHING_KEYWORDS_FR,
-    MUSIC_KEYWORDS,
-    STRONG_MUSIC_INDICATORS,
-    FRENCH_INDICATORS,
-    ENGLISH_INDICATORS,
+    PREACHING_KEYWORDS_SET,
+    MUSIC_KEYWORDS_SET,
+    STRONG_MUSIC_INDICATORS_SET,
+    FRENCH_INDICATORS_SET,
+    ENGLISH_INDICATORS_SET,
     CLASSIFICATION_CONFIG,
+    DURATION_BAND_EDGES,
+    DURATION_BAND_LABELS,
+    DURATION_BAND_SCORES,
+    KEYWORD_CATEGORIES,
     FACE_RECOGNITION_CONFIG,
-    STRICT_CHANNELS,
-    TRUSTED_CHANNELS,
+    STRICT_CHANNELS_SET,
+    TRUSTED_CHANNELS_SET,
+    IDENTITY,
     IDENTITY_MARKERS,
-    CHANNEL_TRUST_LEVELS,
+    IdentityMatcher,
+    CHANNEL_TO_LEVEL,
     FACE_VERIFICATION_REQUIREMENTS,
     STORAGE_CONFIG,
+    SERIES_MARKER_RE,
+    KEYWORD_TO_CATEGORIES,
+    ACCENT_TRANS,
+    iter_bits,
+    keyword_alternation,
+    normalize_channel,
+    normalize_text,
     generate_identity_markers,
     get_photos_directory,
 )
@@ -44,6 +61,303 @@ except ImportError:
     FACE_RECOGNITION_AVAILABLE = False
     print("Warning: Face recognition module not available.")
 
+# Optional Aho-Corasick automaton for single-pass keyword scanning
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Keywords that count double towards the preaching score
+STRONG_PREACHING_KEYWORDS = frozenset(["sermon", "preaching", "predication", "enseignement"])
+
+
+# =============================================================================
+# KEYWORD SCANNING
+# =============================================================================
+
+def _build_automaton(keyword_to_categories: Dict[str, int]):
+    """Compile the keyword -> category bitmask table into an Aho-Corasick automaton."""
+    automaton = ahocorasick.Automaton()
+    for kw, mask in keyword_to_categories.items():
+        automaton.add_word(kw, (kw, mask))
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_category_gates(
+    keyword_to_categories: Dict[str, int]
+) -> List[Tuple["re.Pattern[str]", Tuple[str, ...]]]:
+    """
+    Per-category (alternation regex, keywords) for the fallback scan.
+
+    Each keyword is filed under its lowest category only, so keywords shared
+    between lists are checked once.
+    """
+    by_category: Dict[int, List[str]] = {}
+    for kw, mask in keyword_to_categories.items():
+        by_category.setdefault(next(iter_bits(mask)), []).append(kw)
+    return [
+        (keyword_alternation(keywords), tuple(keywords))
+        for _, keywords in sorted(by_category.items())
+    ]
+
+
+def _load_automaton():
+    """
+    Return the keyword automaton, reusing a pickled copy when configured.
+
+    Set CLASSIFIER_TABLES_PATH to a file path to have worker processes
+    mmap-load the automaton instead of rebuilding it on import. The file
+    is tagged with a hash of the keyword table and rebuilt when it changes.
+    """
+    path = os.environ.get("CLASSIFIER_TABLES_PATH")
+    if not path:
+        return _build_automaton(KEYWORD_TO_CATEGORIES)
+
+    table_hash = hashlib.sha256(
+        repr(sorted(KEYWORD_TO_CATEGORIES.items())).encode("utf-8")
+    ).hexdigest()
+
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            cached_hash, automaton = pickle.loads(buf)
+        if cached_hash == table_hash:
+            return automaton
+    except (OSError, ValueError, pickle.UnpicklingError, EOFError):
+        pass
+
+    automaton = _build_automaton(KEYWORD_TO_CATEGORIES)
+
+    try:
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump((table_hash, automaton), f, protocol=5)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Warning: Could not write classifier tables to {path}: {e}")
+
+    return automaton
+
+
+if AHOCORASICK_AVAILABLE:
+    AUTOMATON = _load_automaton()
+    CATEGORY_GATES = []
+else:
+    AUTOMATON = None
+    CATEGORY_GATES = _build_category_gates(KEYWORD_TO_CATEGORIES)
+
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def _tokenize(text: str) -> Set[str]:
+    """Split normalized text into a set of interned word tokens."""
+    return {sys.intern(word) for word in _WORD_RE.findall(text)}
+
+# Substrings that decide the language when indicator counts are too close
+_FRENCH_TIEBREAKERS = ("predication", "culte", "enseignement", "priere")
+_ENGLISH_TIEBREAKERS = ("preaching", "sermon", "service", "teaching")
+
+
+def _detect_normalized_language(text: str) -> Language:
+    """detect_language for text that has already been normalized."""
+    words = _tokenize(text)
+    return _language_from_scores(
+        text,
+        len(words & FRENCH_INDICATORS_SET),
+        len(words & ENGLISH_INDICATORS_SET),
+    )
+
+
+def _language_from_scores(text: str, french_count: int, english_count: int) -> Language:
+    """Pick the language from indicator counts, using tie-breaker words if close."""
+    # Need clear majority
+    if french_count > english_count + 2:
+        return Language.FRENCH
+    elif english_count > french_count + 2:
+        return Language.ENGLISH
+
+    # Check for specific strong indicators
+    if any(w in text for w in _FRENCH_TIEBREAKERS):
+        return Language.FRENCH
+    if any(w in text for w in _ENGLISH_TIEBREAKERS):
+        return Language.ENGLISH
+
+    return Language.UNKNOWN
+
+
+def detect_language(text: str) -> Language:
+    """
+    Detect whether text is primarily French or English.
+
+    Tokenizes the text once and scores each language by the size of the
+    intersection between its tokens and the indicator sets.
+
+    Args:
+        text: Title and/or description text
+
+    Returns:
+        Language enum (FR, EN, or UNKNOWN)
+    """
+    return _detect_normalized_language(normalize_text(text))
+
+
+class MatchResult(NamedTuple):
+    """Everything the classifier reads from a video's text, gathered in one scan."""
+    required_hit: bool       # Preacher's name (or alias) found
+    acceptable_hit: bool     # Title + name combination found
+    church_hit: bool         # Church name found
+    strong_music_hit: bool   # Any strong music indicator found
+    fr_score: int            # French indicator words
+    en_score: int            # English indicator words
+    preaching_score: int     # Weighted preaching keyword count (incl. series markers)
+    music_score: int         # Music keyword count
+
+
+def find_keywords(text: str) -> Set[str]:
+    """
+    Find the distinct keywords occurring anywhere in text.
+
+    Uses the Aho-Corasick automaton (one pass over the text) when
+    pyahocorasick is installed. Otherwise each category's compiled
+    alternation is searched first, and only categories that hit fall back
+    to per-keyword substring checks.
+
+    Args:
+        text: Normalized text to scan (see config.normalize_text)
+
+    Returns:
+        Set of matched keywords
+    """
+    if AUTOMATON is not None:
+        return {kw for _, (kw, _) in AUTOMATON.iter(text)}
+
+    found: Set[str] = set()
+    for gate, keywords in CATEGORY_GATES:
+        if gate.search(text):
+            found.update(kw for kw in keywords if kw in text)
+    return found
+
+
+# Trust table ordered verified -> known for the partial-match fallback
+_CHANNELS_BY_LEVEL = sorted(CHANNEL_TO_LEVEL.items(), key=lambda item: -item[1])
+
+
+def _channel_in(channel_name: Optional[str], channels: frozenset) -> bool:
+    """Check a channel against a normalized channel set (exact, then partial match)."""
+    if not channel_name:
+        return False
+    channel = normalize_channel(channel_name)
+    if not channel:
+        return False
+    if channel in channels:
+        return True
+    return any(ch in channel or channel in ch for ch in channels)
+
+
+def _searchable_text(title: Optional[str], description: Optional[str]) -> str:
+    """Combine title and description into normalized text for keyword matching."""
+    parts = []
+    if title:
+        parts.append(title)
+    if description:
+        parts.append(description)
+    return normalize_text(" ".join(parts))
+
+
+def score_video(
+    preaching_score: int,
+    music_score: int,
+    duration_score: float,
+    face_verified: bool,
+    has_identity: bool,
+    identity_boost: float,
+    channel_trust_level: int,
+    strict_mode: bool,
+) -> Tuple[ContentType, float]:
+    """
+    Score one video's signals into a content type and confidence.
+
+    See ContentClassifier._calculate_classification for the signal weights.
+
+    Returns:
+        Tuple of (ContentType, confidence_score)
+    """
+    # Face verification is the strongest signal
+    if face_verified:
+        return ContentType.PREACHING, 0.98
+
+    # --- Count positive signals ---
+    signals = 0.0
+
+    if has_identity:
+        signals += 2.0  # Strong signal
+
+    if preaching_score >= 3:
+        signals += 1.0  # Moderate signal
+
+    if channel_trust_level >= 2:  # Trusted or verified channel
+        signals += 1.0  # Moderate signal
+
+    if duration_score >= 0.15:
+        signals += 0.5  # Weak signal
+
+    # Strong music indicators - classify as MUSIC
+    if music_score >= 2 and preaching_score == 0:
+        return ContentType.MUSIC, min(0.9, 0.6 + abs(duration_score) * 0.2)
+
+    # --- STRICT MODE: Require identity markers ---
+    if strict_mode:
+        if not has_identity and channel_trust_level < 2:
+            # No identity markers and not a trusted channel = UNKNOWN
+            return ContentType.UNKNOWN, 0.25
+
+    # --- Multi-signal requirement: Need at least 2 signals for PREACHING ---
+    if signals < 2:
+        confidence = max(0.30, 0.25 + signals * 0.1)
+        return ContentType.UNKNOWN, confidence
+
+    # Strong preaching indicators with identity
+    if preaching_score >= 3 and music_score == 0 and has_identity:
+        confidence = min(0.95, 0.75 + identity_boost + duration_score * 0.1)
+        return ContentType.PREACHING, confidence
+
+    # Identity + keywords + duration
+    if has_identity and preaching_score > music_score:
+        confidence = 0.60 + identity_boost + (preaching_score - music_score) * 0.05
+        confidence += duration_score * 0.1
+        return ContentType.PREACHING, min(0.90, max(0.55, confidence))
+
+    # Trusted channel with keywords
+    if channel_trust_level >= 2 and preaching_score > music_score:
+        confidence = 0.55 + (preaching_score - music_score) * 0.08
+        confidence += duration_score * 0.1
+        return ContentType.PREACHING, min(0.85, max(0.50, confidence))
+
+    # Music wins by margin
+    if music_score > preaching_score + 1:
+        confidence = 0.5 + (music_score - preaching_score) * 0.1
+        return ContentType.MUSIC, min(0.85, max(0.4, confidence))
+
+    # Preaching wins by margin but no identity
+    if preaching_score > music_score + 1:
+        # Lower confidence without identity
+        confidence = 0.40 + (preaching_score - music_score) * 0.05
+        return ContentType.UNKNOWN, min(0.55, confidence)
+
+    # Short video penalty
+    if duration_score <= -0.3:
+        return ContentType.MUSIC, 0.5 + abs(duration_score) * 0.15
+
+    # Truly uncertain
+    if preaching_score > music_score:
+        return ContentType.UNKNOWN, 0.40
+    elif music_score > preaching_score:
+        return ContentType.MUSIC, 0.45
+    else:
+        return ContentType.UNKNOWN, 0.30
+
 
 class ContentClassifier:
     """
@@ -73,12 +387,10 @@ class ContentClassifier:
         self.preacher_id = preacher_id
         self.preacher = preacher
 
-        # --- Keyword setup ---
-        self.preaching_keywords = set(kw.lower() for kw in PREACHING_KEYWORDS_EN + PREACHING_KEYWORDS_FR)
-        self.music_keywords = set(kw.lower() for kw in MUSIC_KEYWORDS)
-        self.strong_music = set(kw.lower() for kw in STRONG_MUSIC_INDICATORS)
-        self.french_words = set(w.lower() for w in FRENCH_INDICATORS)
-        self.english_words = set(w.lower() for w in ENGLISH_INDICATORS)
+        # --- Keyword setup (shared frozensets built once in config) ---
+        self.preaching_keywords = PREACHING_KEYWORDS_SET
+        self.music_keywords = MUSIC_KEYWORDS_SET
+        self.strong_music = STRONG_MUSIC_INDICATORS_SET
         self.config = CLASSIFICATION_CONFIG
 
         # --- Dynamic Identity Markers ---
@@ -103,11 +415,18 @@ class ContentClassifier:
             # Use legacy hardcoded identity markers
             self.identity_markers = IDENTITY_MARKERS
 
+        # Compile this preacher's markers once; matched against normalized text.
+        # The default markers are already compiled as config.IDENTITY.
+        if self.identity_markers is IDENTITY_MARKERS:
+            self.identity = IDENTITY
+        else:
+            self.identity = IdentityMatcher.from_markers(self.identity_markers)
+
         # --- Face Recognition setup ---
         self.use_frame_extraction = use_frame_extraction
         self.face_recognizer = None
-        self.strict_channels = set(ch.lower() for ch in STRICT_CHANNELS)
-        self.trusted_channels = set(ch.lower() for ch in TRUSTED_CHANNELS)
+        self.strict_channels = STRICT_CHANNELS_SET
+        self.trusted_channels = TRUSTED_CHANNELS_SET
 
         if FACE_RECOGNITION_AVAILABLE:
             try:
@@ -130,28 +449,47 @@ class ContentClassifier:
 
     def _is_strict_channel(self, channel_name: str) -> bool:
         """Check if the video is from a strict channel requiring face verification."""
-        if not channel_name:
-            return False
-        channel_lower = channel_name.lower()
-        return any(strict in channel_lower or channel_lower in strict
-                   for strict in self.strict_channels)
+        return _channel_in(channel_name, self.strict_channels)
 
     def _is_trusted_channel(self, channel_name: str) -> bool:
         """Check if the video is from a trusted channel (skip face verification)."""
-        if not channel_name:
-            return False
-        channel_lower = channel_name.lower()
-        return any(trusted in channel_lower or channel_lower in trusted
-                   for trusted in self.trusted_channels)
+        return _channel_in(channel_name, self.trusted_channels)
 
-    def _check_identity_markers(self, text: str) -> Tuple[bool, float, bool]:
+    def _match_text(self, text: str) -> MatchResult:
+        """
+        Scan normalized video text once and collect every text signal.
+
+        Args:
+            text: Normalized title and description text
+
+        Returns:
+            MatchResult with identity, keyword, series and language hits
+        """
+        matched = find_keywords(text)
+        words = _tokenize(text)
+        identity = self.identity
+
+        return MatchResult(
+            required_hit=identity.required(text),
+            acceptable_hit=identity.acceptable(text),
+            church_hit=identity.church(text),
+            strong_music_hit=self._has_strong_music_indicators(matched),
+            fr_score=len(words & FRENCH_INDICATORS_SET),
+            en_score=len(words & ENGLISH_INDICATORS_SET),
+            preaching_score=(
+                self._count_preaching_keywords(matched) + self._count_series_markers(text)
+            ),
+            music_score=self._count_music_keywords(matched),
+        )
+
+    def _check_identity_markers(self, match: MatchResult) -> Tuple[bool, float, bool]:
         """
         Check if video contains identity markers (preacher's name or church).
 
         Uses dynamic identity markers based on the configured preacher.
 
         Args:
-            text: Combined title and description text (lowercase)
+            match: MatchResult for the video's title and description
 
         Returns:
             Tuple of (has_identity, boost_score, has_name)
@@ -159,28 +497,25 @@ class ContentClassifier:
             - boost_score: 0.0-0.30 based on match strength
             - has_name: True ONLY if preacher's actual name found (not just church)
         """
-        require_name = self.identity_markers.get("require_name_not_just_church", True)
+        require_name = self.identity.require_name_not_just_church
 
         # Check for required names (strongest match)
-        for name in self.identity_markers.get("required_names", []):
-            if name in text:
-                return True, 0.30, True  # has_identity, boost, has_name
+        if match.required_hit:
+            return True, 0.30, True  # has_identity, boost, has_name
 
         # Check acceptable names (good match)
-        for name in self.identity_markers.get("acceptable_names", []):
-            if name in text:
-                return True, 0.25, True  # has_identity, boost, has_name
+        if match.acceptable_hit:
+            return True, 0.25, True  # has_identity, boost, has_name
 
         # Check church names - NO LONGER counts as identity if require_name is True
-        for church in self.identity_markers.get("church_names", []):
-            if church in text:
-                if require_name:
-                    # Church name found but NOT the preacher's name
-                    # Return small boost but has_identity=False, has_name=False
-                    return False, 0.10, False
-                else:
-                    # Legacy behavior: church name counts as identity
-                    return True, 0.15, False
+        if match.church_hit:
+            if require_name:
+                # Church name found but NOT the preacher's name
+                # Return small boost but has_identity=False, has_name=False
+                return False, 0.10, False
+            else:
+                # Legacy behavior: church name counts as identity
+                return True, 0.15, False
 
         return False, 0.0, False
 
@@ -197,22 +532,19 @@ class ContentClassifier:
         if not channel_name:
             return 0
 
-        channel_lower = channel_name.lower()
-
-        # Check verified channels (level 3)
-        for ch in CHANNEL_TRUST_LEVELS.get("verified", []):
-            if ch.lower() in channel_lower or channel_lower in ch.lower():
-                return 3
+        channel = normalize_channel(channel_name)
+        if not channel:
+            return 0
 
-        # Check trusted channels (level 2)
-        for ch in CHANNEL_TRUST_LEVELS.get("trusted", []):
-            if ch.lower() in channel_lower or channel_lower in ch.lower():
-                return 2
+        # Exact channel name/handle: single dict lookup
+        level = CHANNEL_TO_LEVEL.get(channel)
+        if level is not None:
+            return level
 
-        # Check known channels (level 1)
-        for ch in CHANNEL_TRUST_LEVELS.get("known", []):
-            if ch.lower() in channel_lower or channel_lower in ch.lower():
-                return 1
+        # Partial match (e.g. "<channel> Live"), highest level wins
+        for ch, level in _CHANNELS_BY_LEVEL:
+            if ch in channel or channel in ch:
+                return level
 
         return 0
 
@@ -239,7 +571,7 @@ class ContentClassifier:
             # Use frame extraction for strict channels or if enabled
             use_frames = self.use_frame_extraction and (
                 self._is_strict_channel(video.channel_name) or
-                FACE_RECOGNITION_CONFIG.get("enable_frame_extraction", True)
+                FACE_RECOGNITION_CONFIG.enable_frame_extraction
             )
 
             result = self.face_recognizer.verify_face(
@@ -279,13 +611,13 @@ class ContentClassifier:
         if self.preacher_id and not video.preacher_id:
             video.preacher_id = self.preacher_id
 
-        # Get text to analyze
-        text = self._get_searchable_text(video)
+        # Scan title and description once for every text signal
+        match, language = self._analyze_text(video.title, video.description)
 
         # --- Check identity markers ---
         # Returns (has_identity, boost, has_name)
         # has_name = True ONLY if preacher's actual name found (not just church)
-        has_identity, identity_boost, has_name = self._check_identity_markers(text)
+        has_identity, identity_boost, has_name = self._check_identity_markers(match)
         video.identity_matched = has_name  # Only True if preacher's name found
 
         # --- NEW: Get channel trust level ---
@@ -297,7 +629,7 @@ class ContentClassifier:
         video.face_verified = face_verified
 
         # Check if face meets minimum confidence threshold
-        face_meets_threshold = face_confidence >= FACE_VERIFICATION_REQUIREMENTS.get("min_confidence", 0.70)
+        face_meets_threshold = face_confidence >= FACE_VERIFICATION_REQUIREMENTS.min_confidence
         if face_verified and not face_meets_threshold:
             # Face detection returned verified but with low confidence (OpenCV fallback)
             face_verified = False
@@ -308,20 +640,20 @@ class ContentClassifier:
             video.content_type = ContentType.PREACHING
             video.confidence_score = 0.95
             video.needs_review = False
-            video.language_detected = self._detect_language(text)
+            video.language_detected = language
             return video
 
         # Check for strong music indicators first
-        if self._has_strong_music_indicators(text) and not face_verified:
+        if match.strong_music_hit and not face_verified:
             video.content_type = ContentType.MUSIC
             video.confidence_score = 0.95
             video.needs_review = False
-            video.language_detected = self._detect_language(text)
+            video.language_detected = language
             return video
 
-        # Count keyword matches
-        preaching_score = self._count_preaching_keywords(text)
-        music_score = self._count_music_keywords(text)
+        # Keyword match counts
+        preaching_score = match.preaching_score
+        music_score = match.music_score
 
         # Get duration-based score
         duration_score = self._get_duration_score(video.duration)
@@ -337,19 +669,19 @@ class ContentClassifier:
                 video.content_type = ContentType.UNKNOWN
                 video.confidence_score = 0.25
                 video.needs_review = True
-                video.language_detected = self._detect_language(text)
+                video.language_detected = language
                 print(f"Rejected - no preacher name: {video.video_id} - '{video.title[:60]}...'")
                 return video
 
         # --- Check face verification requirements for unknown channels ---
         if channel_trust_level == 0:  # Unknown channel
-            if FACE_VERIFICATION_REQUIREMENTS.get("required_for_unknown_channels", True):
+            if FACE_VERIFICATION_REQUIREMENTS.required_for_unknown_channels:
                 if not face_verified and not has_name:
                     # Unknown channel, no face, no identity = reject
                     video.content_type = ContentType.UNKNOWN
                     video.confidence_score = 0.20
                     video.needs_review = True
-                    video.language_detected = self._detect_language(text)
+                    video.language_detected = language
                     print(f"Unknown channel rejected: {video.video_id} (no identity or face)")
                     return video
 
@@ -376,7 +708,7 @@ class ContentClassifier:
             video.needs_review = True
         else:
             # Use new review threshold from STORAGE_CONFIG
-            review_threshold = STORAGE_CONFIG.get("review_threshold", 0.70)
+            review_threshold = STORAGE_CONFIG.review_threshold
             video.needs_review = confidence < review_threshold and not face_verified
 
         # Update video
@@ -384,44 +716,37 @@ class ContentClassifier:
         video.confidence_score = confidence
 
         # Detect language
-        video.language_detected = self._detect_language(text)
+        video.language_detected = language
 
         return video
 
-    def _get_searchable_text(self, video: VideoMetadata) -> str:
-        """Combine title and description for keyword matching."""
-        parts = []
-        if video.title:
-            parts.append(video.title)
-        if video.description:
-            parts.append(video.description)
-        return " ".join(parts).lower()
-
-    def _has_strong_music_indicators(self, text: str) -> bool:
-        """Check if text contains strong music indicators."""
-        for indicator in self.strong_music:
-            if indicator in text:
-                return True
-        return False
-
-    def _count_preaching_keywords(self, text: str) -> int:
-        """Count number of preaching keywords found in text."""
-        count = 0
-        for keyword in self.preaching_keywords:
-            if keyword in text:
-                count += 1
-                # Give extra weight to strong indicators
-                if keyword in ["sermon", "preaching", "predication", "enseignement"]:
-                    count += 1
-        return count
-
-    def _count_music_keywords(self, text: str) -> int:
-        """Count number of music keywords found in text."""
-        count = 0
-        for keyword in self.music_keywords:
-            if keyword in text:
-                count += 1
-        return count
+    def _analyze_text(
+        self, title: Optional[str], description: Optional[str]
+    ) -> Tuple[MatchResult, Language]:
+        """Analyse a title/description pair into its text signals and language."""
+        text = _searchable_text(title, description)
+        match = self._match_text(text)
+        return match, _language_from_scores(text, match.fr_score, match.en_score)
+
+    def _has_strong_music_indicators(self, matched: Set[str]) -> bool:
+        """Check if the matched keywords include a strong music indicator."""
+        return not self.strong_music.isdisjoint(matched)
+
+    def _count_preaching_keywords(self, matched: Set[str]) -> int:
+        """Count number of preaching keywords among the matched keywords."""
+        hits = matched & self.preaching_keywords
+        # Give extra weight to strong indicators
+        return len(hits) + len(hits & STRONG_PREACHING_KEYWORDS)
+
+    def _count_series_markers(self, text: str) -> int:
+        """Count distinct numbered series markers ("part 2", "jour 1") in text."""
+        return len({
+            (word.lower(), int(number)) for word, number in SERIES_MARKER_RE.findall(text)
+        })
+
+    def _count_music_keywords(self, matched: Set[str]) -> int:
+        """Count number of music keywords among the matched keywords."""
+        return len(matched & self.music_keywords)
 
     def _get_duration_score(self, duration: int | None) -> float:
         """
@@ -438,24 +763,8 @@ class ContentClassifier:
         if duration is None:
             return 0.0
 
-        # Very long videos get a small boost (NOT enough alone)
-        if duration >= self.config["likely_sermon_duration"]:
-            return 0.25  # Reduced from 0.8
-
-        # Long videos get minimal boost
-        if duration >= self.config["min_sermon_duration"]:
-            return 0.15  # Reduced from 0.5
-
-        # Medium length - neutral
-        if duration > self.config["max_music_duration"]:
-            return 0.0  # Reduced from 0.2
-
-        # Short videos penalized more
-        if duration <= self.config["short_clip_duration"]:
-            return -0.5  # Increased penalty from -0.4
-
-        # Short-ish videos
-        return -0.3  # Increased penalty from -0.2
+        # Bands: clip (-0.5), short (-0.3), medium (0.0), long (0.15), very long (0.25)
+        return DURATION_BAND_SCORES[bisect_right(DURATION_BAND_EDGES, duration)]
 
     def _calculate_classification(
         self,
@@ -482,105 +791,10 @@ class ContentClassifier:
         Returns:
             Tuple of (ContentType, confidence_score)
         """
-        # Face verification is the strongest signal
-        if face_verified:
-            return ContentType.PREACHING, 0.98
-
-        # --- Count positive signals ---
-        signals = 0.0
-
-        if has_identity:
-            signals += 2.0  # Strong signal
-
-        if preaching_score >= 3:
-            signals += 1.0  # Moderate signal
-
-        if channel_trust_level >= 2:  # Trusted or verified channel
-            signals += 1.0  # Moderate signal
-
-        if duration_score >= 0.15:
-            signals += 0.5  # Weak signal
-
-        # Strong music indicators - classify as MUSIC
-        if music_score >= 2 and preaching_score == 0:
-            return ContentType.MUSIC, min(0.9, 0.6 + abs(duration_score) * 0.2)
-
-        # --- STRICT MODE: Require identity markers ---
-        if IDENTITY_MARKERS.get("strict_mode", True):
-            if not has_identity and channel_trust_level < 2:
-                # No identity markers and not a trusted channel = UNKNOWN
-                return ContentType.UNKNOWN, 0.25
-
-        # --- Multi-signal requirement: Need at least 2 signals for PREACHING ---
-        if signals < 2:
-            confidence = max(0.30, 0.25 + signals * 0.1)
-            return ContentType.UNKNOWN, confidence
-
-        # Strong preaching indicators with identity
-        if preaching_score >= 3 and music_score == 0 and has_identity:
-            confidence = min(0.95, 0.75 + identity_boost + duration_score * 0.1)
-            return ContentType.PREACHING, confidence
-
-        # Identity + keywords + duration
-        if has_identity and preaching_score > music_score:
-            confidence = 0.60 + identity_boost + (preaching_score - music_score) * 0.05
-            confidence += duration_score * 0.1
-            return ContentType.PREACHING, min(0.90, max(0.55, confidence))
-
-        # Trusted channel with keywords
-        if channel_trust_level >= 2 and preaching_score > music_score:
-            confidence = 0.55 + (preaching_score - music_score) * 0.08
-            confidence += duration_score * 0.1
-            return ContentType.PREACHING, min(0.85, max(0.50, confidence))
-
-        # Music wins by margin
-        if music_score > preaching_score + 1:
-            confidence = 0.5 + (music_score - preaching_score) * 0.1
-            return ContentType.MUSIC, min(0.85, max(0.4, confidence))
-
-        # Preaching wins by margin but no identity
-        if preaching_score > music_score + 1:
-            # Lower confidence without identity
-            confidence = 0.40 + (preaching_score - music_score) * 0.05
-            return ContentType.UNKNOWN, min(0.55, confidence)
-
-        # Short video penalty
-        if duration_score <= -0.3:
-            return ContentType.MUSIC, 0.5 + abs(duration_score) * 0.15
-
-        # Truly uncertain
-        if preaching_score > music_score:
-            return ContentType.UNKNOWN, 0.40
-        elif music_score > preaching_score:
-            return ContentType.MUSIC, 0.45
-        else:
-            return ContentType.UNKNOWN, 0.30
-
-    def _detect_language(self, text: str) -> Language:
-        """
-        Detect whether the video is primarily French or English.
-
-        Returns:
-            Language enum (FR, EN, or UNKNOWN)
-        """
-        words = set(re.findall(r'\b\w+\b', text.lower()))
-
-        french_count = len(words & self.french_words)
-        english_count = len(words & self.english_words)
-
-        # Need clear majority
-        if french_count > english_count + 2:
-            return Language.FRENCH
-        elif english_count > french_count + 2:
-            return Language.ENGLISH
-
-        # Check for specific strong indicators
-        if any(w in text for w in ["predication", "culte", "enseignement", "priere"]):
-            return Language.FRENCH
-        if any(w in text for w in ["preaching", "sermon", "service", "teaching"]):
-            return Language.ENGLISH
-
-        return Language.UNKNOWN
+        return score_video(
+            preaching_score, music_score, duration_score, face_verified,
+            has_identity, identity_boost, channel_trust_level, self.identity.strict_mode,
+        )
 
     def batch_classify(self, videos: list[VideoMetadata]) -> list[VideoMetadata]:
         """
@@ -624,9 +838,9 @@ class ContentClassifier:
             if video.needs_review:
                 summary["needs_review"] += 1
 
-            if video.confidence_score >= self.config["high_confidence"]:
+            if video.confidence_score >= self.config.high_confidence:
                 summary["high_confidence"] += 1
-            elif video.confidence_score < self.config["low_confidence"]:
+            elif video.confidence_score < self.config.low_confidence:
                 summary["low_confidence"] += 1
 
         return summary
@@ -672,6 +886,70 @@ def classify_videos(
     return classifier.batch_classify(videos)
 
 
+# Per-category alternations for counting keyword hits in DataFrame columns
+_CATEGORY_RES = {
+    cat: keyword_alternation(keywords) for cat, keywords in KEYWORD_CATEGORIES.items()
+}
+
+
+def classify_dataframe(df, identity: IdentityMatcher = IDENTITY):
+    """
+    Pre-screen a DataFrame of videos with vectorized text and duration checks.
+
+    Meant for CSV exports and database backfills, where thousands of rows
+    would otherwise go through classify() one by one. Adds, without any
+    row-wise Python:
+
+    - text_norm: normalized title + description
+    - hits_<category>: keyword matches per KeywordCategory (e.g. hits_music)
+    - has_name: required or acceptable preacher name found
+    - strong_music: a strong music indicator was found
+    - duration_band / duration_score: from the configured duration bands
+    - prescreen: "music", "unknown" (no preacher name) or "candidate"
+
+    The prescreen applies the text-only rejections of classify(); channel
+    trust and face verification are not considered, so "candidate" rows
+    (and verified-channel rows) still need ContentClassifier.classify().
+    Hit counts are match occurrences, not the distinct-keyword scores
+    classify() uses.
+
+    Args:
+        df: DataFrame with title, description and duration columns
+        identity: Identity matcher to test names against (default preacher)
+
+    Returns:
+        A copy of df with the columns above added
+    """
+    import numpy as np
+
+    df = df.copy()
+    text = df["title"].fillna("") + " " + df["description"].fillna("")
+    text = text.str.strip().str.lower().str.translate(ACCENT_TRANS)
+    df["text_norm"] = text
+
+    for cat, pattern in _CATEGORY_RES.items():
+        df[f"hits_{cat.name.lower()}"] = text.str.count(pattern.pattern)
+
+    df["has_name"] = (
+        text.str.contains(identity.required_re.pattern, regex=True)
+        | text.str.contains(identity.acceptable_re.pattern, regex=True)
+    )
+    df["strong_music"] = df["hits_strong_music"] > 0
+
+    duration = df["duration"].astype(float)
+    band = np.searchsorted(np.asarray(DURATION_BAND_EDGES), duration.to_numpy(), side="right")
+    known = duration.notna().to_numpy()
+    df["duration_band"] = np.where(known, np.asarray(DURATION_BAND_LABELS, dtype=object)[band], None)
+    df["duration_score"] = np.where(known, np.asarray(DURATION_BAND_SCORES)[band], 0.0)
+
+    df["prescreen"] = np.select(
+        [df["strong_music"].to_numpy(), ~df["has_name"].to_numpy()],
+        ["music", "unknown"],
+        default="candidate",
+    )
+    return df
+
+
 def get_classifier_for_preacher(preacher_id: int) -> ContentClassifier:
     """
     Get a content classifier configured for a specific preacher.
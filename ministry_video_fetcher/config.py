@@ -5,7 +5,47 @@ Contains search queries, classification keywords, and settings for fetching
 videos from YouTube and Facebook. Supports dynamic multi-preacher configuration.
 """
 
-from typing import List, Dict, Optional
+import hashlib
+import json
+import math
+import os
+import re
+import sys
+from array import array
+from bisect import bisect_right
+from collections.abc import Mapping
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import lru_cache
+from typing import List, Dict, Optional, Iterable, Tuple
+
+# =============================================================================
+# SETTINGS CONTAINERS
+# =============================================================================
+
+
+class _FrozenConfig(Mapping):
+    """
+    Read-only mapping view over a frozen settings dataclass.
+
+    Settings are read as attributes (config.review_threshold), which is a
+    single slot lookup. The Mapping interface keeps the older subscript and
+    .get() call sites working, and lets a settings object be ** unpacked
+    into a plain dict of overrides.
+    """
+    __slots__ = ()
+
+    def __getitem__(self, key: str):
+        if key in self.__dataclass_fields__:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self.__dataclass_fields__)
+
+    def __len__(self) -> int:
+        return len(self.__dataclass_fields__)
+
 
 # =============================================================================
 # PLATFORM CONSTANTS
@@ -312,8 +352,6 @@ PREACHING_KEYWORDS_EN: List[str] = [
     "sunday service", "conference", "crusade", "revival", "camp meeting",
     "bible study", "word of god", "holy spirit", "salvation", "grace",
     "testimony", "miracles", "breakthrough", "prophetic", "apostolic",
-    "part 1", "part 2", "part 3", "pt 1", "pt 2", "pt 3",
-    "session 1", "session 2", "day 1", "day 2", "night 1", "night 2",
     "morning service", "evening service", "night vigil",
 ]
 
@@ -324,11 +362,16 @@ PREACHING_KEYWORDS_FR: List[str] = [
     "culte", "conference", "croisade", "reveil", "camp",
     "etude biblique", "parole de dieu", "saint esprit", "salut", "grace",
     "temoignage", "miracles", "percee", "prophetique", "apostolique",
-    "partie 1", "partie 2", "partie 3",
-    "session 1", "session 2", "jour 1", "jour 2", "nuit 1", "nuit 2",
     "culte du matin", "culte du soir", "veillee",
 ]
 
+# Numbered series markers ("part 2", "pt 3", "jour 1", "session 4", ...).
+# Each distinct marker counts as one preaching keyword; matches any number.
+SERIES_MARKER_RE = re.compile(
+    r"\b(part|pt|partie|session|day|jour|night|nuit|morning|evening)\s*(\d+)\b",
+    re.IGNORECASE,
+)
+
 # Keywords indicating MUSIC content (to EXCLUDE)
 MUSIC_KEYWORDS: List[str] = [
     # English
@@ -336,9 +379,9 @@ MUSIC_KEYWORDS: List[str] = [
     "official video", "music video", "live performance", "concert",
     "praise and worship", "worship medley", "gospel song",
     "audio", "mp3", "single", "track",
-    # French
-    "musique", "chanson", "chant", "louange", "album", "paroles",
-    "clip officiel", "clip video", "spectacle", "concert",
+    # French ("album" and "concert" are listed once above)
+    "musique", "chanson", "chant", "louange", "paroles",
+    "clip officiel", "clip video", "spectacle",
     "louange et adoration", "medley", "cantique",
     # Common music indicators
     "feat.", "ft.", "featuring", "prod.", "remix",
@@ -355,28 +398,52 @@ STRONG_MUSIC_INDICATORS: List[str] = [
 # CLASSIFICATION RULES
 # =============================================================================
 
-CLASSIFICATION_CONFIG = {
+@dataclass(frozen=True, slots=True)
+class ClassificationConfig(_FrozenConfig):
+    """Duration and confidence thresholds used by the classifier."""
     # Duration thresholds (in seconds)
-    "min_sermon_duration": 1800,     # 30 minutes - minimum for a sermon
-    "likely_sermon_duration": 2700,  # 45 minutes - very likely a sermon
-    "max_music_duration": 600,       # 10 minutes - if no preaching keywords, likely music
-    "short_clip_duration": 240,      # 4 minutes - very short, likely music/clip
+    min_sermon_duration: int = 1800     # 30 minutes - minimum for a sermon
+    likely_sermon_duration: int = 2700  # 45 minutes - very likely a sermon
+    max_music_duration: int = 600       # 10 minutes - if no preaching keywords, likely music
+    short_clip_duration: int = 240      # 4 minutes - very short, likely music/clip
 
     # Confidence thresholds
-    "high_confidence": 0.85,
-    "medium_confidence": 0.65,
-    "low_confidence": 0.45,
+    high_confidence: float = 0.85
+    medium_confidence: float = 0.65
+    low_confidence: float = 0.45
 
     # If confidence below this, flag for review
-    "review_threshold": 0.60,
-}
+    review_threshold: float = 0.60
+
+
+CLASSIFICATION_CONFIG = ClassificationConfig()
+
+# Duration bands as sorted lower edges: bisect_right(DURATION_BAND_EDGES, d)
+# is the band index. Clips and music are bounded inclusively (d <= 240 is
+# still a clip), so those two edges sit just above the threshold.
+DURATION_BAND_EDGES = array("d", [
+    math.nextafter(CLASSIFICATION_CONFIG.short_clip_duration, math.inf),
+    math.nextafter(CLASSIFICATION_CONFIG.max_music_duration, math.inf),
+    CLASSIFICATION_CONFIG.min_sermon_duration,
+    CLASSIFICATION_CONFIG.likely_sermon_duration,
+])
+DURATION_BAND_LABELS = ("tiny", "short", "medium", "long", "very_long")
+# Duration score per band: penalize clips, small boost for sermon lengths
+DURATION_BAND_SCORES = (-0.5, -0.3, 0.0, 0.15, 0.25)
+
+
+def duration_band(seconds: float) -> str:
+    """Return the duration band label ("tiny" ... "very_long") for a video length."""
+    return DURATION_BAND_LABELS[bisect_right(DURATION_BAND_EDGES, seconds)]
 
 # =============================================================================
 # LANGUAGE DETECTION KEYWORDS
 # =============================================================================
 
+# The two lists must stay disjoint: a word in both would cancel itself out.
+# Words common to both languages ("message") carry no signal and are left out.
 FRENCH_INDICATORS: List[str] = [
-    "predication", "message", "enseignement", "culte", "priere",
+    "predication", "enseignement", "culte", "priere",
     "delivrance", "guerison", "parole", "dieu", "eglise",
     "partie", "jour", "nuit", "dimanche", "vendredi",
     "apotre", "pasteur", "frere", "soeur",
@@ -395,61 +462,89 @@ ENGLISH_INDICATORS: List[str] = [
 # FETCHER SETTINGS
 # =============================================================================
 
-FETCHER_CONFIG = {
+@dataclass(frozen=True, slots=True)
+class FetcherConfig(_FrozenConfig):
+    """Rate limiting and yt-dlp settings for the YouTube fetcher."""
     # Rate limiting
-    "request_delay": 1.0,        # Seconds between requests
-    "retry_count": 3,            # Number of retries on failure
-    "retry_delay": 2.0,          # Initial delay between retries (exponential backoff)
+    request_delay: float = 1.0      # Seconds between requests
+    retry_count: int = 3            # Number of retries on failure
+    retry_delay: float = 2.0        # Initial delay between retries (exponential backoff)
 
     # yt-dlp options
-    "extract_flat": True,        # Don't download, just extract metadata
-    "quiet": True,               # Suppress yt-dlp output
-    "no_warnings": True,         # Suppress warnings
-    "ignoreerrors": True,        # Continue on errors
+    extract_flat: bool = True       # Don't download, just extract metadata
+    quiet: bool = True              # Suppress yt-dlp output
+    no_warnings: bool = True        # Suppress warnings
+    ignoreerrors: bool = True       # Continue on errors
 
     # Data limits
-    "max_description_length": 500,  # Truncate descriptions
-}
+    max_description_length: int = 500  # Truncate descriptions
+
+
+FETCHER_CONFIG = FetcherConfig()
 
 # =============================================================================
 # DATABASE SETTINGS
 # =============================================================================
 
-DATABASE_CONFIG = {
-    "db_path": "ministry_videos.db",
-    "backup_enabled": True,
-}
+@dataclass(frozen=True, slots=True)
+class DatabaseConfig(_FrozenConfig):
+    """SQLite database settings."""
+    db_path: str = "ministry_videos.db"
+    backup_enabled: bool = True
+    batch_size: int = 1000  # Videos buffered per bulk insert transaction
+    reader_pool_size: int = 0  # Read-only connections per Database (0 = CPU count, at most 8)
+    cache_size_kb: int = 65536  # Page cache per connection (64 MB)
+    mmap_size: int = 268435456  # Memory-mapped I/O window per connection (256 MB)
+    cached_statements: int = 256  # Compiled statements kept per connection
+
+
+DATABASE_CONFIG = DatabaseConfig()
 
 # =============================================================================
 # EXPORT SETTINGS
 # =============================================================================
 
-EXPORT_CONFIG = {
-    "csv_filename": "ministry_videos_export.csv",
-    "date_format": "%Y-%m-%d",
-    "datetime_format": "%Y-%m-%d %H:%M:%S",
-}
+@dataclass(frozen=True, slots=True)
+class ExportConfig(_FrozenConfig):
+    """CSV export settings."""
+    csv_filename: str = "ministry_videos_export.csv"
+    date_format: str = "%Y-%m-%d"
+    datetime_format: str = "%Y-%m-%d %H:%M:%S"
+
+
+EXPORT_CONFIG = ExportConfig()
 
 # =============================================================================
 # FACE RECOGNITION SETTINGS
 # =============================================================================
 
-FACE_RECOGNITION_CONFIG = {
+@dataclass(frozen=True, slots=True)
+class FaceRecognitionConfig(_FrozenConfig):
+    """DeepFace model and frame extraction settings."""
     # Model settings
-    "model_name": "VGG-Face",  # Options: VGG-Face, Facenet, Facenet512, ArcFace, OpenFace
-    "detector_backend": "opencv",  # Options: opencv, ssd, dlib, mtcnn, retinaface
-    "distance_metric": "cosine",  # Options: cosine, euclidean, euclidean_l2
-    "distance_threshold": 0.40,  # Lower = stricter matching (0.4 is good for VGG-Face)
+    model_name: str = "VGG-Face"  # Options: VGG-Face, Facenet, Facenet512, ArcFace, OpenFace
+    detector_backend: str = "opencv"  # Options: opencv, ssd, dlib, mtcnn, retinaface
+    distance_metric: str = "cosine"  # Options: cosine, euclidean, euclidean_l2
+    distance_threshold: float = 0.40  # Lower = stricter matching (0.4 is good for VGG-Face)
 
     # Frame extraction settings
-    "enable_frame_extraction": True,  # Extract frames from video for deeper analysis
-    "num_frames": 5,  # Number of frames to extract
-    "frame_interval_seconds": 10,  # Time between frames
-    "video_segment_duration": 60,  # Download first N seconds of video
+    enable_frame_extraction: bool = True  # Extract frames from video for deeper analysis
+    num_frames: int = 5  # Number of frames to extract
+    frame_interval_seconds: int = 10  # Time between frames
+    video_segment_duration: int = 60  # Download first N seconds of video
+    max_frame_dimension: int = 640  # Downscale frames/thumbnails so the longer side is at most N px
+
+    # Inference settings
+    embedding_dtype: str = "float16"  # Storage/compare precision for normalized embeddings (float32, float16, int8)
+    insightface_model: str = ""  # InsightFace model pack to use instead of DeepFace, e.g. "buffalo_s" ("" = off)
+    insightface_ctx_id: int = -1  # GPU index for InsightFace, -1 for CPU
+    insightface_distance_threshold: float = 0.50  # Cosine distance for ArcFace embeddings (L2 < 1.0 on unit vectors)
 
     # Reference photos directory
-    "photos_dir": "photos",
-}
+    photos_dir: str = "photos"
+
+
+FACE_RECOGNITION_CONFIG = FaceRecognitionConfig()
 
 # =============================================================================
 # STRICT CHANNELS - Require face verification
@@ -483,6 +578,10 @@ IDENTITY_MARKERS = {
         "naricisse majila",  # Common misspelling
     ],
 
+    # Spelling-tolerant regex for the required name. Catches the misspellings
+    # seen in titles (naricisse, narcise, narcis, ...) without listing each one.
+    "required_name_pattern": r"\bn[aou]r[ic]+[sc]{1,2}e?\s+m[ao]jila\b",
+
     # Alternative acceptable names (good match)
     "acceptable_names": [
         "apostle narcisse",
@@ -516,6 +615,180 @@ IDENTITY_MARKERS = {
     "require_name_not_just_church": True,
 }
 
+# =============================================================================
+# KEYWORD CATEGORIES
+# =============================================================================
+
+
+class KeywordCategory(IntEnum):
+    """Category tag attached to every keyword in the classifier's matcher."""
+    PREACH_EN = 0
+    PREACH_FR = 1
+    MUSIC = 2
+    STRONG_MUSIC = 3
+    FR_LANG = 4
+    EN_LANG = 5
+    IDENTITY_REQUIRED = 6
+    IDENTITY_ACCEPTABLE = 7
+    CHURCH = 8
+
+
+# Every keyword list the classifier scans, tagged by category. The classifier
+# compiles these into a single matcher so one pass over the text finds them all.
+KEYWORD_CATEGORIES: Dict[KeywordCategory, List[str]] = {
+    KeywordCategory.PREACH_EN: PREACHING_KEYWORDS_EN,
+    KeywordCategory.PREACH_FR: PREACHING_KEYWORDS_FR,
+    KeywordCategory.MUSIC: MUSIC_KEYWORDS,
+    KeywordCategory.STRONG_MUSIC: STRONG_MUSIC_INDICATORS,
+    KeywordCategory.FR_LANG: FRENCH_INDICATORS,
+    KeywordCategory.EN_LANG: ENGLISH_INDICATORS,
+    KeywordCategory.IDENTITY_REQUIRED: IDENTITY_MARKERS["required_names"],
+    KeywordCategory.IDENTITY_ACCEPTABLE: IDENTITY_MARKERS["acceptable_names"],
+    KeywordCategory.CHURCH: IDENTITY_MARKERS["church_names"],
+}
+
+# =============================================================================
+# KEYWORD LOOKUP TABLES
+# =============================================================================
+#
+# Hashed, normalized companions of the keyword lists above, built once at
+# import. The lists stay the source of truth (ordered, easy to edit).
+# KEYWORD_TO_CATEGORIES maps every keyword to a bitmask of its categories for
+# the single-pass scan; the *_SET frozensets give O(1) membership for word
+# tokens. Keywords are interned so that lookups with interned tokens
+# short-circuit on pointer equality.
+
+
+# Accent folding table: lowercase accented Latin letters -> plain ASCII.
+# Public so vectorized callers (str.translate on a pandas Series) can apply
+# the same folding as normalize_text.
+ACCENT_TRANS = str.maketrans({
+    **dict(zip("àâäáãåéèêëíìîïóòôöõúùûüçñÿ", "aaaaaaeeeeiiiiooooouuuucny")),
+    "œ": "oe",
+    "æ": "ae",
+})
+
+
+def normalize_text(text: str) -> str:
+    """
+    Lowercase text and fold French accents ("Prédication" -> "predication").
+
+    Applied to keywords at import and to video metadata once per video, so
+    both sides of every comparison use the same accent-free form.
+    """
+    return text.lower().translate(ACCENT_TRANS)
+
+
+def _build_keyword_to_categories() -> Dict[str, int]:
+    """
+    Map each normalized keyword to a bitmask of its categories.
+
+    Keywords shared between lists ("message", "grace", "conference" in both
+    preaching lists, "album" in music and strong music) become one entry, so
+    a single match credits every category it belongs to.
+    """
+    mapping: Dict[str, int] = {}
+    for category, keywords in KEYWORD_CATEGORIES.items():
+        flag = 1 << category
+        for kw in keywords:
+            key = sys.intern(normalize_text(kw))
+            mapping[key] = mapping.get(key, 0) | flag
+    return mapping
+
+
+def iter_bits(mask: int) -> Iterable[int]:
+    """Yield the positions of the set bits in a category bitmask."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+KEYWORD_TO_CATEGORIES = _build_keyword_to_categories()
+
+
+def _keyword_set(keywords: Iterable[str]) -> frozenset:
+    """Normalized, interned frozenset of a keyword list."""
+    return frozenset(sys.intern(normalize_text(kw)) for kw in keywords)
+
+
+PREACHING_KEYWORDS_EN_SET = _keyword_set(PREACHING_KEYWORDS_EN)
+PREACHING_KEYWORDS_FR_SET = _keyword_set(PREACHING_KEYWORDS_FR)
+PREACHING_KEYWORDS_SET = PREACHING_KEYWORDS_EN_SET | PREACHING_KEYWORDS_FR_SET
+MUSIC_KEYWORDS_SET = _keyword_set(MUSIC_KEYWORDS)
+STRONG_MUSIC_INDICATORS_SET = _keyword_set(STRONG_MUSIC_INDICATORS)
+FRENCH_INDICATORS_SET = _keyword_set(FRENCH_INDICATORS)
+ENGLISH_INDICATORS_SET = _keyword_set(ENGLISH_INDICATORS)
+
+
+def keyword_alternation(keywords: Iterable[str]) -> "re.Pattern[str]":
+    """
+    Compile keywords into one case-insensitive alternation regex.
+
+    Answers "does ANY of these keywords occur?" in a single C-level search
+    instead of one substring check per keyword. Longer keywords are tried
+    first so a phrase wins over its own prefix. An empty list compiles to a
+    pattern that never matches.
+    """
+    normalized = sorted({normalize_text(kw) for kw in keywords}, key=len, reverse=True)
+    if not normalized:
+        return re.compile(r"(?!)")
+    return re.compile("|".join(map(re.escape, normalized)), re.IGNORECASE)
+
+
+# =============================================================================
+# IDENTITY MATCHER
+# =============================================================================
+
+@dataclass(frozen=True, slots=True)
+class IdentityMatcher:
+    """
+    Identity markers compiled into ready-to-call matchers.
+
+    Built once from an IDENTITY_MARKERS-style dict (the global one or a
+    preacher's own). Each check is a single regex search over text already
+    passed through normalize_text.
+    """
+    required_re: "re.Pattern[str]"
+    acceptable_re: "re.Pattern[str]"
+    church_re: "re.Pattern[str]"
+    strict_mode: bool = True
+    require_name_not_just_church: bool = True
+
+    @classmethod
+    def from_markers(cls, markers: Mapping) -> "IdentityMatcher":
+        """Compile the name lists and policy flags of an identity marker dict."""
+        required_re = keyword_alternation(markers.get("required_names", []))
+        pattern = markers.get("required_name_pattern")
+        if pattern:
+            # Fold the fuzzy pattern in so the required check stays one search
+            alternatives = [required_re.pattern] if required_re.pattern != r"(?!)" else []
+            alternatives.append(f"(?:{pattern})")
+            required_re = re.compile("|".join(alternatives), re.IGNORECASE)
+
+        return cls(
+            required_re=required_re,
+            acceptable_re=keyword_alternation(markers.get("acceptable_names", [])),
+            church_re=keyword_alternation(markers.get("church_names", [])),
+            strict_mode=markers.get("strict_mode", True),
+            require_name_not_just_church=markers.get("require_name_not_just_church", True),
+        )
+
+    def required(self, text: str) -> bool:
+        """True if a required name (or a misspelling of it) occurs in text."""
+        return self.required_re.search(text) is not None
+
+    def acceptable(self, text: str) -> bool:
+        """True if an acceptable title + name form occurs in text."""
+        return self.acceptable_re.search(text) is not None
+
+    def church(self, text: str) -> bool:
+        """True if one of the church names occurs in text."""
+        return self.church_re.search(text) is not None
+
+
+IDENTITY = IdentityMatcher.from_markers(IDENTITY_MARKERS)
+
 # =============================================================================
 # CHANNEL TRUST LEVELS
 # =============================================================================
@@ -545,39 +818,90 @@ CHANNEL_TRUST_LEVELS = {
     # - Require face verification (if DeepFace available)
 }
 
+
+def normalize_channel(name: str) -> str:
+    """Normalize a channel name or handle for lookup ("@Ramah FGC" -> "ramahfgc")."""
+    return "".join(name.lower().replace("@", "").split())
+
+
+def _build_channel_to_level() -> Dict[str, int]:
+    """Invert CHANNEL_TRUST_LEVELS into normalized channel -> level (1-3)."""
+    mapping: Dict[str, int] = {}
+    for level, key in enumerate(("known", "trusted", "verified"), start=1):
+        for ch in CHANNEL_TRUST_LEVELS.get(key, []):
+            mapping[normalize_channel(ch)] = level
+    return mapping
+
+
+CHANNEL_TO_LEVEL = _build_channel_to_level()
+STRICT_CHANNELS_SET = frozenset(normalize_channel(ch) for ch in STRICT_CHANNELS)
+TRUSTED_CHANNELS_SET = frozenset(normalize_channel(ch) for ch in TRUSTED_CHANNELS)
+
 # =============================================================================
 # FACE VERIFICATION REQUIREMENTS
 # =============================================================================
 
-FACE_VERIFICATION_REQUIREMENTS = {
+@dataclass(frozen=True, slots=True)
+class FaceVerificationRequirements(_FrozenConfig):
+    """When face verification is required and how confident it must be."""
     # Minimum face confidence to count as verified
-    "min_confidence": 0.70,
+    min_confidence: float = 0.70
 
     # Require face verification for unknown channels
-    "required_for_unknown_channels": True,
+    required_for_unknown_channels: bool = True
 
     # Allow classification if DeepFace unavailable (fall back to other signals)
-    "allow_deepface_bypass": True,
-}
+    allow_deepface_bypass: bool = True
+
+
+FACE_VERIFICATION_REQUIREMENTS = FaceVerificationRequirements()
 
 # =============================================================================
 # STORAGE THRESHOLDS
 # =============================================================================
 
-STORAGE_CONFIG = {
+@dataclass(frozen=True, slots=True)
+class StorageConfig(_FrozenConfig):
+    """Confidence thresholds for storing and reviewing videos."""
     # Minimum confidence to store a video (below this = skip entirely)
-    "min_storage_confidence": 0.50,
+    min_storage_confidence: float = 0.50
 
     # Confidence above which video is auto-accepted without review
-    "auto_accept_confidence": 0.85,
+    auto_accept_confidence: float = 0.85
 
     # Confidence threshold for flagging for review
-    "review_threshold": 0.70,
-}
+    review_threshold: float = 0.70
+
+
+STORAGE_CONFIG = StorageConfig()
+
+# =============================================================================
+# SEARCH QUERY CACHE
+# =============================================================================
+
+@dataclass(frozen=True, slots=True)
+class QueryCacheConfig(_FrozenConfig):
+    """On-disk cache for generated search queries."""
+    # Directory to persist generated search queries in between runs, keyed by
+    # a hash of the inputs and of this module's source. Off unless
+    # QUERY_CACHE_DIR is set.
+    cache_dir: str = os.environ.get("QUERY_CACHE_DIR", "")
+
+
+QUERY_CACHE_CONFIG = QueryCacheConfig()
 
 # =============================================================================
 # DYNAMIC SEARCH QUERY GENERATOR
 # =============================================================================
+#
+# The public generators below accept lists for convenience, but the cached
+# builders behind them only take hashable arguments (str / None / tuple) so
+# that lru_cache can key directly on the argument tuple.
+
+
+def _as_hashable(x: Optional[Iterable[str]]) -> Tuple[str, ...]:
+    """Convert an optional list argument into a tuple usable as a cache key."""
+    return tuple(x) if x is not None else ()
 
 
 def generate_search_queries(
@@ -603,10 +927,87 @@ def generate_search_queries(
     Returns:
         List of search queries optimized for the platform
     """
+    return list(_build_search_queries(
+        name, title, primary_church, platform, _as_hashable(include_aliases)
+    ))
+
+
+@lru_cache(maxsize=128)
+def _build_search_queries(
+    name: str,
+    title: Optional[str],
+    primary_church: Optional[str],
+    platform: str,
+    include_aliases: Tuple[str, ...]
+) -> Tuple[str, ...]:
+    """
+    Build the query tuple for generate_search_queries.
+
+    When QUERY_CACHE_DIR is set, looks up the on-disk query cache first;
+    on a miss the queries are generated and written back so later
+    processes can skip generation.
+    """
+    args = (name, title, primary_church, platform, include_aliases)
+    if not QUERY_CACHE_CONFIG.cache_dir:
+        return _generate_search_queries(*args)
+
+    try:
+        source_hash = _module_source_hash()
+    except OSError:
+        # No source to key on (e.g. bytecode-only install); skip the cache
+        return _generate_search_queries(*args)
+
+    # Content-addressed: identical inputs and generator code map to the
+    # same file, so editing this module invalidates every entry
+    key = hashlib.sha256(
+        repr((source_hash,) + args).encode("utf-8")
+    ).hexdigest()
+    cache_path = os.path.join(QUERY_CACHE_CONFIG.cache_dir, f"{key}.json")
+
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if isinstance(cached, list):
+            return tuple(cached)
+    except (OSError, ValueError):
+        pass
+
+    queries = _generate_search_queries(*args)
+
+    try:
+        os.makedirs(QUERY_CACHE_CONFIG.cache_dir, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(list(queries), f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Cache is best-effort; a read-only home dir shouldn't break fetching
+        pass
+
+    return queries
+
+
+@lru_cache(maxsize=None)
+def _module_source_hash() -> str:
+    """Hash of this module's source file, used to key the query cache."""
+    with open(__file__, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def _generate_search_queries(
+    name: str,
+    title: Optional[str],
+    primary_church: Optional[str],
+    platform: str,
+    include_aliases: Tuple[str, ...]
+) -> Tuple[str, ...]:
+    """Generate the de-duplicated query tuple (uncached)."""
     queries = []
     name_parts = name.split()
     last_name = name_parts[-1] if len(name_parts) > 1 else name
-    first_name = name_parts[0] if len(name_parts) > 1 else name
+    # Single-token names: every "<x> {last_name}" variant would duplicate "<x> {name}"
+    same = last_name == name
+    name_forms = (name,) if same else (name, last_name)
 
     # Title variations in English and French (with and without accents)
     title_pairs = [
@@ -636,83 +1037,46 @@ def generate_search_queries(
     # Event-related keywords
     event_keywords = ["2024", "2023", "2025", "live", "direct", "en direct"]
 
-    if platform == "youtube":
-        # YouTube supports exact match with quotes
-        queries.append(f'"{name}"')
-
-        # With preaching keywords (both languages)
-        for kw in keywords_en:
-            queries.append(f'"{name}" {kw}')
-        for kw in keywords_fr:
-            queries.append(f'"{name}" {kw}')
-
-        # With title variations
-        if title:
-            queries.append(f'"{title} {name}"')
-            queries.append(f'"{title} {last_name}"')
-
-        # Add common title variations (all versions)
-        for titles in title_pairs:
-            for t in titles:
-                queries.append(f'"{t} {name}"')
-                queries.append(f'"{t} {last_name}"')
-
-        # Church-related queries
-        if primary_church:
-            queries.append(f'"{primary_church}"')
-            queries.append(f'"{primary_church}" {last_name}')
-            queries.append(f'"{primary_church}" {name}')
-
-        # Add aliases/misspellings
-        if include_aliases:
-            for alias in include_aliases:
-                queries.append(f'"{alias}"')
-                for kw in keywords_en[:3] + keywords_fr[:3]:
-                    queries.append(f'"{alias}" {kw}')
-
-    else:  # Facebook
-        # Facebook search doesn't use quotes the same way
-        queries.append(name)
-
-        # With preaching keywords (both English and French)
-        for kw in keywords_en:
-            queries.append(f"{name} {kw}")
-        for kw in keywords_fr:
-            queries.append(f"{name} {kw}")
-
-        # With title variations (all versions - English, French no accent, French with accent)
-        if title:
-            queries.append(f"{title} {name}")
-            queries.append(f"{title} {last_name}")
-
-        # Add all title variations for comprehensive coverage
-        for titles in title_pairs:
-            for t in titles:
-                queries.append(f"{t} {name}")
-                queries.append(f"{t} {last_name}")
-
-        # Event-based queries (for finding recent content)
-        for event_kw in event_keywords:
-            queries.append(f"{name} {event_kw}")
-            queries.append(f"{last_name} {event_kw}")
-
-        # Church-related queries
-        if primary_church:
-            queries.append(primary_church)
-            queries.append(f"{primary_church} {last_name}")
-            queries.append(f"{primary_church} {name}")
-
-        # Add aliases/misspellings (important for Facebook)
-        if include_aliases:
-            for alias in include_aliases:
-                queries.append(alias)
-                for kw in keywords_en[:3] + keywords_fr[:3]:
-                    queries.append(f"{alias} {kw}")
-
-        # Special Facebook queries with "video" keyword
-        queries.append(f"{name} video")
-        queries.append(f"{name} vidéo")
-        queries.append(f"{name} facebook live")
+    # YouTube supports exact match with quotes; Facebook search doesn't
+    q = '"' if platform == "youtube" else ""
+    is_facebook = platform != "youtube"
+
+    queries.append(f"{q}{name}{q}")
+
+    # With preaching keywords (both English and French)
+    queries.extend(f"{q}{name}{q} {kw}" for kw in keywords_en)
+    queries.extend(f"{q}{name}{q} {kw}" for kw in keywords_fr)
+
+    # With title variations
+    if title:
+        queries.extend(f"{q}{title} {n}{q}" for n in name_forms)
+
+    # Add all title variations (English, French no accent, French with accent)
+    queries.extend(
+        f"{q}{t} {n}{q}" for titles in title_pairs for t in titles for n in name_forms
+    )
+
+    # Event-based queries (for finding recent Facebook content)
+    if is_facebook:
+        queries.extend(f"{n} {event_kw}" for event_kw in event_keywords for n in name_forms)
+
+    # Church-related queries
+    if primary_church:
+        queries.append(f"{q}{primary_church}{q}")
+        if not same:
+            queries.append(f"{q}{primary_church}{q} {last_name}")
+        queries.append(f"{q}{primary_church}{q} {name}")
+
+    # Add aliases/misspellings (important for Facebook)
+    if include_aliases:
+        alias_keywords = keywords_en[:3] + keywords_fr[:3]
+        for alias in include_aliases:
+            queries.append(f"{q}{alias}{q}")
+            queries.extend(f"{q}{alias}{q} {kw}" for kw in alias_keywords)
+
+    # Special Facebook queries with "video" keyword
+    if is_facebook:
+        queries.extend(f"{name} {suffix}" for suffix in ("video", "vidéo", "facebook live"))
 
     # Remove duplicates while preserving order
     seen = set()
@@ -723,7 +1087,7 @@ def generate_search_queries(
             seen.add(q_lower)
             unique_queries.append(q)
 
-    return unique_queries
+    return tuple(unique_queries)
 
 
 def generate_identity_markers(
@@ -744,29 +1108,52 @@ def generate_identity_markers(
     Returns:
         Dictionary with required_names, acceptable_names, and church_names
     """
+    markers = _build_identity_markers(name, title, primary_church, _as_hashable(aliases))
+    # Hand out fresh lists so callers can't mutate the cached entry
+    return {
+        key: list(value) if isinstance(value, tuple) else value
+        for key, value in markers.items()
+    }
+
+
+@lru_cache(maxsize=128)
+def _build_identity_markers(
+    name: str,
+    title: Optional[str],
+    primary_church: Optional[str],
+    aliases: Tuple[str, ...]
+) -> Dict:
+    """Build the identity marker entries for generate_identity_markers."""
     name_parts = name.split()
     last_name = name_parts[-1] if len(name_parts) > 1 else name
     first_name = name_parts[0] if len(name_parts) > 1 else name
+    # Single-token names: last/first name variants would just repeat the full name
+    same = last_name == name
+    name_l, last_l, first_l = name.lower(), last_name.lower(), first_name.lower()
 
     # Required names (strongest match)
-    required_names = [name.lower(), last_name.lower()]
+    required_names = [name_l] if same else [name_l, last_l]
     if aliases:
         for alias in aliases:
             if alias.lower() not in required_names:
                 required_names.append(alias.lower())
 
     # Acceptable names (good match with titles)
-    acceptable_names = []
-    for t in ["apostle", "apotre", "apôtre", "pastor", "pasteur",
-              "bishop", "prophet", "evangelist", "reverend", "dr."]:
-        acceptable_names.append(f"{t} {name.lower()}")
-        acceptable_names.append(f"{t} {last_name.lower()}")
-        acceptable_names.append(f"{t} {first_name.lower()}")
+    title_forms = (name_l,) if same else (name_l, last_l, first_l)
+    acceptable_names = [
+        f"{t} {n}"
+        for t in ("apostle", "apotre", "apôtre", "pastor", "pasteur",
+                  "bishop", "prophet", "evangelist", "reverend", "dr.")
+        for n in title_forms
+    ]
 
     # Additional descriptors
-    for desc in ["man of god", "servant of god", "serviteur de dieu", "homme de dieu"]:
-        acceptable_names.append(f"{desc} {name.lower()}")
-        acceptable_names.append(f"{desc} {last_name.lower()}")
+    desc_forms = (name_l,) if same else (name_l, last_l)
+    acceptable_names.extend(
+        f"{desc} {n}"
+        for desc in ("man of god", "servant of god", "serviteur de dieu", "homme de dieu")
+        for n in desc_forms
+    )
 
     # Church names
     church_names = []
@@ -780,9 +1167,9 @@ def generate_identity_markers(
             church_names.append(acronym)
 
     return {
-        "required_names": required_names,
-        "acceptable_names": acceptable_names,
-        "church_names": church_names,
+        "required_names": tuple(required_names),
+        "acceptable_names": tuple(acceptable_names),
+        "church_names": tuple(church_names),
         "strict_mode": True,
         "require_name_not_just_church": True,
     }
@@ -798,6 +1185,5 @@ def get_photos_directory(preacher_id: int) -> str:
     Returns:
         Path to the preacher's photos directory
     """
-    import os
-    base_dir = FACE_RECOGNITION_CONFIG.get("photos_dir", "photos")
+    base_dir = FACE_RECOGNITION_CONFIG.photos_dir
     return os.path.join(base_dir, f"preacher_{preacher_id}")
@@ -8,18 +8,246 @@ Supports multi-preacher architecture with preacher-specific video tracking.
 """
 
 import sqlite3
+import csv
 import json
 import os
 import shutil
-import glob
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple, Dict, Any
+from urllib.request import pathname2url
+from typing import List, Optional, Tuple, Dict, Any, Iterator, Sequence, Union
 import pandas as pd
 
 from models import VideoMetadata, FetchLog, ContentType, Language
 from config import DATABASE_CONFIG
 
+# Bump when _ensure_tables gains a migration step
+SCHEMA_VERSION = 7
+
+# Serializes schema setup between Database instances in this process
+_SCHEMA_LOCK = threading.Lock()
+
+# insert_videos_batch refreshes the planner statistics for videos after
+# adding at least this many rows
+_ANALYZE_AFTER_ROWS = 1000
+
+# Face reference photos live in photos/ at the project root, one
+# preacher_{id} subdirectory per preacher
+PHOTOS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "photos")
+
+# Video statements, built once from the VideoMetadata column order
+_VIDEO_COLUMNS = VideoMetadata.columns()
+_INSERT_OR_IGNORE_VIDEO_SQL = (
+    f"INSERT OR IGNORE INTO videos ({', '.join(_VIDEO_COLUMNS)}) "
+    f"VALUES ({', '.join('?' for _ in _VIDEO_COLUMNS)})"
+)
+# insert_videos_batch packs this many rows into one multi-row INSERT, as
+# many as fit in 999 bound parameters (the limit on older SQLite builds)
+_BATCH_INSERT_ROWS = 999 // len(_VIDEO_COLUMNS)
+
+
+@lru_cache(maxsize=_BATCH_INSERT_ROWS)
+def _insert_videos_sql(rows: int) -> str:
+    """INSERT OR IGNORE statement with a VALUES tuple for each of `rows` videos."""
+    placeholders = f"({', '.join('?' for _ in _VIDEO_COLUMNS)})"
+    return (
+        f"INSERT OR IGNORE INTO videos ({', '.join(_VIDEO_COLUMNS)}) "
+        f"VALUES {', '.join([placeholders] * rows)}"
+    )
+
+
+# Parameters: to_tuple()[1:] followed by video_id
+_UPDATE_VIDEO_SQL = (
+    f"UPDATE videos SET {', '.join(f'{col} = ?' for col in _VIDEO_COLUMNS[1:])} "
+    f"WHERE video_id = ?"
+)
+
+# Partial updates use one fixed statement per table so the prepared
+# statement is reused: a NULL parameter keeps the column's current value
+_UPDATE_FACE_VERIFICATION_SQL = """
+    UPDATE videos SET
+        face_verified = ?,
+        confidence_score = COALESCE(?, confidence_score),
+        content_type = COALESCE(?, content_type),
+        needs_review = COALESCE(?, needs_review)
+    WHERE video_id = ?
+"""
+_UPDATE_PREACHER_SQL = """
+    UPDATE preachers SET
+        name = COALESCE(?, name),
+        aliases = COALESCE(?, aliases),
+        title = COALESCE(?, title),
+        primary_church = COALESCE(?, primary_church),
+        bio = COALESCE(?, bio),
+        updated_at = ?
+    WHERE id = ?
+"""
+_UPDATE_DISCOVERED_CHANNEL_SQL = """
+    UPDATE discovered_channels SET
+        video_count = COALESCE(?, video_count),
+        last_scanned = COALESCE(?, last_scanned),
+        is_active = COALESCE(?, is_active),
+        notes = COALESCE(?, notes)
+    WHERE id = ?
+"""
+
+# get_statistics in a single statement. Counts come from the videos_stats
+# roll-up; the channel and date figures use the videos indexes. Rows are
+# (stat, key, value) with key set only for the per-group breakdowns.
+_STATISTICS_SQL = """
+    WITH s AS (SELECT * FROM videos_stats WHERE cnt > 0)
+    SELECT 'total_videos', NULL, IFNULL(SUM(cnt), 0) FROM s
+    UNION ALL
+    SELECT 'content_type', NULLIF(content_type, ''), SUM(cnt) FROM s GROUP BY content_type
+    UNION ALL
+    SELECT 'language', NULLIF(language_detected, ''), SUM(cnt) FROM s GROUP BY language_detected
+    UNION ALL
+    SELECT 'needs_review', NULL, IFNULL(SUM(cnt), 0) FROM s WHERE review = 1
+    UNION ALL
+    SELECT 'preaching_seconds', NULL, SUM(dur) FROM s
+    WHERE content_type IN ('PREACHING', 'UNKNOWN')
+    UNION ALL
+    SELECT 'unique_channels', NULL, COUNT(DISTINCT channel_name) FROM videos
+    UNION ALL
+    SELECT 'oldest_video', NULL, MIN(upload_date) FROM videos WHERE upload_date IS NOT NULL
+    UNION ALL
+    SELECT 'newest_video', NULL, MAX(upload_date) FROM videos WHERE upload_date IS NOT NULL
+"""
+
+
+# get_statistics_for_preacher in two statements: scalar totals, then the
+# per-group breakdowns tagged with the stat they feed
+_PREACHER_TOTALS_SQL = """
+    SELECT
+        COUNT(*) as total_videos,
+        COUNT(CASE WHEN needs_review = 1 THEN 1 END) as needs_review,
+        COUNT(DISTINCT channel_name) as unique_channels,
+        MIN(upload_date) as oldest,
+        MAX(upload_date) as newest,
+        COALESCE(SUM(
+            CASE WHEN content_type IN ('PREACHING', 'UNKNOWN') THEN duration END
+        ) / 3600.0, 0) as hours
+    FROM videos
+    WHERE preacher_id = ?
+"""
+_PREACHER_BREAKDOWN_SQL = """
+    WITH v AS (
+        SELECT content_type, language_detected, channel_name, platform
+        FROM videos WHERE preacher_id = ?
+    )
+    SELECT 'content_type', content_type, COUNT(*) FROM v GROUP BY content_type
+    UNION ALL
+    SELECT 'language', language_detected, COUNT(*) FROM v GROUP BY language_detected
+    UNION ALL
+    SELECT * FROM (
+        SELECT 'channel', channel_name, COUNT(*) as count FROM v
+        WHERE content_type IN ('PREACHING', 'UNKNOWN')
+        GROUP BY channel_name
+        ORDER BY count DESC
+        LIMIT 10
+    )
+    UNION ALL
+    SELECT 'platform', COALESCE(platform, 'youtube'), COUNT(*) FROM v
+    WHERE content_type IN ('PREACHING', 'UNKNOWN')
+    GROUP BY COALESCE(platform, 'youtube')
+"""
+
+
+# Single-row inserts shared with their executemany batch variants
+_INSERT_FETCH_LOG_SQL = """
+    INSERT INTO fetch_logs
+    (fetch_timestamp, query_used, videos_found, videos_added,
+     videos_skipped, music_excluded, errors_count, error_messages)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_INSERT_FACE_REFERENCE_SQL = """
+    INSERT INTO preacher_face_references
+    (preacher_id, file_path, original_filename, file_size, uploaded_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
+# Skips URLs that are already stored. The NOT EXISTS guard is used rather
+# than OR IGNORE, which would still burn an AUTOINCREMENT id per skipped row.
+_INSERT_DISCOVERED_CHANNEL_SQL = """
+    INSERT INTO discovered_channels
+    (platform, channel_name, channel_url, page_id, preacher_id, notes, discovered_at)
+    SELECT ?, ?, ?, ?, ?, ?, ?
+    WHERE NOT EXISTS (SELECT 1 FROM discovered_channels WHERE channel_url = ?3)
+"""
+
+
+def _read_frame(conn: sqlite3.Connection, query: str, params: Sequence = ()) -> pd.DataFrame:
+    """
+    Run a query straight into a DataFrame.
+
+    Same result as pd.read_sql_query for sqlite3, without pandas' SQL
+    layer: one execute, one fetchall, one from_records.
+    """
+    cursor = conn.execute(query, params)
+    columns = [col[0] for col in cursor.description]
+    return pd.DataFrame.from_records(cursor.fetchall(), columns=columns, coerce_float=True)
+
+
+def _read_dicts(conn: sqlite3.Connection, query: str, params: Sequence = ()) -> List[Dict[str, Any]]:
+    """
+    Run a query into a list of dicts.
+
+    Rows come back as plain tuples and are zipped with the column names
+    read once from the cursor, skipping the per-row sqlite3.Row.
+    """
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    cursor.execute(query, params)
+    columns = [col[0] for col in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def _build_face_verification_sql() -> Dict[Tuple[bool, Optional[str], bool], str]:
+    """
+    Build every get_video_rows_for_face_verification query up front.
+
+    Keyed by (only_unverified, channel mode, has limit), where channel mode
+    is None, "like" or "fts". Parameters bind in order: channel, then limit.
+    """
+    channel_conditions = {
+        None: None,
+        "like": "channel_name LIKE ?",
+        "fts": "rowid IN (SELECT rowid FROM videos_fts WHERE videos_fts MATCH ?)",
+    }
+    templates = {}
+    for only_unverified in (False, True):
+        for channel_mode, channel_condition in channel_conditions.items():
+            conditions = []
+            if only_unverified:
+                conditions.append("(face_verified = 0 OR face_verified IS NULL)")
+            if channel_condition:
+                conditions.append(channel_condition)
+
+            query = "SELECT * FROM videos"
+            if conditions:
+                query += " WHERE " + " AND ".join(conditions)
+            query += " ORDER BY upload_date DESC"
+
+            templates[(only_unverified, channel_mode, False)] = query
+            templates[(only_unverified, channel_mode, True)] = query + " LIMIT ?"
+    return templates
+
+
+_FACE_VERIFICATION_SQL = _build_face_verification_sql()
+
+
+class _HeldReader:
+    """A pooled reader shared by the open _reader() blocks of one thread."""
+    __slots__ = ("conn", "users")
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.users = 1
+
 
 class Database:
     """
@@ -36,177 +264,744 @@ class Database:
         Args:
             db_path: Path to SQLite database file. Uses config default if None.
         """
-        self.db_path = db_path or DATABASE_CONFIG["db_path"]
+        self.db_path = db_path or DATABASE_CONFIG.db_path
+
+        # One writer connection, serialized by self._lock
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+        # Pool of read-only connections, opened on demand up to the pool size
+        self._readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._reader_count = 0
+        self._max_readers = DATABASE_CONFIG.reader_pool_size or min(os.cpu_count() or 4, 8)
+        self._pool_lock = threading.Lock()
+        self._local = threading.local()
+
+        # Depth of nested transaction() blocks; writes skip their own commit
+        # while one is open. Only touched while holding self._lock.
+        self._tx_depth = 0
+
+        # Set by _ensure_search_index when this SQLite build has FTS5 trigram
+        self._fts_enabled = False
+
         self._ensure_tables()
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Get a database connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
+        """Get the shared writer connection, opening it on first use."""
+        if self._conn is None:
+            # Shared across threads; every use goes through self._lock
+            # isolation_level=None: single-statement writes autocommit
+            # instead of paying for an implicit BEGIN and a separate COMMIT;
+            # multi-statement writes open their own BEGIN IMMEDIATE
+            self._conn = sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                isolation_level=None,
+                cached_statements=DATABASE_CONFIG.cached_statements,
+            )
+            self._conn.row_factory = sqlite3.Row
+            # WAL lets the read-only pool query while the writer commits;
+            # with WAL, synchronous=NORMAL only fsyncs at checkpoints
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA foreign_keys=ON")
+            self._apply_cache_pragmas(self._conn)
+        return self._conn
+
+    def _apply_cache_pragmas(self, conn: sqlite3.Connection):
+        """Size the page cache and mmap window, and keep temp tables in memory."""
+        conn.execute(f"PRAGMA cache_size=-{int(DATABASE_CONFIG.cache_size_kb)}")
+        conn.execute(f"PRAGMA mmap_size={int(DATABASE_CONFIG.mmap_size)}")
+        conn.execute("PRAGMA temp_store=MEMORY")
+
+    def _open_reader(self) -> sqlite3.Connection:
+        """Open a read-only connection for the reader pool."""
+        uri = f"file:{pathname2url(os.path.abspath(self.db_path))}?mode=ro"
+        conn = sqlite3.connect(
+            uri,
+            uri=True,
+            check_same_thread=False,
+            cached_statements=DATABASE_CONFIG.cached_statements,
+        )
         conn.row_factory = sqlite3.Row
+        self._apply_cache_pragmas(conn)
         return conn
 
+    def _acquire_reader(self) -> sqlite3.Connection:
+        """Take an idle reader, open a new one, or wait for one to be released."""
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._pool_lock:
+            if self._reader_count < self._max_readers:
+                self._reader_count += 1
+                open_new = True
+            else:
+                open_new = False
+
+        if open_new:
+            try:
+                return self._open_reader()
+            except Exception:
+                with self._pool_lock:
+                    self._reader_count -= 1
+                raise
+        return self._readers.get()
+
+    def _release_reader(self, conn: sqlite3.Connection):
+        """Return a reader to the pool."""
+        self._readers.put(conn)
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """
+        Hold a read-only connection for one query method.
+
+        Every use on the same thread shares one reader, whether nested
+        (get_statistics calling get_total_preaching_hours) or interleaved
+        (two open row generators), so a full pool cannot deadlock. The
+        reader goes back to the pool when the last of them exits, in
+        whatever order they finish.
+        """
+        if self.db_path == ":memory:":
+            # A private in-memory database is only visible to the writer
+            with self._connection() as conn:
+                yield conn
+            return
+
+        held = getattr(self._local, "reader", None)
+        with self._pool_lock:
+            if held is not None and held.users:
+                held.users += 1
+            else:
+                held = None
+        if held is None:
+            held = self._local.reader = _HeldReader(self._acquire_reader())
+        try:
+            yield held.conn
+        finally:
+            # A suspended generator may be finalized on another thread, so
+            # this only touches the holder (under the pool lock), never
+            # self._local
+            with self._pool_lock:
+                held.users -= 1
+                release = not held.users
+            if release:
+                self._release_reader(held.conn)
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Hold the shared connection for one operation.
+
+        Rolls back an unfinished transaction if the operation fails, so a
+        failed write cannot leak into the next caller's commit.
+        """
+        with self._lock:
+            conn = self._get_connection()
+            try:
+                yield conn
+            except Exception:
+                # Inside transaction() the outer block decides
+                if not self._tx_depth:
+                    conn.rollback()
+                raise
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Group several write methods into one transaction and one commit.
+
+        Write methods called inside the block skip their own commit; the
+        outermost block commits on success and rolls back on error. The
+        writer lock is held for the whole block. Query methods read from the
+        pool, so they do not see the block's writes until it commits.
+
+        Example:
+            with db.transaction():
+                for url in urls:
+                    db.add_discovered_channel(name, url)
+        """
+        with self._lock:
+            conn = self._get_connection()
+            outermost = not self._tx_depth
+            if outermost and not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+
+            self._tx_depth += 1
+            try:
+                yield conn
+            except BaseException:
+                self._tx_depth -= 1
+                if outermost:
+                    conn.rollback()
+                raise
+            self._tx_depth -= 1
+            if outermost:
+                conn.commit()
+
+    def _commit(self, conn: sqlite3.Connection):
+        """Commit, unless a transaction() block will commit for us."""
+        if not self._tx_depth:
+            conn.commit()
+
+    def close(self):
+        """Close the writer and idle readers (reopened automatically on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    # Let SQLite refresh any statistics this connection's
+                    # queries showed to be stale
+                    self._conn.execute("PRAGMA optimize")
+                except sqlite3.Error:
+                    pass
+                self._conn.close()
+                self._conn = None
+
+        while True:
+            try:
+                conn = self._readers.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._pool_lock:
+                self._reader_count -= 1
+
+    def check_search_index(self) -> bool:
+        """
+        Verify videos_fts against videos and rebuild it if they disagree.
+
+        Returns:
+            True if the index was consistent (or FTS is unavailable),
+            False if it had to be rebuilt
+        """
+        if not self._fts_enabled:
+            return True
+
+        with self._connection() as conn:
+            try:
+                # rank=1 also compares the index with the content table
+                conn.execute(
+                    "INSERT INTO videos_fts(videos_fts, rank) VALUES ('integrity-check', 1)"
+                )
+                return True
+            except sqlite3.DatabaseError:
+                conn.execute("INSERT INTO videos_fts(videos_fts) VALUES ('rebuild')")
+                self._commit(conn)
+                return False
+
+    def vacuum(self) -> bool:
+        """
+        Compact the database file, then re-check the search index.
+
+        VACUUM may renumber the rowids videos_fts is keyed on (see
+        _ensure_search_index).
+
+        Returns:
+            False if the search index had to be rebuilt, True otherwise
+        """
+        with self._connection() as conn:
+            conn.execute("VACUUM")
+        return self.check_search_index()
+
+    def __enter__(self) -> "Database":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def _ensure_tables(self):
-        """Create tables if they don't exist."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        """
+        Set up the schema on every open.
 
-        # Videos table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS videos (
-                video_id TEXT PRIMARY KEY,
-                title TEXT NOT NULL,
-                description TEXT,
-                duration INTEGER,
-                upload_date TEXT,
-                view_count INTEGER,
-                like_count INTEGER,
-                thumbnail_url TEXT,
-                channel_name TEXT,
-                channel_id TEXT,
-                channel_url TEXT,
-                video_url TEXT,
-                content_type TEXT DEFAULT 'UNKNOWN',
-                confidence_score REAL DEFAULT 0.0,
-                needs_review INTEGER DEFAULT 1,
-                language_detected TEXT DEFAULT 'UNKNOWN',
-                fetched_at TEXT,
-                search_query_used TEXT
-            )
-        """)
+        Not cached per path: the file may have been deleted or replaced
+        since, and an up-to-date schema costs a single user_version read.
+        """
+        with _SCHEMA_LOCK:
+            self._migrate_schema()
 
-        # Add new columns if they don't exist (for migration)
-        cursor.execute("PRAGMA table_info(videos)")
-        columns = [col[1] for col in cursor.fetchall()]
+    def _migrate_schema(self):
+        """
+        Create tables if they don't exist and migrate older schemas.
 
-        if "face_verified" not in columns:
-            cursor.execute("ALTER TABLE videos ADD COLUMN face_verified INTEGER DEFAULT 0")
+        PRAGMA user_version records the schema version; a database already
+        at SCHEMA_VERSION skips every check below with a single read.
+        """
+        with self._connection() as conn:
+            cursor = conn.cursor()
+
+            cursor.execute("PRAGMA user_version")
+            version = cursor.fetchone()[0]
+            if version < SCHEMA_VERSION:
+                # Take the write lock, then re-read in case another process
+                # migrated in the meantime
+                cursor.execute("BEGIN IMMEDIATE")
+                cursor.execute("PRAGMA user_version")
+                version = cursor.fetchone()[0]
+            if version >= SCHEMA_VERSION:
+                if conn.in_transaction:
+                    conn.commit()
+                self._fts_enabled = self._table_exists(cursor, "videos_fts")
+                return
+
+            new_preacher_id = None
+
+            if version < 1:
+                # Version 1: the baseline schema. Every statement is idempotent
+                # so databases created before versioning are brought up to date.
+
+                # Videos table
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS videos (
+                        video_id TEXT PRIMARY KEY,
+                        title TEXT NOT NULL,
+                        description TEXT,
+                        duration INTEGER,
+                        upload_date TEXT,
+                        view_count INTEGER,
+                        like_count INTEGER,
+                        thumbnail_url TEXT,
+                        channel_name TEXT,
+                        channel_id TEXT,
+                        channel_url TEXT,
+                        video_url TEXT,
+                        content_type TEXT DEFAULT 'UNKNOWN',
+                        confidence_score REAL DEFAULT 0.0,
+                        needs_review INTEGER DEFAULT 1,
+                        language_detected TEXT DEFAULT 'UNKNOWN',
+                        fetched_at TEXT,
+                        search_query_used TEXT
+                    )
+                """)
+
+                # Add new columns if they don't exist (for migration)
+                cursor.execute("PRAGMA table_info(videos)")
+                columns = {col[1] for col in cursor.fetchall()}
+
+                if "face_verified" not in columns:
+                    cursor.execute("ALTER TABLE videos ADD COLUMN face_verified INTEGER DEFAULT 0")
+
+                if "identity_matched" not in columns:
+                    cursor.execute("ALTER TABLE videos ADD COLUMN identity_matched INTEGER DEFAULT 0")
+
+                if "channel_trust_level" not in columns:
+                    cursor.execute("ALTER TABLE videos ADD COLUMN channel_trust_level INTEGER DEFAULT 0")
+
+                if "platform" not in columns:
+                    cursor.execute("ALTER TABLE videos ADD COLUMN platform TEXT DEFAULT 'youtube'")
+
+                # Fetch logs table
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS fetch_logs (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        fetch_timestamp TEXT NOT NULL,
+                        query_used TEXT NOT NULL,
+                        videos_found INTEGER DEFAULT 0,
+                        videos_added INTEGER DEFAULT 0,
+                        videos_skipped INTEGER DEFAULT 0,
+                        music_excluded INTEGER DEFAULT 0,
+                        errors_count INTEGER DEFAULT 0,
+                        error_messages TEXT
+                    )
+                """)
+
+                # Create indexes for common queries. idx_videos_upload_date
+                # answers get_statistics' oldest/newest MIN/MAX over all videos.
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_videos_upload_date
+                    ON videos(upload_date)
+                """)
+                # Composite indexes for the sermon listings: content_type filter
+                # first, then the secondary filter, then the upload_date sort key.
+                # They also cover lookups on content_type alone, and
+                # idx_videos_ct_platform the platform filter.
+                cursor.execute("DROP INDEX IF EXISTS idx_videos_content_type")
+                cursor.execute("DROP INDEX IF EXISTS idx_videos_platform")
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_videos_ct_language
+                    ON videos(content_type, language_detected, upload_date DESC)
+                """)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_videos_ct_platform
+                    ON videos(content_type, platform, upload_date DESC)
+                """)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_videos_channel_name
+                    ON videos(channel_name)
+                """)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_videos_needs_review
+                    ON videos(needs_review)
+                """)
 
-        if "identity_matched" not in columns:
-            cursor.execute("ALTER TABLE videos ADD COLUMN identity_matched INTEGER DEFAULT 0")
+                self._ensure_search_index(cursor)
+                self._ensure_stats_rollup(cursor)
 
-        if "channel_trust_level" not in columns:
-            cursor.execute("ALTER TABLE videos ADD COLUMN channel_trust_level INTEGER DEFAULT 0")
+                # =====================================================================
+                # PREACHERS TABLE (Multi-preacher support)
+                # =====================================================================
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS preachers (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        name TEXT NOT NULL,
+                        aliases TEXT,
+                        title TEXT,
+                        primary_church TEXT,
+                        bio TEXT,
+                        is_active INTEGER DEFAULT 1,
+                        created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                        updated_at TEXT
+                    )
+                """)
+
+                # Preacher face reference photos
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS preacher_face_references (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        preacher_id INTEGER NOT NULL,
+                        file_path TEXT NOT NULL,
+                        original_filename TEXT,
+                        file_size INTEGER,
+                        uploaded_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                        FOREIGN KEY (preacher_id) REFERENCES preachers(id) ON DELETE CASCADE
+                    )
+                """)
+
+                # Add preacher_id to videos table if not exists
+                if "preacher_id" not in columns:
+                    cursor.execute("ALTER TABLE videos ADD COLUMN preacher_id INTEGER")
+
+                # Create index for preacher filtering
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_videos_preacher
+                    ON videos(preacher_id)
+                """)
 
-        if "platform" not in columns:
-            cursor.execute("ALTER TABLE videos ADD COLUMN platform TEXT DEFAULT 'youtube'")
+                # Run migration to set up initial preacher data
+                new_preacher_id = self._migrate_initial_preacher(cursor)
 
-        # Fetch logs table
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS fetch_logs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                fetch_timestamp TEXT NOT NULL,
-                query_used TEXT NOT NULL,
-                videos_found INTEGER DEFAULT 0,
-                videos_added INTEGER DEFAULT 0,
-                videos_skipped INTEGER DEFAULT 0,
-                music_excluded INTEGER DEFAULT 0,
-                errors_count INTEGER DEFAULT 0,
-                error_messages TEXT
-            )
-        """)
+                # =====================================================================
+                # DISCOVERED CHANNELS TABLE (Facebook Agent)
+                # =====================================================================
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS discovered_channels (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        platform TEXT NOT NULL DEFAULT 'facebook',
+                        channel_name TEXT NOT NULL,
+                        channel_url TEXT NOT NULL UNIQUE,
+                        page_id TEXT,
+                        discovered_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                        last_scanned TEXT,
+                        video_count INTEGER DEFAULT 0,
+                        preacher_id INTEGER,
+                        is_active INTEGER DEFAULT 1,
+                        notes TEXT,
+                        FOREIGN KEY (preacher_id) REFERENCES preachers(id)
+                    )
+                """)
+
+                # Create index for discovered channels
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_discovered_channels_platform
+                    ON discovered_channels(platform)
+                """)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_discovered_channels_preacher
+                    ON discovered_channels(preacher_id)
+                """)
+            else:
+                self._fts_enabled = self._table_exists(cursor, "videos_fts")
+
+            if version < 2:
+                # Version 2: preacher-scoped listing and face stats indexes.
+                # idx_videos_preacher is a prefix of the new composite.
+                cursor.execute("DROP INDEX IF EXISTS idx_videos_preacher")
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_videos_preacher_ct_date
+                    ON videos(preacher_id, content_type, upload_date DESC, duration)
+                """)
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_videos_ct_face
+                    ON videos(content_type, face_verified)
+                """)
+                cursor.execute("ANALYZE")
+
+            if version < 3:
+                # Version 3: case-insensitive preacher name lookups
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_preachers_name_nocase
+                    ON preachers(name COLLATE NOCASE)
+                """)
+
+            if version < 4:
+                # Version 4: per-preacher counters for the preacher listings
+                self._ensure_preacher_rollup(cursor)
+
+            if version < 5:
+                # Version 5: the face verification backlog in upload order.
+                # Partial, so it only holds the (few) unverified videos; the
+                # WHERE must match the one in _build_face_verification_sql.
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_videos_unverified_date
+                    ON videos(upload_date DESC)
+                    WHERE face_verified = 0 OR face_verified IS NULL
+                """)
+                cursor.execute("ANALYZE videos")
+
+            if version < 6:
+                # Version 6: the sermon listings' content_type filter as a
+                # partial index in upload order, and the review queue in
+                # confidence order. idx_videos_needs_review is a prefix of
+                # the new review index.
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_videos_sermons_date
+                    ON videos(upload_date DESC)
+                    WHERE content_type IN ('PREACHING', 'UNKNOWN')
+                """)
+                cursor.execute("DROP INDEX IF EXISTS idx_videos_needs_review")
+                cursor.execute("""
+                    CREATE INDEX IF NOT EXISTS idx_videos_review_conf
+                    ON videos(needs_review, confidence_score)
+                """)
+                cursor.execute("ANALYZE videos")
+
+            if version < 7:
+                # Version 7: retire indexes the composites above made redundant.
+                # idx_videos_sermons_date serves the unfiltered sermon listing.
+                cursor.execute("DROP INDEX IF EXISTS idx_videos_platform")
+                cursor.execute("DROP INDEX IF EXISTS idx_videos_ct_date")
+
+            cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.commit()
+
+        # Photo moves run after the schema commit so slow file I/O never
+        # holds the write lock
+        if new_preacher_id is not None:
+            self._migrate_photos_for_preacher(new_preacher_id)
+
+    def _table_exists(self, cursor, name: str) -> bool:
+        """Check whether a table (or virtual table) exists."""
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+        )
+        return cursor.fetchone() is not None
+
+    def _ensure_search_index(self, cursor):
+        """
+        Create the FTS5 trigram index used for substring text search.
+
+        videos_fts is an external-content table over videos, so it stores
+        only the index; triggers keep it in step with every write. Trigram
+        tokens let MATCH answer the same case-insensitive substring queries
+        as LIKE '%x%' without scanning the table.
+
+        The index is keyed on the implicit rowid of videos: video_id is a
+        TEXT primary key, so there is no INTEGER PRIMARY KEY alias, and
+        VACUUM may renumber those rowids. vacuum() rebuilds the index
+        afterwards; a file vacuumed by other tools needs
+        check_search_index().
+        """
+        exists = self._table_exists(cursor, "videos_fts")
+
+        try:
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS videos_fts USING fts5(
+                    title, channel_name, description,
+                    content='videos', content_rowid='rowid', tokenize='trigram'
+                )
+            """)
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5 (or older than 3.34): keep using LIKE
+            return
 
-        # Create indexes for common queries
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_videos_upload_date
-            ON videos(upload_date)
-        """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_videos_content_type
-            ON videos(content_type)
-        """)
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_videos_channel_name
-            ON videos(channel_name)
+            CREATE TRIGGER IF NOT EXISTS videos_fts_insert AFTER INSERT ON videos BEGIN
+                INSERT INTO videos_fts(rowid, title, channel_name, description)
+                VALUES (new.rowid, new.title, new.channel_name, new.description);
+            END
         """)
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_videos_needs_review
-            ON videos(needs_review)
+            CREATE TRIGGER IF NOT EXISTS videos_fts_delete AFTER DELETE ON videos BEGIN
+                INSERT INTO videos_fts(videos_fts, rowid, title, channel_name, description)
+                VALUES ('delete', old.rowid, old.title, old.channel_name, old.description);
+            END
         """)
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_videos_platform
-            ON videos(platform)
+            CREATE TRIGGER IF NOT EXISTS videos_fts_update
+            AFTER UPDATE OF title, channel_name, description ON videos BEGIN
+                INSERT INTO videos_fts(videos_fts, rowid, title, channel_name, description)
+                VALUES ('delete', old.rowid, old.title, old.channel_name, old.description);
+                INSERT INTO videos_fts(rowid, title, channel_name, description)
+                VALUES (new.rowid, new.title, new.channel_name, new.description);
+            END
         """)
 
-        # =====================================================================
-        # PREACHERS TABLE (Multi-preacher support)
-        # =====================================================================
+        if not exists:
+            # Index the rows that were there before the table existed
+            cursor.execute("INSERT INTO videos_fts(videos_fts) VALUES ('rebuild')")
+
+        self._fts_enabled = True
+
+    def _ensure_stats_rollup(self, cursor):
+        """
+        Create videos_stats, a roll-up of videos kept current by triggers.
+
+        One row per (content_type, language_detected, platform, review)
+        group holds the video count, the summed duration and how many of
+        those durations were known, so the dashboard statistics read a
+        handful of rows instead of scanning videos. NULL keys are stored
+        as '' so they take part in the upsert conflict target.
+        """
+        exists = self._table_exists(cursor, "videos_stats")
+
         cursor.execute("""
-            CREATE TABLE IF NOT EXISTS preachers (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                aliases TEXT,
-                title TEXT,
-                primary_church TEXT,
-                bio TEXT,
-                is_active INTEGER DEFAULT 1,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                updated_at TEXT
+            CREATE TABLE IF NOT EXISTS videos_stats (
+                content_type TEXT NOT NULL,
+                language_detected TEXT NOT NULL,
+                platform TEXT NOT NULL,
+                review INTEGER NOT NULL,
+                cnt INTEGER NOT NULL DEFAULT 0,
+                dur INTEGER NOT NULL DEFAULT 0,
+                timed INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (content_type, language_detected, platform, review)
             )
         """)
 
-        # Preacher face reference photos
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS preacher_face_references (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                preacher_id INTEGER NOT NULL,
-                file_path TEXT NOT NULL,
-                original_filename TEXT,
-                file_size INTEGER,
-                uploaded_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (preacher_id) REFERENCES preachers(id) ON DELETE CASCADE
+        add_new = """
+            INSERT INTO videos_stats
+                (content_type, language_detected, platform, review, cnt, dur, timed)
+            VALUES (
+                IFNULL(new.content_type, ''), IFNULL(new.language_detected, ''),
+                IFNULL(new.platform, ''), IFNULL(new.needs_review = 1, 0),
+                1, IFNULL(new.duration, 0), new.duration IS NOT NULL
             )
+            ON CONFLICT (content_type, language_detected, platform, review) DO UPDATE SET
+                cnt = cnt + 1, dur = dur + excluded.dur, timed = timed + excluded.timed;
+        """
+        remove_old = """
+            UPDATE videos_stats SET
+                cnt = cnt - 1,
+                dur = dur - IFNULL(old.duration, 0),
+                timed = timed - (old.duration IS NOT NULL)
+            WHERE content_type = IFNULL(old.content_type, '')
+            AND language_detected = IFNULL(old.language_detected, '')
+            AND platform = IFNULL(old.platform, '')
+            AND review = IFNULL(old.needs_review = 1, 0);
+        """
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS videos_stats_insert AFTER INSERT ON videos BEGIN
+                {add_new}
+            END
         """)
-
-        # Add preacher_id to videos table if not exists
-        if "preacher_id" not in columns:
-            cursor.execute("ALTER TABLE videos ADD COLUMN preacher_id INTEGER")
-
-        # Create index for preacher filtering
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_videos_preacher
-            ON videos(preacher_id)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS videos_stats_delete AFTER DELETE ON videos BEGIN
+                {remove_old}
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS videos_stats_update
+            AFTER UPDATE OF content_type, language_detected, platform, needs_review, duration
+            ON videos BEGIN
+                {remove_old}
+                {add_new}
+            END
         """)
 
-        # Run migration to set up initial preacher data
-        self._migrate_initial_preacher(cursor)
+        if not exists:
+            cursor.execute("""
+                INSERT INTO videos_stats
+                    (content_type, language_detected, platform, review, cnt, dur, timed)
+                SELECT
+                    IFNULL(content_type, ''), IFNULL(language_detected, ''),
+                    IFNULL(platform, ''), IFNULL(needs_review = 1, 0),
+                    COUNT(*), IFNULL(SUM(duration), 0), COUNT(duration)
+                FROM videos
+                GROUP BY 1, 2, 3, 4
+            """)
+
+    def _ensure_preacher_rollup(self, cursor):
+        """
+        Create preacher_stats, per-preacher counters kept current by triggers.
+
+        Only videos that count towards a preacher's totals are included:
+        those assigned to a preacher with content type PREACHING or UNKNOWN.
+        cnt is the number of such videos and dur their summed duration.
+        """
+        exists = self._table_exists(cursor, "preacher_stats")
 
-        # =====================================================================
-        # DISCOVERED CHANNELS TABLE (Facebook Agent)
-        # =====================================================================
         cursor.execute("""
-            CREATE TABLE IF NOT EXISTS discovered_channels (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                platform TEXT NOT NULL DEFAULT 'facebook',
-                channel_name TEXT NOT NULL,
-                channel_url TEXT NOT NULL UNIQUE,
-                page_id TEXT,
-                discovered_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                last_scanned TEXT,
-                video_count INTEGER DEFAULT 0,
-                preacher_id INTEGER,
-                is_active INTEGER DEFAULT 1,
-                notes TEXT,
-                FOREIGN KEY (preacher_id) REFERENCES preachers(id)
+            CREATE TABLE IF NOT EXISTS preacher_stats (
+                preacher_id INTEGER PRIMARY KEY,
+                cnt INTEGER NOT NULL DEFAULT 0,
+                dur INTEGER NOT NULL DEFAULT 0
             )
         """)
 
-        # Create index for discovered channels
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_discovered_channels_platform
-            ON discovered_channels(platform)
+        add_new = """
+            INSERT INTO preacher_stats (preacher_id, cnt, dur)
+            SELECT new.preacher_id, 1, IFNULL(new.duration, 0)
+            WHERE new.preacher_id IS NOT NULL
+            AND new.content_type IN ('PREACHING', 'UNKNOWN')
+            ON CONFLICT (preacher_id) DO UPDATE SET
+                cnt = cnt + 1, dur = dur + excluded.dur;
+        """
+        remove_old = """
+            UPDATE preacher_stats SET
+                cnt = cnt - 1,
+                dur = dur - IFNULL(old.duration, 0)
+            WHERE preacher_id = old.preacher_id
+            AND old.content_type IN ('PREACHING', 'UNKNOWN');
+        """
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS preacher_stats_insert AFTER INSERT ON videos BEGIN
+                {add_new}
+            END
         """)
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_discovered_channels_preacher
-            ON discovered_channels(preacher_id)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS preacher_stats_delete AFTER DELETE ON videos BEGIN
+                {remove_old}
+            END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS preacher_stats_update
+            AFTER UPDATE OF preacher_id, content_type, duration ON videos BEGIN
+                {remove_old}
+                {add_new}
+            END
         """)
 
-        conn.commit()
-        conn.close()
+        if not exists:
+            cursor.execute("""
+                INSERT INTO preacher_stats (preacher_id, cnt, dur)
+                SELECT preacher_id, COUNT(*), IFNULL(SUM(duration), 0)
+                FROM videos
+                WHERE preacher_id IS NOT NULL
+                AND content_type IN ('PREACHING', 'UNKNOWN')
+                GROUP BY preacher_id
+            """)
+
+    def _fts_phrase(self, column: str, text: str) -> Optional[str]:
+        """
+        Build an FTS5 MATCH expression for a substring search on one column.
 
-    def _migrate_initial_preacher(self, cursor):
+        Returns None when the index can't answer the query (FTS5 unavailable,
+        or fewer than 3 characters, which trigram can't match).
+        """
+        if not self._fts_enabled or len(text) < 3:
+            return None
+        quoted = text.replace('"', '""')
+        return f'{column} : "{quoted}"'
+
+    def _migrate_initial_preacher(self, cursor) -> Optional[int]:
         """
         Migration: Create initial preacher (Apostle Narcisse Majila) if not exists.
-        Assigns existing videos and photos to preacher_id=1.
+        Assigns existing videos to preacher_id=1.
+
+        Returns:
+            ID of the newly created preacher, or None if preachers already
+            existed. The caller migrates that preacher's photos.
         """
         # Check if preachers table is empty
         cursor.execute("SELECT COUNT(*) as count FROM preachers")
@@ -248,26 +1043,28 @@ class Database:
             if updated_count > 0:
                 print(f"Assigned {updated_count} existing videos to preacher_id={preacher_id}")
 
-            # Migrate existing photos to preacher-specific directory
-            self._migrate_photos_for_preacher(cursor, preacher_id)
+            return preacher_id
 
-    def _migrate_photos_for_preacher(self, cursor, preacher_id: int):
+        return None
+
+    def _migrate_photos_for_preacher(self, preacher_id: int):
         """Migrate existing photos from photos/ to photos/preacher_{id}/"""
-        # Get project root directory
-        module_dir = os.path.dirname(os.path.abspath(__file__))
-        project_dir = os.path.dirname(module_dir)
-        old_photos_dir = os.path.join(project_dir, "photos")
-        new_photos_dir = os.path.join(project_dir, "photos", f"preacher_{preacher_id}")
+        old_photos_dir = PHOTOS_DIR
+        new_photos_dir = os.path.join(PHOTOS_DIR, f"preacher_{preacher_id}")
 
         # Check if old photos directory exists and has photos
         if not os.path.isdir(old_photos_dir):
             return
 
-        # Find existing photos (not in subdirectories)
-        photo_patterns = ['*.jpg', '*.jpeg', '*.png', '*.JPG', '*.JPEG', '*.PNG']
-        existing_photos = []
-        for pattern in photo_patterns:
-            existing_photos.extend(glob.glob(os.path.join(old_photos_dir, pattern)))
+        # Find existing photos (not in subdirectories) in one directory pass;
+        # DirEntry caches the stat, and a move keeps the size
+        with os.scandir(old_photos_dir) as entries:
+            existing_photos = [
+                entry for entry in entries
+                if entry.is_file()
+                and not entry.name.startswith(".")
+                and entry.name.lower().endswith((".jpg", ".jpeg", ".png"))
+            ]
 
         if not existing_photos:
             return
@@ -275,34 +1072,32 @@ class Database:
         # Create preacher-specific directory
         os.makedirs(new_photos_dir, exist_ok=True)
 
-        # Move photos and create database records
-        for photo_path in existing_photos:
-            filename = os.path.basename(photo_path)
-            new_path = os.path.join(new_photos_dir, filename)
-
-            try:
-                # Move the file
-                shutil.move(photo_path, new_path)
+        def move_photo(entry: os.DirEntry) -> Tuple[str, int]:
+            new_path = os.path.join(new_photos_dir, entry.name)
+            file_size = entry.stat().st_size
+            shutil.move(entry.path, new_path)
+            return new_path, file_size
+
+        # Move every photo first (in parallel, which helps cross-device
+        # copies), with no transaction open
+        references = []
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                executor.submit(move_photo, entry): entry for entry in existing_photos
+            }
+            for future in as_completed(futures):
+                entry = futures[future]
+                try:
+                    new_path, file_size = future.result()
+                except Exception as e:
+                    print(f"Error migrating photo {entry.name}: {e}")
+                    continue
 
-                # Get file size
-                file_size = os.path.getsize(new_path)
+                references.append((preacher_id, new_path, entry.name, file_size))
+                print(f"Migrated photo: {entry.name} -> preacher_{preacher_id}/")
 
-                # Insert into database
-                cursor.execute("""
-                    INSERT INTO preacher_face_references
-                    (preacher_id, file_path, original_filename, file_size, uploaded_at)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
-                    preacher_id,
-                    new_path,
-                    filename,
-                    file_size,
-                    datetime.now().isoformat()
-                ))
-
-                print(f"Migrated photo: {filename} -> preacher_{preacher_id}/")
-            except Exception as e:
-                print(f"Error migrating photo {filename}: {e}")
+        # Then record them all in one short write transaction
+        self.add_face_references_many(references)
 
     # =========================================================================
     # VIDEO OPERATIONS
@@ -310,11 +1105,10 @@ class Database:
 
     def video_exists(self, video_id: str) -> bool:
         """Check if a video already exists in the database."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT 1 FROM videos WHERE video_id = ?", (video_id,))
-        result = cursor.fetchone()
-        conn.close()
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1 FROM videos WHERE video_id = ?", (video_id,))
+            result = cursor.fetchone()
         return result is not None
 
     def insert_video(self, video: VideoMetadata) -> bool:
@@ -327,28 +1121,15 @@ class Database:
         Returns:
             True if inserted, False if duplicate
         """
-        if self.video_exists(video.video_id):
-            return False
-
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        data = video.to_dict()
-        columns = ", ".join(data.keys())
-        placeholders = ", ".join(["?" for _ in data])
-
-        cursor.execute(
-            f"INSERT INTO videos ({columns}) VALUES ({placeholders})",
-            list(data.values())
-        )
-
-        conn.commit()
-        conn.close()
-        return True
+        # The primary key does the duplicate check in the same statement
+        with self._connection() as conn:
+            cursor = conn.execute(_INSERT_OR_IGNORE_VIDEO_SQL, video.to_tuple())
+            self._commit(conn)
+        return cursor.rowcount == 1
 
     def insert_videos_batch(self, videos: List[VideoMetadata]) -> Tuple[int, int]:
         """
-        Insert multiple videos, skipping duplicates.
+        Insert multiple videos in one transaction, skipping duplicates.
 
         Args:
             videos: List of VideoMetadata objects
@@ -356,52 +1137,66 @@ class Database:
         Returns:
             Tuple of (inserted_count, skipped_count)
         """
-        inserted = 0
-        skipped = 0
-
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        for video in videos:
-            if self.video_exists(video.video_id):
-                skipped += 1
-                continue
-
-            data = video.to_dict()
-            columns = ", ".join(data.keys())
-            placeholders = ", ".join(["?" for _ in data])
-
-            try:
-                cursor.execute(
-                    f"INSERT INTO videos ({columns}) VALUES ({placeholders})",
-                    list(data.values())
-                )
-                inserted += 1
-            except sqlite3.IntegrityError:
-                skipped += 1
-
-        conn.commit()
-        conn.close()
-        return inserted, skipped
+        if not videos:
+            return 0, 0
+
+        # One write transaction for the whole batch; the primary key dedupes.
+        # Rows go in _BATCH_INSERT_ROWS at a time, one statement per chunk,
+        # which runs much faster than one executemany step per row.
+        with self._connection() as conn:
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            cursor = conn.cursor()
+            inserted = 0
+            for start in range(0, len(videos), _BATCH_INSERT_ROWS):
+                chunk = videos[start:start + _BATCH_INSERT_ROWS]
+                params = [value for video in chunk for value in video.to_tuple()]
+                cursor.execute(_insert_videos_sql(len(chunk)), params)
+                inserted += cursor.rowcount
+            self._commit(conn)
+
+            if inserted >= _ANALYZE_AFTER_ROWS and not self._tx_depth:
+                # A bulk import can shift the index statistics the planner
+                # uses for the content_type / preacher_id composites
+                conn.execute("ANALYZE videos")
+
+        return inserted, len(videos) - inserted
 
     def update_video(self, video: VideoMetadata) -> bool:
         """Update an existing video's metadata."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        row = video.to_tuple()
 
-        data = video.to_dict()
-        video_id = data.pop("video_id")
+        with self._connection() as conn:
+            cursor = conn.execute(_UPDATE_VIDEO_SQL, row[1:] + row[:1])
+            self._commit(conn)
+            affected = cursor.rowcount
+        return affected > 0
 
-        set_clause = ", ".join([f"{k} = ?" for k in data.keys()])
+    def update_video_fields(self, video_id: str, fields: Dict[str, Any]) -> bool:
+        """
+        Update only the given columns of a video.
 
-        cursor.execute(
-            f"UPDATE videos SET {set_clause} WHERE video_id = ?",
-            list(data.values()) + [video_id]
-        )
+        Args:
+            video_id: The video to update
+            fields: Column name -> new value; names must be videos columns
 
-        conn.commit()
-        affected = cursor.rowcount
-        conn.close()
+        Returns:
+            True if the video was updated
+        """
+        unknown = set(fields) - set(_VIDEO_COLUMNS[1:])
+        if unknown:
+            raise ValueError(f"Unknown video columns: {', '.join(sorted(unknown))}")
+        if not fields:
+            return False
+
+        set_clause = ", ".join(f"{col} = ?" for col in fields)
+        with self._connection() as conn:
+            cursor = conn.execute(
+                f"UPDATE videos SET {set_clause} WHERE video_id = ?",
+                (*fields.values(), video_id),
+            )
+            self._commit(conn)
+            affected = cursor.rowcount
         return affected > 0
 
     def mark_as_reviewed(
@@ -417,29 +1212,27 @@ class Database:
         Returns:
             True if updated successfully
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._connection() as conn:
+            cursor = conn.cursor()
 
-        cursor.execute(
-            """UPDATE videos
-               SET content_type = ?, needs_review = 0, confidence_score = 1.0
-               WHERE video_id = ?""",
-            (content_type.value, video_id)
-        )
+            cursor.execute(
+                """UPDATE videos
+                   SET content_type = ?, needs_review = 0, confidence_score = 1.0
+                   WHERE video_id = ?""",
+                (content_type.value, video_id)
+            )
 
-        conn.commit()
-        affected = cursor.rowcount
-        conn.close()
+            self._commit(conn)
+            affected = cursor.rowcount
         return affected > 0
 
     def delete_video(self, video_id: str) -> bool:
         """Delete a video from the database."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM videos WHERE video_id = ?", (video_id,))
-        conn.commit()
-        affected = cursor.rowcount
-        conn.close()
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM videos WHERE video_id = ?", (video_id,))
+            self._commit(conn)
+            affected = cursor.rowcount
         return affected > 0
 
     def delete_short_videos(self, max_duration: int = 600) -> int:
@@ -452,12 +1245,11 @@ class Database:
         Returns:
             Number of videos deleted
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM videos WHERE duration < ?", (max_duration,))
-        conn.commit()
-        affected = cursor.rowcount
-        conn.close()
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM videos WHERE duration < ?", (max_duration,))
+            self._commit(conn)
+            affected = cursor.rowcount
         return affected
 
     def delete_low_confidence_videos(self, min_confidence: float = 0.50) -> int:
@@ -470,15 +1262,14 @@ class Database:
         Returns:
             Number of videos deleted
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "DELETE FROM videos WHERE confidence_score < ?",
-            (min_confidence,)
-        )
-        conn.commit()
-        affected = cursor.rowcount
-        conn.close()
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "DELETE FROM videos WHERE confidence_score < ?",
+                (min_confidence,)
+            )
+            self._commit(conn)
+            affected = cursor.rowcount
         return affected
 
     def update_video_classification(
@@ -504,114 +1295,192 @@ class Database:
         Returns:
             True if video was updated
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """UPDATE videos SET
-                content_type = ?,
-                confidence_score = ?,
-                needs_review = ?,
-                identity_matched = ?,
-                channel_trust_level = ?
-               WHERE video_id = ?""",
-            (
-                content_type.value if hasattr(content_type, 'value') else str(content_type),
-                confidence_score,
-                1 if needs_review else 0,
-                1 if identity_matched else 0,
-                channel_trust_level,
-                video_id
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """UPDATE videos SET
+                    content_type = ?,
+                    confidence_score = ?,
+                    needs_review = ?,
+                    identity_matched = ?,
+                    channel_trust_level = ?
+                   WHERE video_id = ?""",
+                (
+                    content_type.value if hasattr(content_type, 'value') else str(content_type),
+                    confidence_score,
+                    1 if needs_review else 0,
+                    1 if identity_matched else 0,
+                    channel_trust_level,
+                    video_id
+                )
             )
-        )
-        conn.commit()
-        affected = cursor.rowcount
-        conn.close()
+            self._commit(conn)
+            affected = cursor.rowcount
         return affected > 0
 
     # =========================================================================
     # QUERY METHODS
     # =========================================================================
 
-    def get_all_sermons(self) -> pd.DataFrame:
+    def _select_videos(
+        self,
+        where: str,
+        params: tuple,
+        columns: Optional[Sequence[str]] = None,
+        chunksize: Optional[int] = None,
+        alias: str = "",
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """
+        Run a SELECT over videos into a DataFrame, or stream it in chunks.
+
+        Args:
+            where: Everything after the FROM table (joins, WHERE, ORDER BY)
+            params: Parameters for the placeholders in where
+            columns: Video columns to select (all columns if None)
+            chunksize: If set, return an iterator of DataFrames of this many
+                rows. A reader connection stays checked out until the
+                iterator is exhausted or closed.
+            alias: Table alias used in where, if any
+
+        Raises:
+            ValueError: If a requested column is not a video column
+        """
+        prefix = f"{alias}." if alias else ""
+        if columns is None:
+            select_list = f"{prefix}*"
+        else:
+            unknown = [col for col in columns if col not in _VIDEO_COLUMNS]
+            if unknown:
+                raise ValueError(f"Unknown video columns: {', '.join(unknown)}")
+            select_list = ", ".join(f"{prefix}{col}" for col in columns)
+
+        table = f"videos {alias}" if alias else "videos"
+        query = f"SELECT {select_list} FROM {table} {where}"
+
+        if chunksize is None:
+            with self._reader() as conn:
+                return _read_frame(conn, query, params)
+        return self._stream_videos(query, params, chunksize)
+
+    def _stream_videos(
+        self, query: str, params: tuple, chunksize: int
+    ) -> Iterator[pd.DataFrame]:
+        """Yield query results in DataFrame chunks while holding one reader."""
+        with self._reader() as conn:
+            yield from pd.read_sql_query(query, conn, params=params, chunksize=chunksize)
+
+    def get_all_sermons(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        chunksize: Optional[int] = None,
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         """
         Get all preaching videos as a DataFrame.
 
+        Args:
+            columns: Video columns to load (all columns if None)
+            chunksize: If set, stream the result as DataFrames of this many rows
+
         Returns:
-            DataFrame with all PREACHING and UNKNOWN content types
+            DataFrame with all PREACHING and UNKNOWN content types,
+            or an iterator of DataFrames when chunksize is set
         """
-        conn = self._get_connection()
-        df = pd.read_sql_query(
-            """SELECT * FROM videos
-               WHERE content_type IN ('PREACHING', 'UNKNOWN')
+        return self._select_videos(
+            """WHERE content_type IN ('PREACHING', 'UNKNOWN')
                ORDER BY upload_date DESC""",
-            conn
+            (),
+            columns,
+            chunksize,
         )
-        conn.close()
-        return df
 
-    def get_sermons_by_channel(self, channel_name: str) -> pd.DataFrame:
+    def get_sermons_by_channel(
+        self,
+        channel_name: str,
+        columns: Optional[Sequence[str]] = None,
+        chunksize: Optional[int] = None,
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         """Get sermons from a specific channel."""
-        conn = self._get_connection()
-        df = pd.read_sql_query(
-            """SELECT * FROM videos
-               WHERE channel_name LIKE ?
-               AND content_type IN ('PREACHING', 'UNKNOWN')
-               ORDER BY upload_date DESC""",
-            conn,
-            params=(f"%{channel_name}%",)
+        match = self._fts_phrase("channel_name", channel_name)
+
+        if match is None:
+            return self._select_videos(
+                """WHERE channel_name LIKE ?
+                   AND content_type IN ('PREACHING', 'UNKNOWN')
+                   ORDER BY upload_date DESC""",
+                (f"%{channel_name}%",),
+                columns,
+                chunksize,
+            )
+        return self._select_videos(
+            """JOIN videos_fts f ON f.rowid = v.rowid
+               WHERE videos_fts MATCH ?
+               AND v.content_type IN ('PREACHING', 'UNKNOWN')
+               ORDER BY v.upload_date DESC""",
+            (match,),
+            columns,
+            chunksize,
+            alias="v",
         )
-        conn.close()
-        return df
 
-    def get_sermons_by_year(self, year: int) -> pd.DataFrame:
+    def get_sermons_by_year(
+        self,
+        year: int,
+        columns: Optional[Sequence[str]] = None,
+        chunksize: Optional[int] = None,
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         """Get sermons from a specific year."""
-        conn = self._get_connection()
-        df = pd.read_sql_query(
-            """SELECT * FROM videos
-               WHERE upload_date LIKE ?
+        # Range on the year prefix of upload_date instead of LIKE 'YYYY%' so
+        # idx_videos_sermons_date can seek to the year. yt-dlp stores
+        # YYYYMMDD; YYYY-MM-DD values fall in the same bounds.
+        return self._select_videos(
+            """WHERE upload_date >= ? AND upload_date < ?
                AND content_type IN ('PREACHING', 'UNKNOWN')
                ORDER BY upload_date DESC""",
-            conn,
-            params=(f"{year}%",)
+            (str(year), str(year + 1)),
+            columns,
+            chunksize,
         )
-        conn.close()
-        return df
 
-    def get_sermons_by_language(self, lang: str) -> pd.DataFrame:
+    def get_sermons_by_language(
+        self,
+        lang: str,
+        columns: Optional[Sequence[str]] = None,
+        chunksize: Optional[int] = None,
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         """Get sermons by detected language (FR or EN)."""
-        conn = self._get_connection()
-        df = pd.read_sql_query(
-            """SELECT * FROM videos
-               WHERE language_detected = ?
+        return self._select_videos(
+            """WHERE language_detected = ?
                AND content_type IN ('PREACHING', 'UNKNOWN')
                ORDER BY upload_date DESC""",
-            conn,
-            params=(lang.upper(),)
+            (lang.upper(),),
+            columns,
+            chunksize,
         )
-        conn.close()
-        return df
 
-    def get_review_queue(self) -> pd.DataFrame:
-        """Get videos that need manual review."""
-        conn = self._get_connection()
-        df = pd.read_sql_query(
-            """SELECT video_id, title, channel_name, duration,
-                      content_type, confidence_score, video_url
-               FROM videos
-               WHERE needs_review = 1
+    def get_review_queue(
+        self, chunksize: Optional[int] = None
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """
+        Get videos that need manual review.
+
+        Args:
+            chunksize: If set, stream the queue as DataFrames of this many rows
+        """
+        return self._select_videos(
+            """WHERE needs_review = 1
                ORDER BY confidence_score ASC""",
-            conn
+            (),
+            ("video_id", "title", "channel_name", "duration",
+             "content_type", "confidence_score", "video_url"),
+            chunksize,
         )
-        conn.close()
-        return df
 
     def get_video_by_id(self, video_id: str) -> Optional[VideoMetadata]:
         """Get a single video by ID."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM videos WHERE video_id = ?", (video_id,))
-        row = cursor.fetchone()
-        conn.close()
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM videos WHERE video_id = ?", (video_id,))
+            row = cursor.fetchone()
 
         if row:
             return VideoMetadata.from_dict(dict(row))
@@ -623,242 +1492,266 @@ class Database:
 
     def get_total_preaching_hours(self) -> float:
         """Get total duration of all preaching videos in hours."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """SELECT SUM(duration) as total
-               FROM videos
-               WHERE content_type IN ('PREACHING', 'UNKNOWN')
-               AND duration IS NOT NULL"""
-        )
-        result = cursor.fetchone()
-        conn.close()
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """SELECT SUM(dur) as total
+                   FROM videos_stats
+                   WHERE content_type IN ('PREACHING', 'UNKNOWN')"""
+            )
+            result = cursor.fetchone()
 
         if result and result["total"]:
             return result["total"] / 3600  # Convert seconds to hours
         return 0.0
 
-    def get_channel_breakdown(self) -> List[Tuple[str, int]]:
-        """Get count of videos per channel."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """SELECT channel_name, COUNT(*) as count
-               FROM videos
-               WHERE content_type IN ('PREACHING', 'UNKNOWN')
-               GROUP BY channel_name
-               ORDER BY count DESC"""
-        )
-        results = cursor.fetchall()
-        conn.close()
-        return [(row["channel_name"], row["count"]) for row in results]
-
-    def get_statistics(self) -> dict:
-        """Get comprehensive database statistics."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        stats = {}
+    def iter_channel_breakdown(
+        self, batch_size: int = 4096, limit: Optional[int] = None
+    ) -> Iterator[Tuple[str, int]]:
+        """
+        Yield (channel, video count) pairs, busiest channel first.
 
-        # Total videos
-        cursor.execute("SELECT COUNT(*) as count FROM videos")
-        stats["total_videos"] = cursor.fetchone()["count"]
+        Rows are fetched batch_size at a time; a reader connection stays
+        checked out until the iterator is exhausted or closed.
 
-        # By content type
-        cursor.execute(
-            """SELECT content_type, COUNT(*) as count
-               FROM videos GROUP BY content_type"""
-        )
-        stats["by_content_type"] = {
-            row["content_type"]: row["count"] for row in cursor.fetchall()
-        }
+        Args:
+            batch_size: Rows fetched from SQLite per round trip
+            limit: Optional max number of channels (top N only)
+        """
+        with self._reader() as conn:
+            # LIMIT -1 means no limit, so every call shares one statement
+            cursor = conn.execute(
+                """SELECT channel_name, COUNT(*) as count
+                   FROM videos
+                   WHERE content_type IN ('PREACHING', 'UNKNOWN')
+                   GROUP BY channel_name
+                   ORDER BY count DESC
+                   LIMIT ?""",
+                (limit if limit is not None else -1,)
+            )
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from ((row["channel_name"], row["count"]) for row in rows)
 
-        # By language
-        cursor.execute(
-            """SELECT language_detected, COUNT(*) as count
-               FROM videos GROUP BY language_detected"""
-        )
-        stats["by_language"] = {
-            row["language_detected"]: row["count"] for row in cursor.fetchall()
-        }
+    def get_channel_breakdown(self, limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """Get count of videos per channel (the top `limit` channels if given)."""
+        return list(self.iter_channel_breakdown(limit=limit))
 
-        # Needs review count
-        cursor.execute(
-            "SELECT COUNT(*) as count FROM videos WHERE needs_review = 1"
-        )
-        stats["needs_review"] = cursor.fetchone()["count"]
+    def get_statistics(self) -> dict:
+        """Get comprehensive database statistics."""
+        with self._reader() as conn:
+            cursor = conn.cursor()
 
-        # Unique channels
-        cursor.execute("SELECT COUNT(DISTINCT channel_name) as count FROM videos")
-        stats["unique_channels"] = cursor.fetchone()["count"]
+            # One round trip: each branch tags its rows with the stat it feeds
+            cursor.execute(_STATISTICS_SQL)
+            rows = cursor.fetchall()
 
-        # Date range
-        cursor.execute(
-            """SELECT MIN(upload_date) as oldest, MAX(upload_date) as newest
-               FROM videos WHERE upload_date IS NOT NULL"""
-        )
-        row = cursor.fetchone()
-        stats["oldest_video"] = row["oldest"]
-        stats["newest_video"] = row["newest"]
+            stats = {"total_videos": 0, "by_content_type": {}, "by_language": {}}
+            for kind, key, value in rows:
+                if kind == "content_type":
+                    stats["by_content_type"][key] = value
+                elif kind == "language":
+                    stats["by_language"][key] = value
+                else:
+                    stats[kind] = value
 
-        # Total hours
-        stats["total_hours"] = self.get_total_preaching_hours()
+            # Total hours
+            preaching_seconds = stats.pop("preaching_seconds")
+            stats["total_hours"] = preaching_seconds / 3600 if preaching_seconds else 0.0
 
-        # Top channels
-        stats["top_channels"] = self.get_channel_breakdown()[:10]
+            # Top channels
+            stats["top_channels"] = self.get_channel_breakdown(limit=10)
 
-        conn.close()
         return stats
 
     def get_date_range(self) -> Tuple[Optional[str], Optional[str]]:
         """Get oldest and newest video dates."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """SELECT MIN(upload_date) as oldest, MAX(upload_date) as newest
-               FROM videos
-               WHERE upload_date IS NOT NULL
-               AND content_type IN ('PREACHING', 'UNKNOWN')"""
-        )
-        row = cursor.fetchone()
-        conn.close()
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """SELECT MIN(upload_date) as oldest, MAX(upload_date) as newest
+                   FROM videos
+                   WHERE upload_date IS NOT NULL
+                   AND content_type IN ('PREACHING', 'UNKNOWN')"""
+            )
+            row = cursor.fetchone()
         return row["oldest"], row["newest"]
 
     def get_unique_channels_count(self) -> int:
         """Get count of unique channels."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """SELECT COUNT(DISTINCT channel_name) as count
-               FROM videos
-               WHERE content_type IN ('PREACHING', 'UNKNOWN')"""
-        )
-        result = cursor.fetchone()["count"]
-        conn.close()
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(
+                """SELECT COUNT(DISTINCT channel_name) as count
+                   FROM videos
+                   WHERE content_type IN ('PREACHING', 'UNKNOWN')"""
+            )
+            result = cursor.fetchone()[0]
         return result
 
     def get_review_count(self) -> int:
         """Get count of videos needing review."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT COUNT(*) as count FROM videos WHERE needs_review = 1"
-        )
-        result = cursor.fetchone()["count"]
-        conn.close()
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(
+                "SELECT COUNT(*) as count FROM videos WHERE needs_review = 1"
+            )
+            result = cursor.fetchone()[0]
         return result
 
     # =========================================================================
     # PLATFORM-SPECIFIC METHODS
     # =========================================================================
 
-    def get_sermons_by_platform(self, platform: str) -> pd.DataFrame:
+    def get_sermons_by_platform(
+        self,
+        platform: str,
+        columns: Optional[Sequence[str]] = None,
+        chunksize: Optional[int] = None,
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         """Get sermons from a specific platform (youtube or facebook)."""
-        conn = self._get_connection()
-        df = pd.read_sql_query(
-            """SELECT * FROM videos
-               WHERE (platform = ? OR (platform IS NULL AND ? = 'youtube'))
+        # Legacy rows without a platform are YouTube videos. Only add the
+        # IS NULL branch when it can match, so other platforms seek on
+        # idx_videos_ct_platform.
+        if platform == "youtube":
+            platform_clause = "(platform = ? OR platform IS NULL)"
+        else:
+            platform_clause = "platform = ?"
+
+        return self._select_videos(
+            f"""WHERE {platform_clause}
                AND content_type IN ('PREACHING', 'UNKNOWN')
                ORDER BY upload_date DESC""",
-            conn,
-            params=(platform, platform)
+            (platform,),
+            columns,
+            chunksize,
         )
-        conn.close()
-        return df
 
     def get_platform_statistics(self) -> dict:
         """Get video count breakdown by platform."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._reader() as conn:
+            cursor = conn.cursor()
 
-        stats = {}
+            stats = {}
 
-        # Count by platform
-        cursor.execute(
-            """SELECT
-                COALESCE(platform, 'youtube') as platform,
-                COUNT(*) as count
-               FROM videos
-               WHERE content_type IN ('PREACHING', 'UNKNOWN')
-               GROUP BY COALESCE(platform, 'youtube')"""
-        )
-        for row in cursor.fetchall():
-            stats[row["platform"]] = row["count"]
+            # Count by platform
+            cursor.execute(
+                """SELECT
+                    COALESCE(NULLIF(platform, ''), 'youtube') as platform,
+                    SUM(cnt) as count
+                   FROM videos_stats
+                   WHERE content_type IN ('PREACHING', 'UNKNOWN')
+                   GROUP BY 1
+                   HAVING SUM(cnt) > 0"""
+            )
+            for row in cursor.fetchall():
+                stats[row["platform"]] = row["count"]
 
-        # Total hours by platform
-        cursor.execute(
-            """SELECT
-                COALESCE(platform, 'youtube') as platform,
-                SUM(duration) / 3600.0 as hours
-               FROM videos
-               WHERE content_type IN ('PREACHING', 'UNKNOWN')
-               AND duration IS NOT NULL
-               GROUP BY COALESCE(platform, 'youtube')"""
-        )
-        stats["hours_by_platform"] = {}
-        for row in cursor.fetchall():
-            stats["hours_by_platform"][row["platform"]] = round(row["hours"] or 0, 1)
+            # Total hours by platform
+            cursor.execute(
+                """SELECT
+                    COALESCE(NULLIF(platform, ''), 'youtube') as platform,
+                    SUM(dur) / 3600.0 as hours
+                   FROM videos_stats
+                   WHERE content_type IN ('PREACHING', 'UNKNOWN')
+                   GROUP BY 1
+                   HAVING SUM(timed) > 0"""
+            )
+            stats["hours_by_platform"] = {}
+            for row in cursor.fetchall():
+                stats["hours_by_platform"][row["platform"]] = round(row["hours"] or 0, 1)
 
-        conn.close()
         return stats
 
     def get_video_count_by_platform(self, platform: str) -> int:
         """Get count of videos from a specific platform."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """SELECT COUNT(*) as count FROM videos
-               WHERE (platform = ? OR (platform IS NULL AND ? = 'youtube'))
-               AND content_type IN ('PREACHING', 'UNKNOWN')""",
-            (platform, platform)
-        )
-        result = cursor.fetchone()["count"]
-        conn.close()
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(
+                """SELECT IFNULL(SUM(cnt), 0) as count FROM videos_stats
+                   WHERE COALESCE(NULLIF(platform, ''), 'youtube') = ?
+                   AND content_type IN ('PREACHING', 'UNKNOWN')""",
+                (platform,)
+            )
+            result = cursor.fetchone()[0]
         return result
 
     # =========================================================================
     # FACE VERIFICATION METHODS
     # =========================================================================
 
-    def get_videos_for_face_verification(
+    def get_video_rows_for_face_verification(
         self,
         only_unverified: bool = True,
         channel_filter: Optional[str] = None,
-        limit: Optional[int] = None
-    ) -> List[VideoMetadata]:
+        limit: Optional[int] = None,
+        batch_size: int = 1024
+    ) -> Iterator[sqlite3.Row]:
         """
-        Get videos that need face verification.
+        Stream the rows of videos that need face verification.
+
+        Yields sqlite3.Row objects fetched batch_size at a time, without
+        building a VideoMetadata per row. A reader connection stays checked
+        out until the iterator is exhausted or closed.
 
         Args:
             only_unverified: If True, only get videos where face_verified = 0
             channel_filter: Optional channel name to filter by
             limit: Optional max number of videos to return
-
-        Returns:
-            List of VideoMetadata objects
+            batch_size: Rows fetched from SQLite per round trip
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        query = "SELECT * FROM videos WHERE 1=1"
+        channel_mode = None
         params = []
 
-        if only_unverified:
-            query += " AND (face_verified = 0 OR face_verified IS NULL)"
-
         if channel_filter:
-            query += " AND channel_name LIKE ?"
-            params.append(f"%{channel_filter}%")
-
-        query += " ORDER BY upload_date DESC"
+            match = self._fts_phrase("channel_name", channel_filter)
+            if match is None:
+                channel_mode = "like"
+                params.append(f"%{channel_filter}%")
+            else:
+                channel_mode = "fts"
+                params.append(match)
 
         if limit:
-            query += f" LIMIT {limit}"
+            params.append(limit)
+
+        query = _FACE_VERIFICATION_SQL[(bool(only_unverified), channel_mode, bool(limit))]
+
+        with self._reader() as conn:
+            cursor = conn.execute(query, params)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+
+    def get_videos_for_face_verification(
+        self,
+        only_unverified: bool = True,
+        channel_filter: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[VideoMetadata]:
+        """
+        Get videos that need face verification.
 
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        conn.close()
+        Args:
+            only_unverified: If True, only get videos where face_verified = 0
+            channel_filter: Optional channel name to filter by
+            limit: Optional max number of videos to return
 
+        Returns:
+            List of VideoMetadata objects
+        """
+        rows = self.get_video_rows_for_face_verification(
+            only_unverified=only_unverified,
+            channel_filter=channel_filter,
+            limit=limit
+        )
         return [VideoMetadata.from_dict(dict(row)) for row in rows]
 
     def update_face_verification(
@@ -882,82 +1775,63 @@ class Database:
         Returns:
             True if updated successfully
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._connection() as conn:
+            cursor = conn.cursor()
 
-        updates = ["face_verified = ?"]
-        params = [1 if face_verified else 0]
-
-        if confidence_score is not None:
-            updates.append("confidence_score = ?")
-            params.append(confidence_score)
-
-        if content_type is not None:
-            updates.append("content_type = ?")
-            params.append(content_type.value)
-
-        if needs_review is not None:
-            updates.append("needs_review = ?")
-            params.append(1 if needs_review else 0)
-
-        params.append(video_id)
-
-        cursor.execute(
-            f"UPDATE videos SET {', '.join(updates)} WHERE video_id = ?",
-            params
-        )
+            cursor.execute(_UPDATE_FACE_VERIFICATION_SQL, (
+                1 if face_verified else 0,
+                confidence_score,
+                content_type.value if content_type is not None else None,
+                None if needs_review is None else (1 if needs_review else 0),
+                video_id,
+            ))
 
-        conn.commit()
-        affected = cursor.rowcount
-        conn.close()
+            self._commit(conn)
+            affected = cursor.rowcount
         return affected > 0
 
     def get_face_verification_stats(self) -> dict:
         """Get statistics about face verification status."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        stats = {}
-
-        # Total videos
-        cursor.execute("SELECT COUNT(*) as count FROM videos")
-        stats["total_videos"] = cursor.fetchone()["count"]
-
-        # Face verified count
-        cursor.execute("SELECT COUNT(*) as count FROM videos WHERE face_verified = 1")
-        stats["face_verified"] = cursor.fetchone()["count"]
-
-        # Not verified count
-        cursor.execute("SELECT COUNT(*) as count FROM videos WHERE face_verified = 0 OR face_verified IS NULL")
-        stats["not_verified"] = cursor.fetchone()["count"]
-
-        # Verified preaching videos
-        cursor.execute(
-            """SELECT COUNT(*) as count FROM videos
-               WHERE face_verified = 1 AND content_type = 'PREACHING'"""
-        )
-        stats["verified_preaching"] = cursor.fetchone()["count"]
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
 
-        conn.close()
+            # One pass over the (content_type, face_verified) index
+            cursor.execute("""
+                SELECT
+                    COUNT(*),
+                    COUNT(CASE WHEN face_verified = 1 THEN 1 END),
+                    COUNT(CASE WHEN face_verified = 0 OR face_verified IS NULL THEN 1 END),
+                    COUNT(CASE WHEN face_verified = 1 AND content_type = 'PREACHING' THEN 1 END)
+                FROM videos
+            """)
+            total, verified, not_verified, verified_preaching = cursor.fetchone()
+
+        stats = {
+            "total_videos": total,
+            "face_verified": verified,
+            "not_verified": not_verified,
+            "verified_preaching": verified_preaching,
+        }
         return stats
 
     def get_video_count(
         self, content_type: Optional[ContentType] = None
     ) -> int:
         """Get total count of videos, optionally filtered by type."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
 
-        if content_type:
-            cursor.execute(
-                "SELECT COUNT(*) as count FROM videos WHERE content_type = ?",
-                (content_type.value,)
-            )
-        else:
-            cursor.execute("SELECT COUNT(*) as count FROM videos")
+            if content_type:
+                cursor.execute(
+                    "SELECT COUNT(*) as count FROM videos WHERE content_type = ?",
+                    (content_type.value,)
+                )
+            else:
+                cursor.execute("SELECT COUNT(*) as count FROM videos")
 
-        result = cursor.fetchone()["count"]
-        conn.close()
+            result = cursor.fetchone()[0]
         return result
 
     # =========================================================================
@@ -971,41 +1845,50 @@ class Database:
         Returns:
             The ID of the created log entry
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._connection() as conn:
+            cursor = conn.execute(_INSERT_FETCH_LOG_SQL, self._fetch_log_row(log))
+            self._commit(conn)
+            log_id = cursor.lastrowid
+        return log_id
 
-        cursor.execute(
-            """INSERT INTO fetch_logs
-               (fetch_timestamp, query_used, videos_found, videos_added,
-                videos_skipped, music_excluded, errors_count, error_messages)
-               VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                log.fetch_timestamp.isoformat(),
-                log.query_used,
-                log.videos_found,
-                log.videos_added,
-                log.videos_skipped,
-                log.music_excluded,
-                log.errors_count,
-                log.error_messages,
-            )
-        )
+    def log_fetch_many(self, logs: List[FetchLog]) -> int:
+        """
+        Log several fetch operations in one transaction.
 
-        conn.commit()
-        log_id = cursor.lastrowid
-        conn.close()
-        return log_id
+        Returns:
+            Number of log entries written
+        """
+        if not logs:
+            return 0
+
+        with self.transaction() as conn:
+            conn.executemany(_INSERT_FETCH_LOG_SQL, [self._fetch_log_row(log) for log in logs])
+        return len(logs)
+
+    @staticmethod
+    def _fetch_log_row(log: FetchLog) -> tuple:
+        """Parameters for _INSERT_FETCH_LOG_SQL."""
+        return (
+            log.fetch_timestamp.isoformat(),
+            log.query_used,
+            log.videos_found,
+            log.videos_added,
+            log.videos_skipped,
+            log.music_excluded,
+            log.errors_count,
+            log.error_messages,
+        )
 
     def get_fetch_logs(self, limit: int = 20) -> pd.DataFrame:
         """Get recent fetch logs."""
-        conn = self._get_connection()
-        df = pd.read_sql_query(
-            f"""SELECT * FROM fetch_logs
-               ORDER BY fetch_timestamp DESC
-               LIMIT {limit}""",
-            conn
-        )
-        conn.close()
+        with self._reader() as conn:
+            df = _read_frame(
+                conn,
+                """SELECT * FROM fetch_logs
+                   ORDER BY fetch_timestamp DESC
+                   LIMIT ?""",
+                (limit,)
+            )
         return df
 
     # =========================================================================
@@ -1022,15 +1905,30 @@ class Database:
         Returns:
             Number of rows exported
         """
-        df = self.get_all_sermons()
-        df.to_csv(filepath, index=False)
-        return len(df)
+        count = 0
+
+        # Stream rows from the cursor into the file; memory stays at one batch
+        with self._reader() as conn, open(filepath, "w", newline="", encoding="utf-8") as f:
+            cursor = conn.execute(
+                """SELECT * FROM videos
+                   WHERE content_type IN ('PREACHING', 'UNKNOWN')
+                   ORDER BY upload_date DESC"""
+            )
+            writer = csv.writer(f, lineterminator=os.linesep)
+            writer.writerow([col[0] for col in cursor.description])
+            while True:
+                rows = cursor.fetchmany(5000)
+                if not rows:
+                    break
+                writer.writerows(rows)
+                count += len(rows)
+
+        return count
 
     def export_to_dataframe(self) -> pd.DataFrame:
         """Export all videos to DataFrame."""
-        conn = self._get_connection()
-        df = pd.read_sql_query("SELECT * FROM videos ORDER BY upload_date DESC", conn)
-        conn.close()
+        with self._reader() as conn:
+            df = _read_frame(conn, "SELECT * FROM videos ORDER BY upload_date DESC")
         return df
 
 
@@ -1059,33 +1957,38 @@ class Database:
         Returns:
             The ID of the created preacher
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._connection() as conn:
+            cursor = conn.cursor()
 
-        cursor.execute("""
-            INSERT INTO preachers (name, aliases, title, primary_church, bio, created_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (
-            name,
-            json.dumps(aliases),
-            title,
-            primary_church,
-            bio,
-            datetime.now().isoformat()
-        ))
-
-        conn.commit()
-        preacher_id = cursor.lastrowid
-        conn.close()
+            cursor.execute("""
+                INSERT INTO preachers (name, aliases, title, primary_church, bio, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, (
+                name,
+                json.dumps(aliases),
+                title,
+                primary_church,
+                bio,
+                datetime.now().isoformat()
+            ))
+
+            self._commit(conn)
+            preacher_id = cursor.lastrowid
 
         # Create photos directory for this preacher
-        module_dir = os.path.dirname(os.path.abspath(__file__))
-        project_dir = os.path.dirname(module_dir)
-        photos_dir = os.path.join(project_dir, "photos", f"preacher_{preacher_id}")
-        os.makedirs(photos_dir, exist_ok=True)
+        os.makedirs(os.path.join(PHOTOS_DIR, f"preacher_{preacher_id}"), exist_ok=True)
 
         return preacher_id
 
+    @staticmethod
+    def _preacher_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert a preachers row to a dict with aliases decoded to a list."""
+        data = dict(row)
+        aliases = data["aliases"]
+        # Empty lists are stored as '[]' (or NULL); skip the parser for those
+        data["aliases"] = json.loads(aliases) if aliases and aliases != "[]" else []
+        return data
+
     def get_preacher(self, preacher_id: int) -> Optional[Dict[str, Any]]:
         """
         Get a preacher by ID.
@@ -1093,60 +1996,60 @@ class Database:
         Returns:
             Dict with preacher data or None
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM preachers WHERE id = ?", (preacher_id,))
-        row = cursor.fetchone()
-        conn.close()
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT * FROM preachers WHERE id = ?", (preacher_id,))
+            row = cursor.fetchone()
 
-        if row:
-            data = dict(row)
-            data["aliases"] = json.loads(data["aliases"]) if data["aliases"] else []
-            return data
-        return None
+        return self._preacher_from_row(row) if row else None
 
     def get_preacher_by_name(self, name: str) -> Optional[Dict[str, Any]]:
-        """Get a preacher by name (case-insensitive partial match)."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT * FROM preachers WHERE LOWER(name) LIKE LOWER(?)",
-            (f"%{name}%",)
-        )
-        row = cursor.fetchone()
-        conn.close()
+        """
+        Get a preacher by name (case-insensitive partial match).
 
-        if row:
-            data = dict(row)
-            data["aliases"] = json.loads(data["aliases"]) if data["aliases"] else []
-            return data
-        return None
+        An exact name match wins and is found through the NOCASE index;
+        otherwise the first preacher whose name contains the text.
+        """
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT * FROM preachers WHERE name = ? COLLATE NOCASE LIMIT 1",
+                (name,)
+            )
+            row = cursor.fetchone()
+
+            if row is None:
+                # LIKE is already case-insensitive, so no LOWER() is needed
+                cursor.execute(
+                    "SELECT * FROM preachers WHERE name LIKE ? LIMIT 1",
+                    (f"%{name}%",)
+                )
+                row = cursor.fetchone()
+
+        return self._preacher_from_row(row) if row else None
 
     def get_all_preachers(self) -> List[Dict[str, Any]]:
         """Get all preachers with video counts."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._reader() as conn:
+            cursor = conn.cursor()
 
-        cursor.execute("""
-            SELECT p.*,
-                   COUNT(DISTINCT v.video_id) as video_count,
-                   COALESCE(SUM(v.duration) / 3600.0, 0) as total_hours
-            FROM preachers p
-            LEFT JOIN videos v ON p.id = v.preacher_id
-                AND v.content_type IN ('PREACHING', 'UNKNOWN')
-            WHERE p.is_active = 1
-            GROUP BY p.id
-            ORDER BY p.created_at DESC
-        """)
+            cursor.execute("""
+                SELECT p.*,
+                       IFNULL(s.cnt, 0) as video_count,
+                       COALESCE(s.dur / 3600.0, 0) as total_hours
+                FROM preachers p
+                LEFT JOIN preacher_stats s ON s.preacher_id = p.id
+                WHERE p.is_active = 1
+                ORDER BY p.created_at DESC
+            """)
+
+            rows = cursor.fetchall()
 
         results = []
-        for row in cursor.fetchall():
-            data = dict(row)
-            data["aliases"] = json.loads(data["aliases"]) if data["aliases"] else []
+        for row in rows:
+            data = self._preacher_from_row(row)
             data["total_hours"] = round(data["total_hours"], 1)
             results.append(data)
-
-        conn.close()
         return results
 
     def update_preacher(
@@ -1159,43 +2062,23 @@ class Database:
         bio: Optional[str] = None
     ) -> bool:
         """Update a preacher's information."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        updates = []
-        params = []
-
-        if name is not None:
-            updates.append("name = ?")
-            params.append(name)
-        if aliases is not None:
-            updates.append("aliases = ?")
-            params.append(json.dumps(aliases))
-        if title is not None:
-            updates.append("title = ?")
-            params.append(title)
-        if primary_church is not None:
-            updates.append("primary_church = ?")
-            params.append(primary_church)
-        if bio is not None:
-            updates.append("bio = ?")
-            params.append(bio)
-
-        if not updates:
+        if all(v is None for v in (name, aliases, title, primary_church, bio)):
             return False
 
-        updates.append("updated_at = ?")
-        params.append(datetime.now().isoformat())
-        params.append(preacher_id)
-
-        cursor.execute(
-            f"UPDATE preachers SET {', '.join(updates)} WHERE id = ?",
-            params
-        )
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(_UPDATE_PREACHER_SQL, (
+                name,
+                json.dumps(aliases) if aliases is not None else None,
+                title,
+                primary_church,
+                bio,
+                datetime.now().isoformat(),
+                preacher_id,
+            ))
 
-        conn.commit()
-        affected = cursor.rowcount
-        conn.close()
+            self._commit(conn)
+            affected = cursor.rowcount
         return affected > 0
 
     def delete_preacher(self, preacher_id: int) -> bool:
@@ -1203,15 +2086,14 @@ class Database:
         Soft delete a preacher (set is_active = 0).
         Does not delete associated videos or photos.
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "UPDATE preachers SET is_active = 0, updated_at = ? WHERE id = ?",
-            (datetime.now().isoformat(), preacher_id)
-        )
-        conn.commit()
-        affected = cursor.rowcount
-        conn.close()
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "UPDATE preachers SET is_active = 0, updated_at = ? WHERE id = ?",
+                (datetime.now().isoformat(), preacher_id)
+            )
+            self._commit(conn)
+            affected = cursor.rowcount
         return affected > 0
 
     # =========================================================================
@@ -1231,85 +2113,95 @@ class Database:
         Returns:
             The ID of the created reference
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            INSERT INTO preacher_face_references
-            (preacher_id, file_path, original_filename, file_size, uploaded_at)
-            VALUES (?, ?, ?, ?, ?)
-        """, (
-            preacher_id,
-            file_path,
-            original_filename,
-            file_size,
-            datetime.now().isoformat()
-        ))
-
-        conn.commit()
-        ref_id = cursor.lastrowid
-        conn.close()
+        with self._connection() as conn:
+            cursor = conn.execute(_INSERT_FACE_REFERENCE_SQL, (
+                preacher_id,
+                file_path,
+                original_filename,
+                file_size,
+                datetime.now().isoformat()
+            ))
+            self._commit(conn)
+            ref_id = cursor.lastrowid
         return ref_id
 
-    def get_face_references(self, preacher_id: int) -> List[Dict[str, Any]]:
-        """Get all face reference photos for a preacher."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+    def add_face_references_many(
+        self,
+        references: List[Tuple[int, str, str, int]]
+    ) -> int:
+        """
+        Add several face reference photos in one transaction.
 
-        cursor.execute("""
-            SELECT * FROM preacher_face_references
-            WHERE preacher_id = ?
-            ORDER BY uploaded_at DESC
-        """, (preacher_id,))
+        Args:
+            references: (preacher_id, file_path, original_filename, file_size)
+                tuples
+
+        Returns:
+            Number of references added
+        """
+        if not references:
+            return 0
+
+        uploaded_at = datetime.now().isoformat()
+        with self.transaction() as conn:
+            conn.executemany(
+                _INSERT_FACE_REFERENCE_SQL,
+                [(*reference, uploaded_at) for reference in references]
+            )
+        return len(references)
 
-        results = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+    def get_face_references(self, preacher_id: int) -> List[Dict[str, Any]]:
+        """Get all face reference photos for a preacher."""
+        with self._reader() as conn:
+            results = _read_dicts(conn, """
+                SELECT * FROM preacher_face_references
+                WHERE preacher_id = ?
+                ORDER BY uploaded_at DESC
+            """, (preacher_id,))
         return results
 
     def delete_face_reference(self, reference_id: int) -> bool:
         """Delete a face reference photo record."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        # Get the file path before deleting
-        cursor.execute(
-            "SELECT file_path FROM preacher_face_references WHERE id = ?",
-            (reference_id,)
-        )
-        row = cursor.fetchone()
+        with self._connection() as conn:
+            cursor = conn.cursor()
 
-        if row:
-            # Delete the record
+            # Get the file path before deleting
             cursor.execute(
-                "DELETE FROM preacher_face_references WHERE id = ?",
+                "SELECT file_path FROM preacher_face_references WHERE id = ?",
                 (reference_id,)
             )
-            conn.commit()
-            affected = cursor.rowcount
+            row = cursor.fetchone()
 
-            # Delete the actual file
-            if row["file_path"] and os.path.exists(row["file_path"]):
-                try:
-                    os.remove(row["file_path"])
-                except Exception as e:
-                    print(f"Warning: Could not delete file {row['file_path']}: {e}")
+            if row:
+                # Delete the record
+                cursor.execute(
+                    "DELETE FROM preacher_face_references WHERE id = ?",
+                    (reference_id,)
+                )
+                self._commit(conn)
+                affected = cursor.rowcount
 
-            conn.close()
-            return affected > 0
+                # Delete the actual file
+                if row["file_path"] and os.path.exists(row["file_path"]):
+                    try:
+                        os.remove(row["file_path"])
+                    except Exception as e:
+                        print(f"Warning: Could not delete file {row['file_path']}: {e}")
+
+                return affected > 0
 
-        conn.close()
         return False
 
     def get_face_reference_count(self, preacher_id: int) -> int:
         """Get count of face reference photos for a preacher."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT COUNT(*) as count FROM preacher_face_references WHERE preacher_id = ?",
-            (preacher_id,)
-        )
-        result = cursor.fetchone()["count"]
-        conn.close()
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(
+                "SELECT COUNT(*) as count FROM preacher_face_references WHERE preacher_id = ?",
+                (preacher_id,)
+            )
+            result = cursor.fetchone()[0]
         return result
 
     # =========================================================================
@@ -1336,158 +2228,88 @@ class Database:
         if content_types is None:
             content_types = ['PREACHING', 'UNKNOWN']
 
-        conn = self._get_connection()
-        placeholders = ','.join('?' * len(content_types))
-
-        df = pd.read_sql_query(
-            f"""SELECT * FROM videos
-               WHERE preacher_id = ?
-               AND content_type IN ({placeholders})
-               ORDER BY upload_date DESC
-               LIMIT ?""",
-            conn,
-            params=[preacher_id] + content_types + [limit]
-        )
-        conn.close()
+        with self._reader() as conn:
+            placeholders = ','.join('?' * len(content_types))
+
+            df = _read_frame(
+                conn,
+                f"""SELECT * FROM videos
+                   WHERE preacher_id = ?
+                   AND content_type IN ({placeholders})
+                   ORDER BY upload_date DESC
+                   LIMIT ?""",
+                [preacher_id] + content_types + [limit]
+            )
         return df
 
     def get_statistics_for_preacher(self, preacher_id: int) -> Dict[str, Any]:
         """Get comprehensive statistics for a specific preacher."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        stats = {"preacher_id": preacher_id}
-
-        # Total videos
-        cursor.execute(
-            "SELECT COUNT(*) as count FROM videos WHERE preacher_id = ?",
-            (preacher_id,)
-        )
-        stats["total_videos"] = cursor.fetchone()["count"]
-
-        # By content type
-        cursor.execute("""
-            SELECT content_type, COUNT(*) as count
-            FROM videos WHERE preacher_id = ?
-            GROUP BY content_type
-        """, (preacher_id,))
-        stats["by_content_type"] = {
-            row["content_type"]: row["count"] for row in cursor.fetchall()
-        }
-
-        # By language
-        cursor.execute("""
-            SELECT language_detected, COUNT(*) as count
-            FROM videos WHERE preacher_id = ?
-            GROUP BY language_detected
-        """, (preacher_id,))
-        stats["by_language"] = {
-            row["language_detected"]: row["count"] for row in cursor.fetchall()
-        }
-
-        # Needs review count
-        cursor.execute("""
-            SELECT COUNT(*) as count FROM videos
-            WHERE preacher_id = ? AND needs_review = 1
-        """, (preacher_id,))
-        stats["needs_review"] = cursor.fetchone()["count"]
-
-        # Unique channels
-        cursor.execute("""
-            SELECT COUNT(DISTINCT channel_name) as count
-            FROM videos WHERE preacher_id = ?
-        """, (preacher_id,))
-        stats["unique_channels"] = cursor.fetchone()["count"]
-
-        # Date range
-        cursor.execute("""
-            SELECT MIN(upload_date) as oldest, MAX(upload_date) as newest
-            FROM videos
-            WHERE preacher_id = ? AND upload_date IS NOT NULL
-        """, (preacher_id,))
-        row = cursor.fetchone()
-        stats["oldest_video"] = row["oldest"]
-        stats["newest_video"] = row["newest"]
-
-        # Total hours
-        cursor.execute("""
-            SELECT COALESCE(SUM(duration) / 3600.0, 0) as hours
-            FROM videos
-            WHERE preacher_id = ?
-            AND content_type IN ('PREACHING', 'UNKNOWN')
-            AND duration IS NOT NULL
-        """, (preacher_id,))
-        stats["total_hours"] = round(cursor.fetchone()["hours"], 1)
-
-        # Top channels
-        cursor.execute("""
-            SELECT channel_name, COUNT(*) as count
-            FROM videos
-            WHERE preacher_id = ?
-            AND content_type IN ('PREACHING', 'UNKNOWN')
-            GROUP BY channel_name
-            ORDER BY count DESC
-            LIMIT 10
-        """, (preacher_id,))
-        stats["top_channels"] = [
-            {"name": row["channel_name"], "count": row["count"]}
-            for row in cursor.fetchall()
-        ]
-
-        # By platform
-        cursor.execute("""
-            SELECT COALESCE(platform, 'youtube') as platform, COUNT(*) as count
-            FROM videos
-            WHERE preacher_id = ?
-            AND content_type IN ('PREACHING', 'UNKNOWN')
-            GROUP BY COALESCE(platform, 'youtube')
-        """, (preacher_id,))
-        stats["by_platform"] = {
-            row["platform"]: row["count"] for row in cursor.fetchall()
+        with self._reader() as conn:
+            cursor = conn.cursor()
+
+            # Scalar totals in one aggregate pass
+            cursor.execute(_PREACHER_TOTALS_SQL, (preacher_id,))
+            totals = cursor.fetchone()
+
+            # Breakdowns as tagged (stat, key, count) rows
+            cursor.execute(_PREACHER_BREAKDOWN_SQL, (preacher_id,))
+            breakdowns = {
+                "content_type": {}, "language": {}, "channel": [], "platform": {}
+            }
+            for kind, key, count in cursor.fetchall():
+                if kind == "channel":
+                    breakdowns["channel"].append({"name": key, "count": count})
+                else:
+                    breakdowns[kind][key] = count
+
+        return {
+            "preacher_id": preacher_id,
+            "total_videos": totals["total_videos"],
+            "by_content_type": breakdowns["content_type"],
+            "by_language": breakdowns["language"],
+            "needs_review": totals["needs_review"],
+            "unique_channels": totals["unique_channels"],
+            "oldest_video": totals["oldest"],
+            "newest_video": totals["newest"],
+            "total_hours": round(totals["hours"], 1),
+            "top_channels": breakdowns["channel"],
+            "by_platform": breakdowns["platform"],
         }
 
-        conn.close()
-        return stats
-
     def get_video_count_by_preacher(self, preacher_id: int) -> int:
         """Get count of videos for a specific preacher."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT COUNT(*) as count FROM videos
-            WHERE preacher_id = ?
-            AND content_type IN ('PREACHING', 'UNKNOWN')
-        """, (preacher_id,))
-        result = cursor.fetchone()["count"]
-        conn.close()
-        return result
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(
+                "SELECT cnt FROM preacher_stats WHERE preacher_id = ?",
+                (preacher_id,)
+            )
+            row = cursor.fetchone()
+        return row[0] if row else 0
 
     def get_preaching_hours_by_preacher(self, preacher_id: int) -> float:
         """Get total preaching hours for a specific preacher."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute("""
-            SELECT COALESCE(SUM(duration) / 3600.0, 0) as hours
-            FROM videos
-            WHERE preacher_id = ?
-            AND content_type IN ('PREACHING', 'UNKNOWN')
-            AND duration IS NOT NULL
-        """, (preacher_id,))
-        result = cursor.fetchone()["hours"]
-        conn.close()
-        return round(result, 1)
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(
+                "SELECT dur / 3600.0 FROM preacher_stats WHERE preacher_id = ?",
+                (preacher_id,)
+            )
+            row = cursor.fetchone()
+        return round(row[0], 1) if row else 0
 
     def update_video_preacher(self, video_id: str, preacher_id: int) -> bool:
         """Assign a video to a preacher."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "UPDATE videos SET preacher_id = ? WHERE video_id = ?",
-            (preacher_id, video_id)
-        )
-        conn.commit()
-        affected = cursor.rowcount
-        conn.close()
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "UPDATE videos SET preacher_id = ? WHERE video_id = ?",
+                (preacher_id, video_id)
+            )
+            self._commit(conn)
+            affected = cursor.rowcount
         return affected > 0
 
     def get_recent_videos_by_preacher(
@@ -1496,21 +2318,16 @@ class Database:
         limit: int = 6
     ) -> List[Dict[str, Any]]:
         """Get recent videos for a preacher as a list of dicts."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            SELECT video_id, title, thumbnail_url, duration, upload_date,
-                   channel_name, video_url, view_count, platform
-            FROM videos
-            WHERE preacher_id = ?
-            AND content_type IN ('PREACHING', 'UNKNOWN')
-            ORDER BY upload_date DESC
-            LIMIT ?
-        """, (preacher_id, limit))
-
-        results = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+        with self._reader() as conn:
+            results = _read_dicts(conn, """
+                SELECT video_id, title, thumbnail_url, duration, upload_date,
+                       channel_name, video_url, view_count, platform
+                FROM videos
+                WHERE preacher_id = ?
+                AND content_type IN ('PREACHING', 'UNKNOWN')
+                ORDER BY upload_date DESC
+                LIMIT ?
+            """, (preacher_id, limit))
         return results
 
 
@@ -1540,16 +2357,14 @@ class Database:
 
         Returns:
             The ID of the created channel, or None if already exists
+
+        Raises:
+            sqlite3.IntegrityError: If preacher_id does not match a preacher
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._connection() as conn:
+            cursor = conn.cursor()
 
-        try:
-            cursor.execute("""
-                INSERT INTO discovered_channels
-                (platform, channel_name, channel_url, page_id, preacher_id, notes, discovered_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
+            cursor.execute(_INSERT_DISCOVERED_CHANNEL_SQL, (
                 platform,
                 channel_name,
                 channel_url,
@@ -1559,26 +2374,55 @@ class Database:
                 datetime.now().isoformat()
             ))
 
-            conn.commit()
-            channel_id = cursor.lastrowid
-            conn.close()
-            return channel_id
+            if cursor.rowcount != 1:
+                # Channel URL already exists
+                return None
 
-        except sqlite3.IntegrityError:
-            # Channel URL already exists
-            conn.close()
-            return None
+            self._commit(conn)
+            return cursor.lastrowid
+
+    def add_discovered_channels_many(self, channels: List[Dict[str, Any]]) -> int:
+        """
+        Add several discovered channels in one transaction.
+
+        Args:
+            channels: Dicts with channel_name and channel_url, and optionally
+                platform (default facebook), page_id, preacher_id and notes
+
+        Returns:
+            Number of channels added; URLs already stored are skipped
+        """
+        if not channels:
+            return 0
+
+        discovered_at = datetime.now().isoformat()
+        rows = [
+            (
+                channel.get("platform", "facebook"),
+                channel["channel_name"],
+                channel["channel_url"],
+                channel.get("page_id"),
+                channel.get("preacher_id"),
+                channel.get("notes"),
+                discovered_at,
+            )
+            for channel in channels
+        ]
+
+        with self.transaction() as conn:
+            cursor = conn.executemany(_INSERT_DISCOVERED_CHANNEL_SQL, rows)
+            added = cursor.rowcount
+        return added
 
     def get_discovered_channel_by_url(self, channel_url: str) -> Optional[Dict[str, Any]]:
         """Get a discovered channel by its URL."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT * FROM discovered_channels WHERE channel_url = ?",
-            (channel_url,)
-        )
-        row = cursor.fetchone()
-        conn.close()
+        with self._reader() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT * FROM discovered_channels WHERE channel_url = ?",
+                (channel_url,)
+            )
+            row = cursor.fetchone()
 
         if row:
             return dict(row)
@@ -1586,7 +2430,12 @@ class Database:
 
     def channel_exists(self, channel_url: str) -> bool:
         """Check if a channel URL is already in discovered channels."""
-        return self.get_discovered_channel_by_url(channel_url) is not None
+        with self._reader() as conn:
+            cursor = conn.execute(
+                "SELECT 1 FROM discovered_channels WHERE channel_url = ? LIMIT 1",
+                (channel_url,)
+            )
+            return cursor.fetchone() is not None
 
     def get_all_discovered_channels(
         self,
@@ -1605,28 +2454,27 @@ class Database:
         Returns:
             List of channel dictionaries
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        query = "SELECT * FROM discovered_channels WHERE 1=1"
+        conditions = []
         params = []
 
         if active_only:
-            query += " AND is_active = 1"
+            conditions.append("is_active = 1")
 
         if platform:
-            query += " AND platform = ?"
+            conditions.append("platform = ?")
             params.append(platform)
 
         if preacher_id:
-            query += " AND preacher_id = ?"
+            conditions.append("preacher_id = ?")
             params.append(preacher_id)
 
+        query = "SELECT * FROM discovered_channels"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
         query += " ORDER BY video_count DESC, discovered_at DESC"
 
-        cursor.execute(query, params)
-        results = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+        with self._reader() as conn:
+            results = _read_dicts(conn, query, params)
         return results
 
     def update_discovered_channel(
@@ -1638,115 +2486,82 @@ class Database:
         notes: Optional[str] = None
     ) -> bool:
         """Update a discovered channel's information."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        updates = []
-        params = []
-
-        if video_count is not None:
-            updates.append("video_count = ?")
-            params.append(video_count)
-
-        if last_scanned is not None:
-            updates.append("last_scanned = ?")
-            params.append(last_scanned)
-
-        if is_active is not None:
-            updates.append("is_active = ?")
-            params.append(1 if is_active else 0)
-
-        if notes is not None:
-            updates.append("notes = ?")
-            params.append(notes)
-
-        if not updates:
-            conn.close()
+        if all(v is None for v in (video_count, last_scanned, is_active, notes)):
             return False
 
-        params.append(channel_id)
-
-        cursor.execute(
-            f"UPDATE discovered_channels SET {', '.join(updates)} WHERE id = ?",
-            params
-        )
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(_UPDATE_DISCOVERED_CHANNEL_SQL, (
+                video_count,
+                last_scanned,
+                None if is_active is None else (1 if is_active else 0),
+                notes,
+                channel_id,
+            ))
 
-        conn.commit()
-        affected = cursor.rowcount
-        conn.close()
+            self._commit(conn)
+            affected = cursor.rowcount
         return affected > 0
 
     def increment_channel_video_count(self, channel_url: str, increment: int = 1) -> bool:
         """Increment the video count for a channel and update last_scanned."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        with self._connection() as conn:
+            cursor = conn.cursor()
 
-        cursor.execute("""
-            UPDATE discovered_channels
-            SET video_count = video_count + ?,
-                last_scanned = ?
-            WHERE channel_url = ?
-        """, (increment, datetime.now().isoformat(), channel_url))
-
-        conn.commit()
-        affected = cursor.rowcount
-        conn.close()
+            cursor.execute("""
+                UPDATE discovered_channels
+                SET video_count = video_count + ?,
+                    last_scanned = ?
+                WHERE channel_url = ?
+            """, (increment, datetime.now().isoformat(), channel_url))
+
+            self._commit(conn)
+            affected = cursor.rowcount
         return affected > 0
 
     def delete_discovered_channel(self, channel_id: int) -> bool:
         """Delete a discovered channel (hard delete)."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            "DELETE FROM discovered_channels WHERE id = ?",
-            (channel_id,)
-        )
-        conn.commit()
-        affected = cursor.rowcount
-        conn.close()
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "DELETE FROM discovered_channels WHERE id = ?",
+                (channel_id,)
+            )
+            self._commit(conn)
+            affected = cursor.rowcount
         return affected > 0
 
     def get_discovered_channels_stats(self) -> Dict[str, Any]:
         """Get statistics about discovered channels."""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
-        stats = {}
-
-        # Total channels
-        cursor.execute("SELECT COUNT(*) as count FROM discovered_channels WHERE is_active = 1")
-        stats["total_channels"] = cursor.fetchone()["count"]
-
-        # By platform
-        cursor.execute("""
-            SELECT platform, COUNT(*) as count
-            FROM discovered_channels
-            WHERE is_active = 1
-            GROUP BY platform
-        """)
-        stats["by_platform"] = {
-            row["platform"]: row["count"] for row in cursor.fetchall()
-        }
-
-        # Total videos discovered
-        cursor.execute("""
-            SELECT COALESCE(SUM(video_count), 0) as total
-            FROM discovered_channels
-            WHERE is_active = 1
-        """)
-        stats["total_videos_discovered"] = cursor.fetchone()["total"]
+        with self._reader() as conn:
+            cursor = conn.cursor()
 
-        # Recently discovered
-        cursor.execute("""
-            SELECT channel_name, channel_url, discovered_at, video_count
-            FROM discovered_channels
-            WHERE is_active = 1
-            ORDER BY discovered_at DESC
-            LIMIT 5
-        """)
-        stats["recent_discoveries"] = [dict(row) for row in cursor.fetchall()]
+            # Channel and video counts per platform in one pass; the totals
+            # are the sums over the platforms
+            cursor.execute("""
+                SELECT platform, COUNT(*) as count,
+                       COALESCE(SUM(video_count), 0) as videos
+                FROM discovered_channels
+                WHERE is_active = 1
+                GROUP BY platform
+            """)
+            platforms = cursor.fetchall()
+
+            stats = {
+                "total_channels": sum(row["count"] for row in platforms),
+                "by_platform": {row["platform"]: row["count"] for row in platforms},
+                "total_videos_discovered": sum(row["videos"] for row in platforms),
+            }
+
+            # Recently discovered
+            stats["recent_discoveries"] = _read_dicts(conn, """
+                SELECT channel_name, channel_url, discovered_at, video_count
+                FROM discovered_channels
+                WHERE is_active = 1
+                ORDER BY discovered_at DESC
+                LIMIT 5
+            """)
 
-        conn.close()
         return stats
 
 
@@ -9,6 +9,8 @@ import os
 import glob
 import tempfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Tuple, Optional
 from dataclasses import dataclass
 import requests
@@ -25,6 +27,18 @@ except ImportError:
     print("Warning: DeepFace not available (requires TensorFlow, which needs Python 3.11 or 3.12).")
     print("         Using OpenCV-based face detection as fallback (detection only, no recognition).")
 
+try:
+    from insightface.app import FaceAnalysis
+    INSIGHTFACE_AVAILABLE = True
+except ImportError:
+    INSIGHTFACE_AVAILABLE = False
+
+try:
+    import simsimd
+    SIMSIMD_AVAILABLE = True
+except ImportError:
+    SIMSIMD_AVAILABLE = False
+
 try:
     import yt_dlp
     YTDLP_AVAILABLE = True
@@ -33,6 +47,28 @@ except ImportError:
     print("Warning: yt-dlp not available. Frame extraction disabled.")
 
 
+# yt-dlp options shared by URL resolution and segment downloads
+_YDL_OPTS = {
+    'format': 'worst[ext=mp4]/worst',  # Smallest format for speed
+    'quiet': True,
+    'no_warnings': True,
+}
+
+
+@lru_cache(maxsize=None)
+def _get_model(model_name: str):
+    """Build a DeepFace model once per process and share it between recognizers."""
+    return DeepFace.build_model(model_name)
+
+
+@lru_cache(maxsize=None)
+def _get_face_analysis(model_pack: str, ctx_id: int):
+    """Prepare an InsightFace detector + ArcFace embedder once per process."""
+    app = FaceAnalysis(name=model_pack, allowed_modules=["detection", "recognition"])
+    app.prepare(ctx_id=ctx_id, det_size=(640, 640))
+    return app
+
+
 @dataclass
 class FaceResult:
     """Result of face verification."""
@@ -65,6 +101,11 @@ class FaceRecognizer:
         "frame_interval_seconds": 10,
         "enable_frame_extraction": True,
         "video_segment_duration": 60,  # Download first 60 seconds
+        "max_frame_dimension": 640,  # Longer side of frames/thumbnails before detection
+        "embedding_dtype": "float16",  # Precision of stored reference embeddings (float32, float16, int8)
+        "insightface_model": "",  # InsightFace model pack to use instead of DeepFace, e.g. "buffalo_s" ("" = off)
+        "insightface_ctx_id": -1,  # GPU index for InsightFace, -1 for CPU
+        "insightface_distance_threshold": 0.50,  # Cosine distance for ArcFace embeddings
     }
 
     def __init__(self, config: dict = None, photos_dir: str = "photos"):
@@ -79,27 +120,54 @@ class FaceRecognizer:
         self.photos_dir = photos_dir
         self.reference_image_paths = []
         self.model_loaded = False
+        self.model_used = self.config["model_name"]
+        self._face_app = None
+        self._reference_embeddings = None
 
         self._load_reference_images()
         self._initialize_model()
 
     def _load_reference_images(self):
         """Load reference images from the photos directory."""
+        self._reference_embeddings = None  # Recomputed on next comparison
+        self.reference_image_paths = []
+
         if not os.path.isdir(self.photos_dir):
             print(f"Warning: Photos directory '{self.photos_dir}' not found.")
             return
 
         supported_formats = ('*.jpg', '*.jpeg', '*.png', '*.JPG', '*.JPEG', '*.PNG')
+        paths = []
         for fmt in supported_formats:
-            self.reference_image_paths.extend(
-                glob.glob(os.path.join(self.photos_dir, fmt))
-            )
+            paths.extend(glob.glob(os.path.join(self.photos_dir, fmt)))
+        # Case-insensitive filesystems match a file under both spellings;
+        # keep each once so it is only embedded once
+        self.reference_image_paths = list(dict.fromkeys(paths))
 
         if self.reference_image_paths:
             print(f"Loaded {len(self.reference_image_paths)} reference images.")
         else:
             print(f"Warning: No reference images found in '{self.photos_dir}'.")
 
+    @property
+    def uses_insightface(self) -> bool:
+        """Whether faces are detected and embedded with InsightFace."""
+        return self._face_app is not None
+
+    def _reload_references(self):
+        """
+        Rescan the photos directory after a change and rebuild the reference
+        embeddings right away, so the next verification only embeds its
+        probe frames.
+        """
+        self._load_reference_images()
+        if not self.reference_image_paths:
+            return
+        if self._face_app is not None or (
+            DEEPFACE_AVAILABLE and self.config["distance_metric"] == "cosine"
+        ):
+            self._get_reference_embeddings()
+
     def _initialize_model(self):
         """Pre-load the face recognition model."""
         # Load OpenCV cascade for fallback face detection
@@ -112,6 +180,23 @@ class FaceRecognizer:
         except Exception:
             pass
 
+        if INSIGHTFACE_AVAILABLE and self.config["insightface_model"]:
+            try:
+                # One detect + embed pass per image replaces DeepFace's
+                # separate detection, alignment and embedding calls
+                self._face_app = _get_face_analysis(
+                    self.config["insightface_model"], self.config["insightface_ctx_id"]
+                )
+                self.model_used = f"InsightFace {self.config['insightface_model']}"
+                self.model_loaded = True
+                print(f"Face recognition model '{self.model_used}' loaded successfully.")
+                if self.reference_image_paths:
+                    self._get_reference_embeddings()
+                return
+            except Exception as e:
+                self._face_app = None
+                print(f"Warning: Could not load InsightFace, trying DeepFace: {e}")
+
         if not DEEPFACE_AVAILABLE or not self.reference_image_paths:
             if self.face_cascade is not None:
                 self.model_loaded = True
@@ -119,10 +204,15 @@ class FaceRecognizer:
             return
 
         try:
-            # Build the model once to avoid repeated initialization
-            DeepFace.build_model(self.config["model_name"])
+            # Build the model once per process to avoid repeated initialization
+            _get_model(self.config["model_name"])
             self.model_loaded = True
             print(f"Face recognition model '{self.config['model_name']}' loaded successfully.")
+
+            # Embed the reference photos now rather than on the first video;
+            # each comparison then only runs the model on the probe frames
+            if self.config["distance_metric"] == "cosine":
+                self._get_reference_embeddings()
         except Exception as e:
             print(f"Warning: Could not load face recognition model: {e}")
             # Still mark as loaded if OpenCV fallback is available
@@ -145,8 +235,8 @@ class FaceRecognizer:
         Returns:
             FaceResult with verification status
         """
-        # Use OpenCV fallback if DeepFace not available
-        if not DEEPFACE_AVAILABLE:
+        # Use OpenCV fallback if neither InsightFace nor DeepFace is available
+        if not DEEPFACE_AVAILABLE and self._face_app is None:
             if self.face_cascade is not None:
                 return self._verify_with_opencv_fallback(video_url, thumbnail_url, use_frames)
             return FaceResult(
@@ -193,17 +283,17 @@ class FaceRecognizer:
 
             # Convert to numpy array
             image = Image.open(io.BytesIO(response.content)).convert("RGB")
-            image_np = np.array(image)
+            image_np = _downscale(np.array(image), self.config["max_frame_dimension"])
 
             # Compare against reference images
-            verified, confidence, distance = self._compare_against_references(image_np)
+            verified, confidence, distance = self._compare_frames([image_np])[1:]
 
             return FaceResult(
                 verified=verified,
                 confidence=confidence,
                 source="thumbnail",
                 distance=distance,
-                model_used=self.config["model_name"]
+                model_used=self.model_used
             )
 
         except requests.exceptions.RequestException as e:
@@ -240,17 +330,16 @@ class FaceRecognizer:
                 error="Could not extract frames from video"
             )
 
-        # Check each frame
-        for i, frame in enumerate(frames):
-            verified, confidence, distance = self._compare_against_references(frame)
-            if verified:
-                return FaceResult(
-                    verified=True,
-                    confidence=confidence,
-                    source=f"frame_{i+1}",
-                    distance=distance,
-                    model_used=self.config["model_name"]
-                )
+        # Check all frames in one batch; the first matching frame wins
+        index, verified, confidence, distance = self._compare_frames(frames)
+        if verified:
+            return FaceResult(
+                verified=True,
+                confidence=confidence,
+                source=f"frame_{index+1}",
+                distance=distance,
+                model_used=self.model_used
+            )
 
         return FaceResult(
             verified=False,
@@ -263,7 +352,52 @@ class FaceRecognizer:
         """
         Extract frames from a video URL.
 
-        Downloads a short segment of the video and extracts evenly-spaced frames.
+        Decodes evenly-spaced frames of the first video_segment_duration
+        seconds straight from the media URL when possible, and otherwise
+        downloads that segment first.
+        """
+        # Resolve the page once; both paths below reuse the result
+        info = self._resolve_video(video_url)
+        if info is not None:
+            frames = self._extract_frames_streamed(info)
+            if frames:
+                print(f"Extracted {len(frames)} frames from video stream.")
+                return frames
+        return self._extract_frames_downloaded(video_url, info)
+
+    def _resolve_video(self, video_url: str) -> Optional[dict]:
+        """Resolve the smallest format of a video with yt-dlp, or None on failure."""
+        try:
+            with yt_dlp.YoutubeDL(_YDL_OPTS) as ydl:
+                return ydl.extract_info(video_url, download=False)
+        except Exception:
+            return None
+
+    def _extract_frames_streamed(self, info: dict) -> List[np.ndarray]:
+        """
+        Decode frames straight from the media URL, without a download.
+
+        OpenCV's FFmpeg backend seeks over HTTP with range requests, so only
+        the data around each sampled frame is fetched. Returns an empty list
+        when the format isn't a plain HTTP file (HLS/DASH manifests) or the
+        stream can't be read, so the caller falls back to downloading.
+        """
+        stream_url = info.get("url")
+        if not stream_url or info.get("protocol") not in ("http", "https"):
+            return []
+
+        fps = info.get("fps") or 30
+        duration = info.get("duration") or self.config["video_segment_duration"]
+        segment = min(duration, self.config["video_segment_duration"])
+        return self._sample_frames(stream_url, int(segment * fps), fps)
+
+    def _extract_frames_downloaded(self, video_url: str,
+                                   info: Optional[dict] = None) -> List[np.ndarray]:
+        """
+        Download the first segment of the video and extract frames from it.
+
+        Reuses info from _resolve_video when given instead of resolving the
+        URL again.
         """
         frames = []
         temp_dir = None
@@ -275,11 +409,9 @@ class FaceRecognizer:
 
             # Configure yt-dlp to download only first segment
             ydl_opts = {
-                'format': 'worst[ext=mp4]/worst',  # Smallest format for speed
+                **_YDL_OPTS,
                 'outtmpl': video_path,
-                'quiet': True,
-                'no_warnings': True,
-                'download_ranges': lambda info, ydl: [
+                'download_ranges': lambda info_dict, ydl: [
                     {'start_time': 0, 'end_time': self.config["video_segment_duration"]}
                 ],
                 'force_keyframes_at_cuts': True,
@@ -287,7 +419,10 @@ class FaceRecognizer:
 
             # Download video segment
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([video_url])
+                if info is not None:
+                    ydl.process_ie_result(info, download=True)
+                else:
+                    ydl.download([video_url])
 
             if not os.path.exists(video_path):
                 print(f"Warning: Video file not created for {video_url}")
@@ -302,22 +437,9 @@ class FaceRecognizer:
             # Get video properties
             fps = cap.get(cv2.CAP_PROP_FPS) or 30
             total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-
-            # Calculate frame positions to extract
-            num_frames = min(self.config["num_frames"], max(1, total_frames // int(fps)))
-            frame_interval = max(1, total_frames // (num_frames + 1))
-
-            for i in range(num_frames):
-                frame_pos = (i + 1) * frame_interval
-                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_pos)
-                ret, frame = cap.read()
-
-                if ret:
-                    # Convert BGR to RGB
-                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    frames.append(frame_rgb)
-
             cap.release()
+
+            frames = self._sample_frames(video_path, total_frames, fps)
             print(f"Extracted {len(frames)} frames from video.")
 
         except Exception as e:
@@ -333,6 +455,209 @@ class FaceRecognizer:
 
         return frames
 
+    def _sample_frames(self, source: str, total_frames: int, fps: float) -> List[np.ndarray]:
+        """
+        Decode up to num_frames evenly-spaced frames from a file path or URL.
+
+        Each seek decodes forward from the preceding keyframe; the seeks run
+        in parallel, one capture per position (OpenCV releases the GIL while
+        decoding). Frames are downscaled to max_frame_dimension as they are
+        decoded, and frames that can't be read are skipped.
+        """
+        num_frames = min(self.config["num_frames"], max(1, total_frames // int(fps)))
+        frame_interval = max(1, total_frames // (num_frames + 1))
+        positions = [(i + 1) * frame_interval for i in range(num_frames)]
+
+        max_dim = self.config["max_frame_dimension"]
+        workers = max(1, min(len(positions), os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            decoded = executor.map(lambda pos: _read_frame_at(source, pos, max_dim), positions)
+            return [frame for frame in decoded if frame is not None]
+
+    def _compare_frames(self, frames: List[np.ndarray]) -> Tuple[int, bool, float, float]:
+        """
+        Compare frames against the reference images, batching when possible.
+
+        Cosine comparisons (always, with InsightFace) embed every frame's
+        faces once and score them against all references with one matrix
+        product. Other distance metrics fall back to DeepFace.verify
+        per frame.
+
+        Returns:
+            Tuple of (frame_index, verified, confidence, distance) for the
+            first verified frame, or for the closest frame if none matched
+        """
+        references = None
+        if self._face_app is not None or self.config["distance_metric"] == "cosine":
+            references = self._get_reference_embeddings()
+        threshold = self.config[
+            "insightface_distance_threshold" if self._face_app is not None
+            else "distance_threshold"
+        ]
+
+        if references is not None and len(references):
+            try:
+                distances = self.verify_frames_batch(frames, references)
+            except Exception as e:
+                print(f"Warning: Batched face comparison failed, comparing per frame: {e}")
+            else:
+                matches = np.flatnonzero(distances <= threshold)
+                if len(matches):
+                    i = int(matches[0])
+                    distance = float(distances[i])
+                    return i, True, max(0, 1 - distance) * 0.98, distance
+
+                i = int(np.argmin(distances))
+                distance = float(distances[i])
+                # No match found - lower confidence for non-match
+                return i, False, max(0, 1 - distance) * 0.5, distance
+
+        best = (0, False, 0.0, float('inf'))
+        if self._face_app is not None:
+            # DeepFace.verify may not be installed alongside InsightFace
+            return best
+        for i, frame in enumerate(frames):
+            verified, confidence, distance = self._compare_against_references(frame)
+            if verified:
+                return i, verified, confidence, distance
+            if distance < best[3]:
+                best = (i, verified, confidence, distance)
+        return best
+
+    def verify_frames_batch(
+        self, frames: List[np.ndarray], reference_embeddings: np.ndarray
+    ) -> np.ndarray:
+        """
+        Best cosine distance of each frame to a set of reference embeddings.
+
+        Faces from all frames are embedded once each (one InsightFace pass
+        per frame when enabled), stacked, then compared to every reference
+        in one call, in the references' precision: simsimd's SIMD cosine
+        kernels when installed, otherwise a NumPy matrix product.
+
+        Args:
+            frames: RGB images to check
+            reference_embeddings: (R, D) array of L2-normalized reference embeddings
+
+        Returns:
+            Array of length len(frames) with each frame's smallest distance
+            (inf for frames where no face could be embedded)
+        """
+        best = np.full(len(frames), np.inf)
+        if self._face_app is not None:
+            embedded, owners = [], []
+            for i, frame in enumerate(frames):
+                for face in self._analyze_faces(frame):
+                    embedded.append(face.normed_embedding)
+                    owners.append(i)
+            if not embedded:
+                return best
+            embeddings = np.stack(embedded).astype(np.float32)
+        else:
+            faces, owners = [], []
+            for i, frame in enumerate(frames):
+                for face in self._extract_face_crops(frame):
+                    faces.append(face)
+                    owners.append(i)
+            if not faces:
+                return best
+            embeddings = self._embed_faces(faces)
+
+        queries = _to_embedding_dtype(_l2_normalize(embeddings), reference_embeddings.dtype)
+        if SIMSIMD_AVAILABLE:
+            distances = np.asarray(
+                simsimd.cdist(queries, reference_embeddings, metric="cosine")
+            )
+            face_distances = distances.min(axis=1).astype(np.float32)
+        else:
+            if reference_embeddings.dtype == np.int8:
+                # int8 codes are no longer unit length (and would overflow
+                # in an int8 product), so NumPy compares them in float32
+                queries = _l2_normalize(queries.astype(np.float32))
+                reference_embeddings = _l2_normalize(reference_embeddings.astype(np.float32))
+            similarity = queries @ reference_embeddings.T
+            face_distances = 1.0 - similarity.max(axis=1).astype(np.float32)
+        np.minimum.at(best, np.asarray(owners), face_distances)
+        return best
+
+    def _get_reference_embeddings(self) -> Optional[np.ndarray]:
+        """
+        Embed the reference photos once and reuse them until they change.
+
+        Stored L2-normalized in the configured embedding_dtype (float16 by
+        default), halving their footprint; cosine similarity is then a
+        plain dot product. int8 quarters it (see _to_embedding_dtype).
+        """
+        if self._reference_embeddings is None:
+            faces, embedded = [], []
+            for ref_path in self.reference_image_paths:
+                try:
+                    image = np.array(Image.open(ref_path).convert("RGB"))
+                except Exception:
+                    continue
+                if self._face_app is not None:
+                    # Reference photos may include other people; keep the
+                    # largest face, which is the subject's
+                    detected = self._analyze_faces(image)
+                    if detected:
+                        embedded.append(max(detected, key=_face_area).normed_embedding)
+                else:
+                    faces.extend(self._extract_face_crops(image))
+            try:
+                if embedded:
+                    embeddings = np.stack(embedded).astype(np.float32)
+                else:
+                    embeddings = self._embed_faces(faces) if faces else np.empty((0, 0))
+                self._reference_embeddings = _to_embedding_dtype(
+                    _l2_normalize(embeddings), self.config["embedding_dtype"]
+                )
+            except Exception as e:
+                print(f"Warning: Could not embed reference photos: {e}")
+                return None
+        return self._reference_embeddings
+
+    def _extract_face_crops(self, image: np.ndarray) -> List[np.ndarray]:
+        """Detect and align faces in an RGB image (whole image if none found)."""
+        try:
+            detected = DeepFace.extract_faces(
+                img_path=image,
+                detector_backend=self.config["detector_backend"],
+                enforce_detection=False,  # Don't fail if no face detected
+                align=True,
+            )
+        except Exception:
+            return []
+        return [d["face"] for d in detected if d.get("face") is not None]
+
+    def _analyze_faces(self, image: np.ndarray) -> list:
+        """Detect and embed the faces in an RGB image with InsightFace."""
+        try:
+            # InsightFace takes BGR, OpenCV's channel order
+            return self._face_app.get(np.ascontiguousarray(image[:, :, ::-1]))
+        except Exception:
+            return []
+
+    def _embed_faces(self, faces: List[np.ndarray]) -> np.ndarray:
+        """
+        Embed already-detected face crops with DeepFace.represent.
+
+        Detection is skipped, but represent still applies the model's own
+        preprocessing (aspect-preserving resize and padding, channel order,
+        normalization), so the vectors match the ones DeepFace.verify
+        compares and its thresholds were tuned on.
+        """
+        embeddings = []
+        for face in faces:
+            # extract_faces returns RGB; represent expects BGR like cv2.imread
+            represented = DeepFace.represent(
+                img_path=np.ascontiguousarray(face[:, :, ::-1]),
+                model_name=self.config["model_name"],
+                detector_backend="skip",
+                enforce_detection=False,
+            )
+            embeddings.append(represented[0]["embedding"])
+        return np.asarray(embeddings, dtype=np.float32).reshape(len(faces), -1)
+
     def _compare_against_references(self, image: np.ndarray) -> Tuple[bool, float, float]:
         """
         Compare an image against all reference images.
@@ -361,7 +686,8 @@ class FaceRecognizer:
                 if distance < best_distance:
                     best_distance = distance
 
-                if result.get("verified", False):
+                # Same cutoff as the batched path, not DeepFace's built-in one
+                if distance <= self.config["distance_threshold"]:
                     # Calculate confidence from distance
                     confidence = max(0, 1 - distance) * 0.98
                     return True, confidence, distance
@@ -393,7 +719,7 @@ class FaceRecognizer:
                 response = requests.get(thumbnail_url, timeout=15)
                 response.raise_for_status()
                 image = Image.open(io.BytesIO(response.content)).convert("RGB")
-                image_np = np.array(image)
+                image_np = _downscale(np.array(image), self.config["max_frame_dimension"])
 
                 if self._detect_face_opencv(image_np):
                     face_detected = True
@@ -494,7 +820,7 @@ class FaceRecognizer:
                 f.write(image_data)
 
             # Reload reference images
-            self._load_reference_images()
+            self._reload_references()
             return True
 
         except Exception as e:
@@ -515,7 +841,7 @@ class FaceRecognizer:
             filepath = os.path.join(self.photos_dir, filename)
             if os.path.exists(filepath):
                 os.remove(filepath)
-                self._load_reference_images()
+                self._reload_references()
                 return True
             return False
 
@@ -541,6 +867,66 @@ class FaceRecognizer:
         }
 
 
+def _read_frame_at(video_path: str, frame_pos: int,
+                   max_dim: Optional[int] = None) -> Optional[np.ndarray]:
+    """Decode one frame of a video file or URL as RGB, or None if it can't be read."""
+    cap = cv2.VideoCapture(video_path)
+    try:
+        if not cap.isOpened():
+            return None
+        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_pos)
+        ret, frame = cap.read()
+        if not ret:
+            return None
+        # Downscale before the color conversion so it touches fewer pixels
+        frame = _downscale(frame, max_dim)
+        # Convert BGR to RGB
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+    finally:
+        cap.release()
+
+
+def _downscale(image: np.ndarray, max_dim: Optional[int]) -> np.ndarray:
+    """
+    Shrink an image so its longer side is at most max_dim pixels.
+
+    Face detectors and embedding models work on faces of a few hundred
+    pixels, so full-HD input only adds cost. Smaller images are returned
+    unchanged.
+    """
+    height, width = image.shape[:2]
+    if not max_dim or max(height, width) <= max_dim:
+        return image
+    scale = max_dim / max(height, width)
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+
+
+def _face_area(face) -> float:
+    """Area of an InsightFace detection's bounding box."""
+    x1, y1, x2, y2 = face.bbox[:4]
+    return float((x2 - x1) * (y2 - y1))
+
+
+def _l2_normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale each row to unit length so dot products are cosine similarities."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def _to_embedding_dtype(vectors: np.ndarray, dtype) -> np.ndarray:
+    """
+    Cast L2-normalized embeddings to the storage dtype.
+
+    For int8 each row is scaled so its largest component maps to 127.
+    Cosine distance ignores a row's scale, so thresholds stay the same.
+    """
+    if np.dtype(dtype) == np.int8:
+        peak = np.abs(vectors).max(axis=1, keepdims=True, initial=0.0)
+        return np.round(vectors * (127.0 / np.maximum(peak, 1e-12))).astype(np.int8)
+    return vectors.astype(dtype)
+
+
 # Dictionary of recognizer instances per preacher
 _recognizer_instances: dict = {}
 
@@ -157,18 +157,16 @@ class FacebookVideoAgent:
         if not channel_url:
             channel_url = f"https://www.facebook.com/{channel_id}/videos"
 
-        # Check if channel already exists
-        existing = self.db.get_discovered_channel_by_url(channel_url)
-
-        if not existing:
-            # Add new channel
-            self.db.add_discovered_channel(
-                channel_name=channel_name,
-                channel_url=channel_url,
-                platform=PLATFORM_FACEBOOK,
-                page_id=channel_id,
-                preacher_id=self.preacher_id
-            )
+        # The insert is skipped when the URL is already stored
+        added = self.db.add_discovered_channel(
+            channel_name=channel_name,
+            channel_url=channel_url,
+            platform=PLATFORM_FACEBOOK,
+            page_id=channel_id,
+            preacher_id=self.preacher_id
+        )
+
+        if added is not None:
             logger.info(f"Discovered new channel: {channel_name} ({channel_id})")
         else:
             # Increment video count for existing channel
@@ -500,7 +498,7 @@ class FacebookVideoAgent:
 
         # Check if face verification is required
         require_face = self.config.get("require_face_verification", True)
-        min_confidence = STORAGE_CONFIG.get("min_storage_confidence", 0.50)
+        min_confidence = STORAGE_CONFIG.min_storage_confidence
 
         if require_face:
             # Strict mode: require face verification for unknown content
@@ -23,6 +23,7 @@ from config import (
     PRIMARY_CHANNEL,
     MAX_RESULTS_PER_QUERY,
     FETCHER_CONFIG,
+    DATABASE_CONFIG,
     STORAGE_CONFIG,
     IDENTITY_MARKERS,
     FACEBOOK_PAGES,
@@ -112,9 +113,9 @@ class VideoFetcher:
 
         # yt-dlp options
         self._ydl_opts = {
-            "quiet": self.config["quiet"],
-            "no_warnings": self.config["no_warnings"],
-            "ignoreerrors": self.config["ignoreerrors"],
+            "quiet": self.config.quiet,
+            "no_warnings": self.config.no_warnings,
+            "ignoreerrors": self.config.ignoreerrors,
             "extract_flat": False,  # Get full metadata
             "skip_download": True,  # Don't download videos
         }
@@ -187,7 +188,7 @@ class VideoFetcher:
                 )
 
                 # Rate limiting
-                time.sleep(self.config["request_delay"])
+                time.sleep(self.config.request_delay)
 
             except Exception as e:
                 error_msg = f"Error searching '{query}': {str(e)}"
@@ -345,77 +346,84 @@ class VideoFetcher:
         }
 
         # Get storage thresholds
-        min_storage_confidence = STORAGE_CONFIG.get("min_storage_confidence", 0.50)
+        min_storage_confidence = STORAGE_CONFIG.min_storage_confidence
 
-        for video in videos:
-            try:
-                # Skip if already in database
-                if self.db.video_exists(video.video_id):
-                    results["skipped"] += 1
-                    continue
+        # Accepted videos are buffered and written in bulk transactions
+        pending: List[VideoMetadata] = []
 
-                # Log that we're applying classification (includes face recognition)
-                logger.debug(f"Classifying video: {video.video_id} - '{video.title[:50] if video.title else 'Unknown'}...'")
+        # Flush in finally so videos already classified are stored even if
+        # the loop is interrupted (e.g. Ctrl-C)
+        try:
+            for video in videos:
+                try:
+                    # Skip if already in database
+                    if self.db.video_exists(video.video_id):
+                        results["skipped"] += 1
+                        continue
 
-                # Classify the video (applies identity check, face verification, etc.)
-                video = self.classifier.classify(video)
+                    # Log that we're applying classification (includes face recognition)
+                    logger.debug(f"Classifying video: {video.video_id} - '{video.title[:50] if video.title else 'Unknown'}...'")
 
-                # Log face recognition result
-                if video.face_verified:
-                    logger.info(
-                        f"✓ Face verified for: {video.video_id} "
-                        f"(confidence: {video.confidence_score:.2f})"
-                    )
-                elif hasattr(video, 'identity_matched') and video.identity_matched:
-                    logger.debug(
-                        f"Identity matched (no face): {video.video_id} "
-                        f"(confidence: {video.confidence_score:.2f})"
-                    )
+                    # Classify the video (applies identity check, face verification, etc.)
+                    video = self.classifier.classify(video)
 
-                # --- STRICTER MUSIC FILTER ---
-                # Exclude music with confidence > 0.50 (lowered from 0.70)
-                if video.content_type == ContentType.MUSIC and video.confidence_score > 0.50:
-                    results["music_excluded"] += 1
-                    logger.debug(f"Music excluded: {video.video_id} (confidence: {video.confidence_score:.2f})")
-                    continue
-
-                # --- LOW CONFIDENCE FILTER ---
-                # Skip UNKNOWN videos with very low confidence
-                if video.content_type == ContentType.UNKNOWN:
-                    if video.confidence_score < min_storage_confidence:
-                        results["low_confidence_excluded"] += 1
+                    # Log face recognition result
+                    if video.face_verified:
+                        logger.info(
+                            f"✓ Face verified for: {video.video_id} "
+                            f"(confidence: {video.confidence_score:.2f})"
+                        )
+                    elif hasattr(video, 'identity_matched') and video.identity_matched:
                         logger.debug(
-                            f"Low confidence excluded: {video.video_id} "
-                            f"(type: {video.content_type.value}, confidence: {video.confidence_score:.2f})"
+                            f"Identity matched (no face): {video.video_id} "
+                            f"(confidence: {video.confidence_score:.2f})"
                         )
+
+                    # --- STRICTER MUSIC FILTER ---
+                    # Exclude music with confidence > 0.50 (lowered from 0.70)
+                    if video.content_type == ContentType.MUSIC and video.confidence_score > 0.50:
+                        results["music_excluded"] += 1
+                        logger.debug(f"Music excluded: {video.video_id} (confidence: {video.confidence_score:.2f})")
                         continue
 
-                # --- UNKNOWN CHANNEL WITHOUT IDENTITY FILTER ---
-                # Already handled in classifier, but double-check here
-                if hasattr(video, 'channel_trust_level') and video.channel_trust_level == 0:
-                    if hasattr(video, 'identity_matched') and not video.identity_matched:
-                        if not video.face_verified:
-                            results["unknown_channel_rejected"] += 1
+                    # --- LOW CONFIDENCE FILTER ---
+                    # Skip UNKNOWN videos with very low confidence
+                    if video.content_type == ContentType.UNKNOWN:
+                        if video.confidence_score < min_storage_confidence:
+                            results["low_confidence_excluded"] += 1
                             logger.debug(
-                                f"Unknown channel rejected: {video.video_id} "
-                                f"(channel: {video.channel_name})"
+                                f"Low confidence excluded: {video.video_id} "
+                                f"(type: {video.content_type.value}, confidence: {video.confidence_score:.2f})"
                             )
                             continue
 
-                # Store in database
-                if self.db.insert_video(video):
-                    results["added"] += 1
+                    # --- UNKNOWN CHANNEL WITHOUT IDENTITY FILTER ---
+                    # Already handled in classifier, but double-check here
+                    if hasattr(video, 'channel_trust_level') and video.channel_trust_level == 0:
+                        if hasattr(video, 'identity_matched') and not video.identity_matched:
+                            if not video.face_verified:
+                                results["unknown_channel_rejected"] += 1
+                                logger.debug(
+                                    f"Unknown channel rejected: {video.video_id} "
+                                    f"(channel: {video.channel_name})"
+                                )
+                                continue
+
+                    # Queue for storage
+                    pending.append(video)
                     logger.debug(
-                        f"Added: {video.video_id} "
+                        f"Queued: {video.video_id} "
                         f"(type: {video.content_type.value}, confidence: {video.confidence_score:.2f})"
                     )
-                else:
-                    results["skipped"] += 1
+                    if len(pending) >= DATABASE_CONFIG.batch_size:
+                        self._flush_videos(pending, results)
 
-            except Exception as e:
-                error_msg = f"Error processing video {video.video_id}: {e}"
-                logger.error(error_msg)
-                results["errors"].append(error_msg)
+                except Exception as e:
+                    error_msg = f"Error processing video {video.video_id}: {e}"
+                    logger.error(error_msg)
+                    results["errors"].append(error_msg)
+        finally:
+            self._flush_videos(pending, results)
 
         # Log the fetch
         log = FetchLog(
@@ -431,6 +439,38 @@ class VideoFetcher:
 
         return results
 
+    def _flush_videos(self, pending: List[VideoMetadata], results: Dict) -> None:
+        """
+        Write buffered videos in one batch and update the result counters.
+
+        If the batch fails, the videos are retried one at a time so a single
+        bad row only costs that video.
+        """
+        if not pending:
+            return
+
+        try:
+            added, skipped = self.db.insert_videos_batch(pending)
+            results["added"] += added
+            results["skipped"] += skipped
+        except Exception as batch_error:
+            logger.warning(
+                f"Batch insert of {len(pending)} videos failed ({batch_error}), "
+                f"retrying one by one"
+            )
+            for video in pending:
+                try:
+                    if self.db.insert_video(video):
+                        results["added"] += 1
+                    else:
+                        results["skipped"] += 1
+                except Exception as e:
+                    error_msg = f"Error processing video {video.video_id}: {e}"
+                    logger.error(error_msg)
+                    results["errors"].append(error_msg)
+
+        pending.clear()
+
     def _format_date(self, date_str: Optional[str]) -> Optional[str]:
         """Format YYYYMMDD to YYYY-MM-DD."""
         if date_str and len(date_str) == 8:
@@ -1065,7 +1105,7 @@ class VideoFetcher:
                             continue
 
                         if video.content_type == ContentType.UNKNOWN:
-                            if video.confidence_score < STORAGE_CONFIG.get("min_storage_confidence", 0.50):
+                            if video.confidence_score < STORAGE_CONFIG.min_storage_confidence:
                                 summary.low_confidence_excluded += 1
                                 continue
 
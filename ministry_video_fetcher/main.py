@@ -145,7 +145,7 @@ def cmd_review(args):
 def cmd_export(args):
     """Export to CSV."""
     db = Database()
-    filepath = args.output or EXPORT_CONFIG["csv_filename"]
+    filepath = args.output or EXPORT_CONFIG.csv_filename
 
     count = db.export_to_csv(filepath)
     print(f"\nExported {count} videos to {filepath}")
@@ -260,7 +260,7 @@ def cmd_cleanup(args):
 
     if args.review:
         # Show videos that would be affected by cleanup
-        min_confidence = args.min_confidence or STORAGE_CONFIG.get("min_storage_confidence", 0.50)
+        min_confidence = args.min_confidence or STORAGE_CONFIG.min_storage_confidence
 
         print(f"\nAnalyzing videos with confidence < {min_confidence}...")
         print("-" * 60)
@@ -301,7 +301,7 @@ def cmd_cleanup(args):
 
     elif args.purge:
         # Delete low confidence videos
-        min_confidence = args.min_confidence or STORAGE_CONFIG.get("min_storage_confidence", 0.50)
+        min_confidence = args.min_confidence or STORAGE_CONFIG.min_storage_confidence
 
         print(f"\nPurging videos with confidence < {min_confidence}...")
 
@@ -347,6 +347,17 @@ def cmd_cleanup(args):
         classifier = ContentClassifier()
         reclassified = 0
         changed = 0
+        pending = []
+
+        def flush_pending():
+            # One transaction (and one commit) per group of updates; the
+            # write lock is not held while classifying
+            if not pending:
+                return
+            with db.transaction():
+                for update in pending:
+                    db.update_video_classification(**update)
+            pending.clear()
 
         for _, row in df.iterrows():
             from models import VideoMetadata
@@ -359,28 +370,39 @@ def cmd_cleanup(args):
 
             # Update if changed
             if video.content_type != old_type or abs(video.confidence_score - old_conf) > 0.1:
-                db.update_video_classification(
+                pending.append(dict(
                     video_id=video.video_id,
                     content_type=video.content_type,
                     confidence_score=video.confidence_score,
                     needs_review=video.needs_review,
                     identity_matched=getattr(video, 'identity_matched', False),
                     channel_trust_level=getattr(video, 'channel_trust_level', 0)
-                )
+                ))
                 changed += 1
 
             reclassified += 1
             if reclassified % 50 == 0:
+                flush_pending()
                 print(f"  Processed {reclassified}/{len(df)} videos...")
 
+        flush_pending()
+
         print(f"\n[OK] Re-classified {reclassified} videos")
         print(f"     {changed} videos had classification changes")
 
+    elif args.vacuum:
+        print("\nCompacting database...")
+        if db.vacuum():
+            print("[OK] Database compacted")
+        else:
+            print("[OK] Database compacted; search index was out of step and has been rebuilt")
+
     else:
         print("\nUsage:")
         print("  python main.py cleanup --review              Review low-confidence videos")
         print("  python main.py cleanup --purge               Delete low-confidence videos")
         print("  python main.py cleanup --reclassify          Re-run classification on all videos")
+        print("  python main.py cleanup --vacuum              Compact the database file")
         print("\nOptions:")
         print("  --min-confidence 0.50   Set confidence threshold")
         print("  --force                 Skip confirmation prompts")
@@ -952,6 +974,11 @@ Facebook Agent (Automated Discovery):
         action="store_true",
         help="Re-run classification on all videos with updated rules"
     )
+    cleanup_parser.add_argument(
+        "--vacuum",
+        action="store_true",
+        help="Compact the database file and re-check the search index"
+    )
     cleanup_parser.add_argument(
         "--min-confidence",
         type=float,
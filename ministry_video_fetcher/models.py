@@ -310,33 +310,42 @@ class VideoMetadata:
             return f"{self.upload_date[:4]}-{self.upload_date[4:6]}-{self.upload_date[6:]}"
         return self.upload_date
 
+    @staticmethod
+    def columns() -> tuple:
+        """Database column names, in the order used by to_tuple()."""
+        return _VIDEO_COLUMNS
+
+    def to_tuple(self) -> tuple:
+        """Convert to a row tuple for database storage (see columns())."""
+        return (
+            self.video_id,
+            self.title,
+            self.description,
+            self.duration,
+            self.upload_date,
+            self.view_count,
+            self.like_count,
+            self.thumbnail_url,
+            self.channel_name,
+            self.channel_id,
+            self.channel_url,
+            self.video_url,
+            self.platform,
+            self.content_type.value,
+            self.confidence_score,
+            self.needs_review,
+            self.language_detected.value,
+            self.fetched_at.isoformat() if self.fetched_at else None,
+            self.search_query_used,
+            self.face_verified,
+            self.identity_matched,
+            self.channel_trust_level,
+            self.preacher_id,
+        )
+
     def to_dict(self) -> dict:
         """Convert to dictionary for database storage."""
-        return {
-            "video_id": self.video_id,
-            "title": self.title,
-            "description": self.description,
-            "duration": self.duration,
-            "upload_date": self.upload_date,
-            "view_count": self.view_count,
-            "like_count": self.like_count,
-            "thumbnail_url": self.thumbnail_url,
-            "channel_name": self.channel_name,
-            "channel_id": self.channel_id,
-            "channel_url": self.channel_url,
-            "video_url": self.video_url,
-            "platform": self.platform,
-            "content_type": self.content_type.value,
-            "confidence_score": self.confidence_score,
-            "needs_review": self.needs_review,
-            "language_detected": self.language_detected.value,
-            "fetched_at": self.fetched_at.isoformat() if self.fetched_at else None,
-            "search_query_used": self.search_query_used,
-            "face_verified": self.face_verified,
-            "identity_matched": self.identity_matched,
-            "channel_trust_level": self.channel_trust_level,
-            "preacher_id": self.preacher_id,
-        }
+        return dict(zip(_VIDEO_COLUMNS, self.to_tuple()))
 
     @classmethod
     def from_dict(cls, data: dict) -> "VideoMetadata":
@@ -453,6 +462,34 @@ class VideoMetadata:
         )
 
 
+# Column order shared by VideoMetadata.to_tuple() and the database layer
+_VIDEO_COLUMNS = (
+    "video_id",
+    "title",
+    "description",
+    "duration",
+    "upload_date",
+    "view_count",
+    "like_count",
+    "thumbnail_url",
+    "channel_name",
+    "channel_id",
+    "channel_url",
+    "video_url",
+    "platform",
+    "content_type",
+    "confidence_score",
+    "needs_review",
+    "language_detected",
+    "fetched_at",
+    "search_query_used",
+    "face_verified",
+    "identity_matched",
+    "channel_trust_level",
+    "preacher_id",
+)
+
+
 @dataclass
 class FetchLog:
     """